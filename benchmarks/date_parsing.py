@@ -0,0 +1,67 @@
+"""Benchmark date parsing.
+
+Collects every date and timestamp string in the test fixtures and compares the `strptime` based
+parsing the schemas used before with `parse_date` and `parse_datetime`.
+
+Run with `python -m benchmarks.date_parsing`.
+"""
+
+import json
+import re
+import sqlite3
+import timeit
+from collections import defaultdict
+from datetime import date, datetime
+
+from esak.schemas.dates import parse_date, parse_datetime
+
+FIXTURES = "tests/testing_mock.sqlite"
+ROUNDS = 20
+FORMATS = {"date": "%Y-%m-%d", "space": "%Y-%m-%d %H:%M:%S", "offset": "%Y-%m-%dT%H:%M:%S%z"}
+
+
+def load_values() -> dict[str, list[str]]:
+    """Group the date strings in the fixtures by format."""
+    con = sqlite3.connect(FIXTURES)
+    values = defaultdict(list)
+    for (blob,) in con.execute("SELECT json FROM responses"):
+        for value in re.findall(r'"(?:modified|date|start|end)": "([^"]+)"', blob):
+            if value[0] == "-":
+                continue
+            kind = "offset" if "T" in value else "space" if " " in value else "date"
+            values[kind].append(json.loads(f'"{value}"'))
+    con.close()
+    return values
+
+
+def strptime_date(value: str) -> date:
+    """Parse a date the way the schemas used to, falling back on exceptions."""
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        try:
+            return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").date()
+        except ValueError:
+            return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").date()
+
+
+def main() -> None:
+    """Run the benchmark and print the microseconds per value as JSON."""
+    report = {}
+    for kind, values in sorted(load_values().items()):
+        fmt = FORMATS[kind]
+        timings = {
+            "strptime": lambda fmt=fmt, values=values: [datetime.strptime(x, fmt) for x in values],
+            "strptime_fallback": lambda values=values: [strptime_date(x) for x in values],
+            "parse_date": lambda values=values: [parse_date(x) for x in values],
+            "parse_datetime": lambda values=values: [parse_datetime(x) for x in values],
+        }
+        report[kind] = {"values": len(values)}
+        for name, func in timings.items():
+            seconds = timeit.timeit(func, number=ROUNDS)
+            report[kind][f"{name}_us"] = round(seconds / ROUNDS / len(values) * 1e6, 3)
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark default vs frozen models.
+
+Validates 10k `Comic` records replayed from the test fixtures and reports the time taken and
+the memory retained by the resulting models. Frozen models leave out the validators which only
+matter on assignment, so they are validated faster while retaining about the same memory.
+
+Run with `python -m benchmarks.frozen_models`.
+"""
+
+import gc
+import json
+import re
+import sqlite3
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from esak.schemas.comic import Comic
+from esak.schemas.frozen import freeze
+
+FIXTURES = "tests/testing_mock.sqlite"
+RECORDS = 10_000
+REPEAT = 5
+
+
+def load_comics(count: int = RECORDS) -> list[dict[str, Any]]:
+    """Load comic records from the test fixtures, repeated up to `count` records."""
+    con = sqlite3.connect(FIXTURES)
+    results = []
+    for key, blob in con.execute("SELECT key, json FROM responses"):
+        if re.search(r"/public/comics(/\d+)?(\?|$)", key):
+            results.extend(json.loads(blob)["results"])
+    con.close()
+    return [results[i % len(results)] for i in range(count)]
+
+
+def measure(model: type[Comic], records: list[dict[str, Any]]) -> dict[str, float]:
+    """Time validation of `records`, best of `REPEAT` runs, and measure the retained memory."""
+    adapter = TypeAdapter(list[model])
+    adapter.validate_python(records[:10])
+    timings = []
+    for _ in range(REPEAT):
+        # As timeit does, the garbage collector is paused so its passes don't skew the timings.
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        adapter.validate_python(records)
+        timings.append(time.perf_counter() - start)
+        gc.enable()
+    elapsed = min(timings)
+
+    gc.collect()
+    tracemalloc.start()
+    comics = adapter.validate_python(records)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del comics
+    return {"seconds": round(elapsed, 4), "retained_mib": round(retained / 2**20, 2)}
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    records = load_comics()
+    report = {
+        "records": len(records),
+        "default": measure(Comic, records),
+        "frozen": measure(freeze(Comic), records),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Benchmark the request, cache and validation hot paths.
+
+Measures cold calls, answered by a local stand-in for the Marvel API, and warm calls, answered
+by the cache, of every entity endpoint; validation throughput of every model; cache read and
+write latency at several database sizes; and pagination throughput against the stand-in.
+
+The report is JSON, tagged with the esak and Python versions, so runs of different versions
+can be compared.
+
+Run with `python -m benchmarks.hot_paths [--quick] [--output FILE]`.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from esak import __version__
+from esak.export import iter_pages
+from esak.server import StandInServer, load_fixtures
+from esak.session import RESOURCE_MODELS, Session
+from esak.sqlite_cache import SqliteCache
+
+FIXTURES = "tests/testing_mock.sqlite"
+# An entity recorded in the test fixtures per Session method.
+ENTITIES = {
+    "character": 1009220,
+    "comic": 16926,
+    "creator": 11463,
+    "event": 336,
+    "series": 466,
+    "story": 35505,
+}
+CACHE_SIZES = (100, 1_000, 10_000)
+
+
+def timings(func: Callable[[], Any], repeat: int) -> dict[str, float]:
+    """Call `func` `repeat` times and summarize the latency in milliseconds."""
+    values = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        values.append(time.perf_counter() - start)
+    values.sort()
+    return {
+        "median_ms": round(statistics.median(values) * 1000, 4),
+        "p95_ms": round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 4),
+        "max_ms": round(values[-1] * 1000, 4),
+    }
+
+
+def measure_calls(api_url: str, repeat: int) -> dict[str, Any]:
+    """Time each entity endpoint without a cache, then answered by a warmed cache."""
+    cold = Session("public", "private", cache=None)
+    warm = Session("public", "private", cache=SqliteCache(":memory:"))
+    cold.api_url = warm.api_url = api_url
+    report = {}
+    for method, _id in ENTITIES.items():
+        getattr(warm, method)(_id)
+        report[method] = {
+            "cold": timings(lambda m=method, i=_id: getattr(cold, m)(i), repeat),
+            "warm": timings(lambda m=method, i=_id: getattr(warm, m)(i), repeat),
+        }
+    return report
+
+
+def measure_validation(count: int) -> dict[str, Any]:
+    """Validate `count` fixture records of each resource and report the throughput."""
+    _, records = load_fixtures(FIXTURES)
+    report = {}
+    for resource, model in RESOURCE_MODELS.items():
+        sample = records[resource]
+        batch = [sample[i % len(sample)] for i in range(count)]
+        adapter = TypeAdapter(list[model])
+        adapter.validate_python(batch[:10])
+        start = time.perf_counter()
+        adapter.validate_python(batch)
+        elapsed = time.perf_counter() - start
+        report[resource] = {
+            "records": count,
+            "seconds": round(elapsed, 4),
+            "records_per_second": round(count / elapsed),
+        }
+    return report
+
+
+def measure_cache(sizes: tuple[int, ...], repeat: int) -> dict[str, Any]:
+    """Time reads of random keys and writes of new keys in caches holding `sizes` entries."""
+    _, records = load_fixtures(FIXTURES)
+    page = {"offset": 0, "limit": 1, "total": 1, "count": 1, "results": records["comics"][:1]}
+    report = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            cache = SqliteCache(str(Path(tmp) / f"cache-{size}.db"))
+            with cache.lock, cache.con:
+                cache.con.executemany(
+                    "INSERT INTO responses(key, json, expire) VALUES (?, ?, NULL)",
+                    ((f"key-{x}", json.dumps(page)) for x in range(size)),
+                )
+            keys = iter(range(size, size + repeat))
+            report[str(size)] = {
+                "size_bytes": cache.stats()["size"],
+                "get": timings(
+                    lambda c=cache, s=size: c.get(f"key-{random.randrange(s)}"),  # noqa: S311
+                    repeat,
+                ),
+                "store": timings(lambda c=cache, k=keys: c.store(f"key-{next(k)}", page), repeat),
+            }
+            cache.con.close()
+    return report
+
+
+def measure_pagination(api_url: str, page_size: int) -> dict[str, Any]:
+    """Request every page of a synthetic endpoint, with and without validating the results."""
+    session = Session("public", "private", cache=None)
+    session.api_url = api_url
+    model = RESOURCE_MODELS["comics"]
+    adapter = TypeAdapter(list[model])
+    report = {}
+    for name, handle in (("raw", len), ("validated", adapter.validate_python)):
+        start = time.perf_counter()
+        pages = count = 0
+        for results in iter_pages(session, ["comics"], page_size=page_size):
+            handle(results)
+            pages += 1
+            count += len(results)
+        elapsed = time.perf_counter() - start
+        report[name] = {
+            "pages": pages,
+            "results": count,
+            "seconds": round(elapsed, 4),
+            "results_per_second": round(count / elapsed),
+        }
+    return report
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the benchmarks and print the results as JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.hot_paths")
+    parser.add_argument("--quick", action="store_true", help="run fewer and smaller iterations")
+    parser.add_argument("--output", type=Path, help="also write the report to a file")
+    args = parser.parse_args(argv)
+    repeat, records, total = (20, 1_000, 500) if args.quick else (200, 10_000, 5_000)
+    sizes = CACHE_SIZES[:-1] if args.quick else CACHE_SIZES
+
+    with StandInServer(FIXTURES, total=total) as server:
+        api_url = server.api_url
+        report = {
+            "esak": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "calls": measure_calls(api_url, repeat),
+            "validation": measure_validation(records),
+            "cache": measure_cache(sizes, repeat),
+            "pagination": measure_pagination(api_url, page_size=100),
+        }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(f"{output}\n", encoding="utf-8")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Benchmark the memory retained by comics with and without interning.
+
+Validates 10k `Comic` records replayed from the test fixtures and reports the memory retained
+by the resulting models.
+
+Run with `python -m benchmarks.interning`.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from benchmarks.frozen_models import load_comics
+from esak.schemas.comic import Comic
+from esak.schemas.frozen import freeze
+from esak.schemas.interning import InternPool, interned
+
+
+def measure(model: type[Comic], records: list[dict[str, Any]], pool: InternPool | None) -> dict:
+    """Validate `records` and measure the time taken and memory retained."""
+    adapter = TypeAdapter(list[model])
+    context = {"intern_pool": pool} if pool is not None else None
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    comics = adapter.validate_python(records, context=context)
+    elapsed = time.perf_counter() - start
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del comics
+    return {"seconds": round(elapsed, 4), "retained_mib": round(retained / 2**20, 2)}
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    records = load_comics()
+    report = {
+        "records": len(records),
+        "default": measure(Comic, records, None),
+        "interned": measure(interned(Comic), records, InternPool()),
+        "frozen_interned": measure(interned(freeze(Comic)), records, InternPool()),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
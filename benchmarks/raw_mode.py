@@ -0,0 +1,60 @@
+"""Benchmark raw mode vs model mode.
+
+Requests a full 100 item `comics_list` page through a warm cache, both as models and as raw
+results, and reports the mean time per page.
+
+Run with `python -m benchmarks.raw_mode`.
+"""
+
+import json
+import sqlite3
+import time
+
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+FIXTURES = "tests/testing_mock.sqlite"
+URL = "http://gateway.marvel.com:80/v1/public/comics?limit=100"
+ROUNDS = 20
+
+
+def build_cache() -> SqliteCache:
+    """Create an in-memory cache holding a 100 item comics page built from the fixtures."""
+    con = sqlite3.connect(FIXTURES)
+    (blob,) = con.execute(
+        "SELECT json FROM responses WHERE key = ?",
+        ("http://gateway.marvel.com:80/v1/public/comics",),
+    ).fetchone()
+    con.close()
+    page = json.loads(blob)
+    results = page["results"]
+    page["results"] = [results[i % len(results)] for i in range(100)]
+    page["limit"] = page["count"] = 100
+    cache = SqliteCache(":memory:")
+    cache.store(URL, page)
+    return cache
+
+
+def measure(session: Session) -> float:
+    """Return the mean seconds taken to request the page."""
+    session.comics_list({"limit": 100})
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        session.comics_list({"limit": 100})
+    return round((time.perf_counter() - start) / ROUNDS, 5)
+
+
+def main() -> None:
+    """Run the benchmark and print the results as JSON."""
+    cache = build_cache()
+    report = {
+        "page_size": 100,
+        "model_seconds": measure(Session("pub", "priv", cache=cache)),
+        "frozen_seconds": measure(Session("pub", "priv", cache=cache, frozen=True)),
+        "raw_seconds": measure(Session("pub", "priv", cache=cache, raw=True)),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
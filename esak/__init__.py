@@ -3,14 +3,30 @@
 __all__ = ["__version__", "api"]
 __version__ = "2.0.0"
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from esak.exceptions import AuthenticationError
-from esak.session import Session
-from esak.sqlite_cache import SqliteCache
+
+if TYPE_CHECKING:
+    from esak.session import Session
+    from esak.sqlite_cache import SqliteCache
+
+_LAZY_ATTRIBUTES = {"Session": "esak.session", "SqliteCache": "esak.sqlite_cache"}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import `Session` and `SqliteCache` on first access to keep `import esak` fast."""
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def api(
-    public_key: str | None = None, private_key: str | None = None, cache: SqliteCache | None = None
-) -> Session:
+    public_key: str | None = None,
+    private_key: str | None = None,
+    cache: "SqliteCache | None" = None,
+) -> "Session":
     """Entry function the sets login credentials for Marvel's API.
 
     Args:
@@ -30,4 +46,6 @@ def api(
     if private_key is None:
         raise AuthenticationError("Missing private_key.")
 
+    from esak.session import Session  # noqa: PLC0415
+
     return Session(public_key, private_key, cache=cache)
@@ -0,0 +1,5 @@
+"""Run the esak command line tool with `python -m esak`."""
+
+from esak.cli import main
+
+raise SystemExit(main())
@@ -0,0 +1,243 @@
+"""CLI module.
+
+This module provides the following functions:
+
+- main
+"""
+
+__all__ = ["main"]
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from esak import __version__
+from esak.exceptions import ApiError
+from esak.server import StandInServer
+from esak.session import RESOURCE_MODELS, Session
+from esak.sqlite_cache import SqliteCache
+
+PAGE_SIZE = 100
+
+
+def _endpoint(value: str) -> list[str | int]:
+    """Split an endpoint such as `series/466/comics` into its parts."""
+    parts: list[str | int] = [int(x) if x.isdigit() else x for x in value.strip("/").split("/")]
+    if not parts or parts[0] not in RESOURCE_MODELS:
+        raise argparse.ArgumentTypeError(f"unknown endpoint: {value!r}")
+    return parts
+
+
+def _param(value: str) -> tuple[str, str]:
+    key, sep, param = value.partition("=")
+    if not sep:
+        raise argparse.ArgumentTypeError(f"expected key=value: {value!r}")
+    return key, param
+
+
+def _progress(args: argparse.Namespace, message: str) -> None:
+    if not args.quiet:
+        print(message, file=sys.stderr, flush=True)
+
+
+def _session(args: argparse.Namespace) -> Session:
+    cache = None if args.no_cache else SqliteCache(args.cache)
+    return Session(args.public_key, args.private_key, timeout=args.timeout, cache=cache)
+
+
+def _get(args: argparse.Namespace) -> list[dict[str, Any]]:
+    session = _session(args)
+    fields = args.fields.split(",") if args.fields else None
+    results = session.stream(args.endpoint, dict(args.param), fields)
+    return [x.model_dump(mode="json") for x in results]
+
+
+def _crawl(args: argparse.Namespace) -> dict[str, Any]:
+    session = _session(args)
+    start = time.perf_counter()
+    params = dict(args.param)
+
+    def fetch(offset: int) -> int:
+        page_params = {**params, "offset": offset, "limit": args.page_size}
+        return len(session.fetch_page(args.endpoint, page_params)["results"])
+
+    first = session.fetch_page(args.endpoint, {**params, "offset": 0, "limit": args.page_size})
+    total = first.get("total", len(first["results"]))
+    offsets = range(args.page_size, total, args.page_size)[: max(args.max_pages - 1, 0)]
+    count, pages = len(first["results"]), 1
+    _progress(args, f"page 1/{len(offsets) + 1}: {count}/{total} results")
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for future in as_completed(executor.submit(fetch, x) for x in offsets):
+            count += future.result()
+            pages += 1
+            _progress(args, f"page {pages}/{len(offsets) + 1}: {count}/{total} results")
+    return {
+        "endpoint": "/".join(str(x) for x in args.endpoint),
+        "pages": pages,
+        "results": count,
+        "total": total,
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+
+def _cache(args: argparse.Namespace) -> dict[str, Any]:
+    cache = SqliteCache(args.cache)
+    if args.action == "stats":
+        return cache.stats()
+    if args.action == "vacuum":
+        before = cache.stats()["size"]
+        removed = cache.vacuum()
+        return {"removed": removed, "size_before": before, "size": cache.stats()["size"]}
+    if args.action == "export":
+        return {"exported": cache.export_entries(args.file), "file": args.file}
+    return {"imported": cache.import_entries(args.file), "file": args.file}
+
+
+def _bench(args: argparse.Namespace) -> dict[str, Any]:
+    session = _session(args)
+    params = dict(args.param)
+    timings: dict[str, list[float]] = {"network": [], "cache": []}
+    if session.cache is not None:
+        session.fetch_page(args.endpoint, dict(params))
+    for run in range(args.repeat):
+        start = time.perf_counter()
+        session.fetch_page(args.endpoint, dict(params), use_cache=False)
+        timings["network"].append(time.perf_counter() - start)
+        if session.cache is not None:
+            start = time.perf_counter()
+            session.fetch_page(args.endpoint, dict(params))
+            timings["cache"].append(time.perf_counter() - start)
+        _progress(args, f"run {run + 1}/{args.repeat}")
+    return {
+        "endpoint": "/".join(str(x) for x in args.endpoint),
+        "runs": args.repeat,
+        **{name: _summary(values) for name, values in timings.items() if values},
+    }
+
+
+def _serve(args: argparse.Namespace) -> dict[str, Any]:
+    fixtures = args.cache if not args.no_cache and Path(args.cache).exists() else None
+    server = StandInServer(
+        fixtures,
+        host=args.host,
+        port=args.port,
+        total=args.total,
+        latency=args.latency,
+        jitter=args.jitter,
+        quota=args.quota,
+        fault_rate=args.fault_rate,
+        seed=args.seed,
+    )
+    _progress(args, f"serving {server.api_url.format('')} from {fixtures or 'no fixtures'}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return {"requests": server.requests.total()}
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "min_ms": round(ordered[0] * 1000, 3),
+        "median_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3),
+    }
+
+
+def _print(value: Any, as_json: bool) -> None:  # noqa: ANN401
+    if as_json:
+        print(json.dumps(value, indent=2))
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            print(f"{key}: {json.dumps(item) if isinstance(item, dict) else item}")
+    else:
+        for item in value:
+            name = item.get("title") or item.get("name") or item.get("full_name") or ""
+            print(f"{item.get('id', '')}\t{name}".rstrip())
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="esak", description="Query and maintain Marvel data.")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    parser.add_argument("--public-key", default=os.getenv("PUBLIC_KEY", ""))
+    parser.add_argument("--private-key", default=os.getenv("PRIVATE_KEY", ""))
+    parser.add_argument("--cache", default="esak_cache.db", help="cache database to use")
+    parser.add_argument("--no-cache", action="store_true", help="don't use a cache database")
+    parser.add_argument("--timeout", type=int, default=30, help="request timeout in seconds")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    parser.add_argument("-q", "--quiet", action="store_true", help="don't report progress")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    endpoint = argparse.ArgumentParser(add_help=False)
+    endpoint.add_argument("endpoint", type=_endpoint, help="e.g. comics/16926 or series/466/comics")
+    endpoint.add_argument(
+        "-p", "--param", type=_param, action="append", default=[], help="key=value parameter"
+    )
+
+    get = commands.add_parser("get", parents=[endpoint], help="request an endpoint")
+    get.add_argument("--fields", help="comma separated attributes to include")
+    get.set_defaults(handler=_get)
+
+    crawl = commands.add_parser(
+        "crawl", parents=[endpoint], help="request every page of an endpoint into the cache"
+    )
+    crawl.add_argument("--page-size", type=int, default=PAGE_SIZE)
+    crawl.add_argument("--workers", type=int, default=4, help="concurrent requests")
+    crawl.add_argument("--max-pages", type=int, default=sys.maxsize)
+    crawl.set_defaults(handler=_crawl)
+
+    cache = commands.add_parser("cache", help="maintain the cache database")
+    actions = cache.add_subparsers(dest="action", required=True)
+    actions.add_parser("stats", help="count the cached entries")
+    actions.add_parser("vacuum", help="remove expired and duplicate entries, then compact")
+    for action in ("export", "import"):
+        actions.add_parser(action, help=f"{action} entries as NDJSON").add_argument("file")
+    cache.set_defaults(handler=_cache)
+
+    bench = commands.add_parser("bench", parents=[endpoint], help="measure request latency")
+    bench.add_argument("--repeat", type=int, default=5)
+    bench.set_defaults(handler=_bench)
+
+    serve = commands.add_parser(
+        "serve", help="serve a local stand-in for the Marvel API from the cache database"
+    )
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.add_argument("--total", type=int, default=1000, help="synthetic results per list")
+    serve.add_argument("--latency", type=float, default=0.0, help="seconds per response")
+    serve.add_argument("--jitter", type=float, default=0.0, help="random seconds of latency")
+    serve.add_argument("--quota", type=int, help="requests allowed per day")
+    serve.add_argument("--fault-rate", type=float, default=0.0, help="share of failed requests")
+    serve.add_argument("--seed", type=int, help="seed of the random latency and faults")
+    serve.set_defaults(handler=_serve)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the `esak` command line tool.
+
+    Args:
+        argv: The arguments, defaults to the arguments of the process.
+
+    Returns:
+        The exit code.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        _print(args.handler(args), args.json)
+    except (ApiError, ValueError, requests.RequestException) as err:
+        print(f"esak: error: {err}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,254 @@
+"""Crawl module.
+
+This module provides the following classes:
+
+- Crawler
+- CrawlState
+- Node
+"""
+
+__all__ = ["CrawlState", "Crawler", "Node"]
+
+import re
+import sqlite3
+import threading
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Any
+
+from esak.exceptions import ApiError
+from esak.session import RESOURCE_MODELS, Session
+from esak.sync import Store
+
+PENDING, FETCHED, MISSING = 0, 1, 2
+
+_RESOURCE_URI = re.compile(r"/v1/public/(\w+)/(\d+)$")
+
+
+@dataclass(frozen=True)
+class Node:
+    """An entity of the graph.
+
+    Attributes:
+        resource: The resource name, e.g. `"comics"`.
+        id: The id of the entity.
+        depth: The number of references between a seed and the entity.
+    """
+
+    resource: str
+    id: int
+    depth: int = 0
+
+
+class CrawlState:
+    """The CrawlState object to keep the visited nodes and the frontier in a SQLite database.
+
+    Every node reached by a crawl is kept, pending until it is fetched, so a node is only
+    queued once and an interrupted crawl resumes with the pending nodes.
+
+    Args:
+        db_name: Path and database name to use.
+    """
+
+    def __init__(self, db_name: str = "esak_crawl.db") -> None:
+        self.con = sqlite3.connect(db_name, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.con.execute(
+            "CREATE TABLE IF NOT EXISTS nodes (resource TEXT, id INTEGER, depth INTEGER, "
+            "state INTEGER, PRIMARY KEY (resource, id))"
+        )
+        self.con.execute("CREATE INDEX IF NOT EXISTS frontier ON nodes (state, depth)")
+
+    def add(self, nodes: Iterable[Node]) -> int:
+        """Queue nodes which were never reached.
+
+        Args:
+            nodes: The nodes to queue.
+
+        Returns:
+            The number of queued nodes.
+        """
+        with self.lock:
+            count = self._add(nodes)
+            self.con.commit()
+        return count
+
+    def _add(self, nodes: Iterable[Node]) -> int:
+        before = self.con.total_changes
+        self.con.executemany(
+            "INSERT OR IGNORE INTO nodes(resource, id, depth, state) VALUES(?, ?, ?, ?)",
+            ((x.resource, x.id, x.depth, PENDING) for x in nodes),
+        )
+        return self.con.total_changes - before
+
+    def pending(self, limit: int = 100) -> list[Node]:
+        """Retrieve the frontier, the shallowest nodes first.
+
+        Args:
+            limit: The number of nodes to retrieve.
+
+        Returns:
+            The nodes which were reached but not fetched.
+        """
+        with self.lock:
+            rows = self.con.execute(
+                "SELECT resource, id, depth FROM nodes WHERE state = ? "
+                "ORDER BY depth, rowid LIMIT ?",
+                (PENDING, limit),
+            ).fetchall()
+        return [Node(*x) for x in rows]
+
+    def complete(self, node: Node, references: Iterable[Node], *, missing: bool = False) -> int:
+        """Mark a node as fetched and queue its references, in a single transaction.
+
+        Args:
+            node: The fetched node.
+            references: The nodes it references.
+            missing: Whether Marvel couldn't find the node.
+
+        Returns:
+            The number of queued references.
+        """
+        with self.lock:
+            self.con.execute(
+                "UPDATE nodes SET state = ? WHERE resource = ? AND id = ?",
+                (MISSING if missing else FETCHED, node.resource, node.id),
+            )
+            count = self._add(references)
+            self.con.commit()
+        return count
+
+    def counts(self) -> dict[str, int]:
+        """Count the nodes of each state.
+
+        Returns:
+            The number of `pending`, `fetched` and `missing` nodes.
+        """
+        with self.lock:
+            rows = dict(self.con.execute("SELECT state, COUNT(*) FROM nodes GROUP BY state"))
+        return {
+            "pending": rows.get(PENDING, 0),
+            "fetched": rows.get(FETCHED, 0),
+            "missing": rows.get(MISSING, 0),
+        }
+
+    def clear(self) -> None:
+        """Forget every node, to crawl again from scratch."""
+        with self.lock:
+            self.con.execute("DELETE FROM nodes")
+            self.con.commit()
+
+
+class Crawler:
+    """The Crawler object to traverse the graph of entities referenced by each other.
+
+    Starting from seeds, each entity is fetched and the `GenericItem` references of its model,
+    e.g. the characters, creators, series, stories, events and variants of a comic, are queued
+    for fetching, breadth first. The state keeps every reached node, so each entity is fetched
+    once per crawl however many entities reference it, and the frontier is saved after each
+    entity, so an interrupted crawl resumes with `crawl()`. An entity in flight when the crawl
+    was interrupted is fetched again.
+
+    Marvel lists at most 20 references of each kind in an entity, the related list endpoints,
+    e.g. `Session.character_comics`, hold the others.
+
+    Args:
+        session: The session to fetch the entities with, using its cache.
+        store: The store to upsert the fetched entities into.
+        state: The state to keep the visited nodes and the frontier in.
+        resources: The resources to follow references to, defaults to the whole catalog.
+            Seeds are fetched whatever their resource.
+        max_depth: The number of references to follow from the seeds, None for no limit.
+        workers: The number of entities fetched concurrently.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        session: Session,
+        store: Store,
+        state: CrawlState,
+        *,
+        resources: Iterable[str] | None = None,
+        max_depth: int | None = None,
+        workers: int = 4,
+    ) -> None:
+        self.session = session
+        self.store = store
+        self.state = state
+        self.resources = frozenset(resources or RESOURCE_MODELS)
+        if unknown := self.resources - set(RESOURCE_MODELS):
+            raise ValueError(f"Unknown resource: {', '.join(sorted(unknown))}")
+        self.max_depth = max_depth
+        self.workers = workers
+
+    def crawl(self, seeds: Iterable[tuple[str, int]] = ()) -> dict[str, int]:
+        """Fetch the seeds and every entity reached from them which wasn't fetched yet.
+
+        Args:
+            seeds: The entities to start from, e.g. `[("characters", 1009610)]`. Seeds which
+                were already reached are ignored, so the seeds of an interrupted crawl can
+                be passed again to resume it.
+
+        Returns:
+            The number of entities fetched for each resource.
+
+        Raises:
+            ValueError: If the resource of a seed is unknown.
+            ApiError: If a request fails, other than for an entity Marvel couldn't find. The
+                frontier is kept.
+        """
+        seeds = [Node(resource, int(_id)) for resource, _id in seeds]
+        if unknown := {x.resource for x in seeds} - set(RESOURCE_MODELS):
+            raise ValueError(f"Unknown resource: {', '.join(sorted(unknown))}")
+        self.state.add(seeds)
+        fetched: Counter[str] = Counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            running: dict[Future, Node] = {}
+            while True:
+                for node in self.state.pending(self.workers + len(running)):
+                    if len(running) < self.workers and node not in running.values():
+                        running[executor.submit(self._fetch, node)] = node
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = running.pop(future)
+                    references = future.result()
+                    self.state.complete(node, references or (), missing=references is None)
+                    if references is not None:
+                        fetched[node.resource] += 1
+        return dict(fetched)
+
+    def _fetch(self, node: Node) -> list[Node] | None:
+        """Fetch an entity, store it and find its references, None if Marvel couldn't find it."""
+        try:
+            results = self.session.fetch_page([node.resource, node.id])["results"]
+        except ApiError as err:
+            if err.status == HTTPStatus.NOT_FOUND:
+                return None
+            raise
+        self.store.upsert(node.resource, results)
+        if self.max_depth is not None and node.depth >= self.max_depth:
+            return []
+        return [
+            Node(resource, _id, node.depth + 1)
+            for resource, _id in dict.fromkeys(_references(results))
+            if resource in self.resources and (resource, _id) != (node.resource, node.id)
+        ]
+
+
+def _references(data: Any) -> Iterator[tuple[str, int]]:  # noqa: ANN401
+    """Find the resource and id of every `resourceURI` nested in results."""
+    if isinstance(data, list):
+        for item in data:
+            yield from _references(item)
+    elif isinstance(data, dict):
+        for key, value in data.items():
+            if key == "resourceURI" and isinstance(value, str):
+                if match := _RESOURCE_URI.search(value):
+                    yield match[1], int(match[2])
+            else:
+                yield from _references(value)
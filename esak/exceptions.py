@@ -9,7 +9,19 @@ This module provides the following classes:
 
 
 class ApiError(Exception):
-    """Class for any api errors."""
+    """Class for any api errors.
+
+    Args:
+        *args: The error message.
+        status: The HTTP status code of the response, e.g. 404, if the error comes from one.
+
+    Attributes:
+        status: The HTTP status code of the response, or None.
+    """
+
+    def __init__(self, *args: object, status: int | None = None) -> None:
+        super().__init__(*args)
+        self.status = status
 
 
 class AuthenticationError(ApiError):
@@ -0,0 +1,360 @@
+"""Export module.
+
+This module provides the following classes:
+
+- NdjsonWriter
+- ParquetWriter
+
+This module provides the following functions:
+
+- arrow_schema
+- export
+- export_parallel
+- iter_cache
+- iter_pages
+"""
+
+__all__ = [
+    "NdjsonWriter",
+    "ParquetWriter",
+    "arrow_schema",
+    "export",
+    "export_parallel",
+    "iter_cache",
+    "iter_pages",
+]
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from types import TracebackType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import AnyUrl, TypeAdapter
+
+from esak.schemas import BaseModel
+from esak.session import RESOURCE_MODELS, Session
+from esak.sqlite_cache import SqliteCache
+from esak.store import cached_results
+
+PAGE_SIZE = 100
+ROW_GROUP_SIZE = 10_000
+
+
+def arrow_schema(model: type[BaseModel]) -> Any:  # noqa: ANN401
+    """Derive the PyArrow schema of a model, as written by `ParquetWriter`.
+
+    Nested models become structs and lists become list columns. URLs are strings, decimals are
+    doubles and datetimes are UTC timestamps.
+
+    Args:
+        model: The esak model to derive the schema from.
+
+    Returns:
+        A `pyarrow.Schema` with a field for each attribute of the model.
+
+    Raises:
+        ImportError: If pyarrow is not installed, see the `esak[arrow]` extra.
+    """
+    import pyarrow as pa  # noqa: PLC0415
+
+    return pa.schema(_arrow_fields(model))
+
+
+def _arrow_fields(model: type[BaseModel]) -> list[Any]:
+    import pyarrow as pa  # noqa: PLC0415
+
+    fields = []
+    for name, info in model.model_fields.items():
+        annotation, nullable = _unwrap_optional(info.annotation)
+        fields.append(pa.field(name, _arrow_type(annotation), nullable=nullable))
+    return fields
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:  # noqa: ANN401
+    if get_origin(annotation) in (Union, UnionType):
+        args = [x for x in get_args(annotation) if x is not type(None)]
+        return (args[0] if len(args) == 1 else annotation), len(args) < len(get_args(annotation))
+    return annotation, False
+
+
+def _arrow_type(annotation: Any) -> Any:  # noqa: ANN401, PLR0911
+    import pyarrow as pa  # noqa: PLC0415
+
+    annotation = _unwrap_optional(annotation)[0]
+    if get_origin(annotation) in (list, tuple):
+        return pa.list_(_arrow_type(get_args(annotation)[0]))
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return pa.struct(_arrow_fields(annotation))
+    if annotation is bool:
+        return pa.bool_()
+    if annotation is int:
+        return pa.int64()
+    if annotation in (float, Decimal):
+        return pa.float64()
+    if annotation is datetime:
+        return pa.timestamp("us", tz="UTC")
+    if annotation is date:
+        return pa.date32()
+    return pa.string()
+
+
+def _plain(value: Any) -> Any:  # noqa: ANN401
+    """Convert a dumped model into values PyArrow accepts."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_plain(x) for x in value]
+    if isinstance(value, AnyUrl):
+        return str(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+class NdjsonWriter:
+    """The NdjsonWriter object writes models as newline delimited JSON, one model per line.
+
+    Args:
+        path: The file to write.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = self.path.open("w", encoding="utf-8")
+
+    def write(self, models: Iterable[BaseModel]) -> None:
+        """Write models to the file.
+
+        Args:
+            models: The models to write.
+        """
+        self._file.writelines(f"{x.model_dump_json()}\n" for x in models)
+
+    def close(self) -> None:
+        """Close the file."""
+        self._file.close()
+
+    def __enter__(self) -> "NdjsonWriter":  # noqa: PYI034
+        """Use the writer as a context manager which closes it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer."""
+        self.close()
+
+
+class ParquetWriter:
+    """The ParquetWriter object writes models to a Parquet file in row groups.
+
+    At most `row_group_size` models are held in memory before they are written as a row group.
+
+    Args:
+        path: The file to write.
+        model: The esak model of the written models, which the schema is derived from.
+        row_group_size: The number of models per row group.
+
+    Raises:
+        ImportError: If pyarrow is not installed, see the `esak[arrow]` extra.
+    """
+
+    def __init__(
+        self, path: str | Path, model: type[BaseModel], row_group_size: int = ROW_GROUP_SIZE
+    ) -> None:
+        import pyarrow.parquet as pq  # noqa: PLC0415
+
+        self.path = Path(path)
+        self.schema = arrow_schema(model)
+        self.row_group_size = row_group_size
+        self._rows: list[dict[str, Any]] = []
+        self._writer = pq.ParquetWriter(self.path, self.schema)
+
+    def write(self, models: Iterable[BaseModel]) -> None:
+        """Write models to the file, a row group at a time.
+
+        Args:
+            models: The models to write.
+        """
+        for model in models:
+            self._rows.append(_plain(model.model_dump()))
+            if len(self._rows) >= self.row_group_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        import pyarrow as pa  # noqa: PLC0415
+
+        if self._rows:
+            table = pa.Table.from_pylist(self._rows, schema=self.schema)
+            self._writer.write_table(table, row_group_size=self.row_group_size)
+            self._rows = []
+
+    def close(self) -> None:
+        """Write the remaining models and close the file."""
+        self._flush()
+        self._writer.close()
+
+    def __enter__(self) -> "ParquetWriter":  # noqa: PYI034
+        """Use the writer as a context manager which closes it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the writer."""
+        self.close()
+
+
+def iter_pages(  # noqa: PLR0913
+    session: Session,
+    endpoint: list[str | int],
+    params: dict[str, Any] | None = None,
+    page_size: int = PAGE_SIZE,
+    *,
+    shard: int = 0,
+    shards: int = 1,
+    use_cache: bool = False,
+) -> Iterator[list[dict[str, Any]]]:
+    """Request the pages of a paginated endpoint one at a time.
+
+    With `shards`, only every `shards`-th page starting at page `shard` is requested, so several
+    iterators can split an endpoint between them.
+
+    Args:
+        session: The session to request the pages with.
+        endpoint: A list representing the endpoint path, e.g. `["series", 466, "comics"]`.
+        params: Parameters to add to the requests, besides `offset` and `limit`.
+        page_size: The number of results to request per call, up to 100.
+        shard: The first page to request.
+        shards: The number of pages to move forward after each page.
+        use_cache: Read the pages from and store them in the cache of the session.
+
+    Yields:
+        The unvalidated results of each page.
+    """
+    offset = shard * page_size
+    while True:
+        page_params = {**(params or {}), "offset": offset, "limit": page_size}
+        data = session.fetch_page(endpoint, page_params, use_cache=use_cache)
+        if results := data["results"]:
+            yield results
+        offset += shards * page_size
+        if len(results) < page_size or offset >= data.get("total", offset + 1):
+            return
+
+
+def iter_cache(
+    cache: SqliteCache, resource: str, page_size: int = PAGE_SIZE
+) -> Iterator[list[dict[str, Any]]]:
+    """Read the results of a resource from a cache, each entity once.
+
+    Args:
+        cache: The cache to read the responses from.
+        resource: The resource name, e.g. `"comics"`.
+        page_size: The number of results per yielded page.
+
+    Yields:
+        Pages of unvalidated results.
+    """
+    seen: set[int] = set()
+    page: list[dict[str, Any]] = []
+    for name, results, _ in cached_results(cache):
+        if name != resource:
+            continue
+        for result in results:
+            if result["id"] not in seen:
+                seen.add(result["id"])
+                page.append(result)
+        if len(page) >= page_size:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def export(
+    pages: Iterable[list[dict[str, Any]]],
+    resource: str,
+    path: str | Path,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> int:
+    """Validate pages of results and write them to a file as they are read.
+
+    Memory is bounded by a page, plus a row group for Parquet, whatever the size of the export.
+
+    Args:
+        pages: Pages of unvalidated results, e.g. from `iter_pages` or `iter_cache`.
+        resource: The resource name of the results, e.g. `"comics"`.
+        path: The file to write, as Parquet if it ends with `.parquet`, else as NDJSON.
+        row_group_size: The number of models per Parquet row group.
+
+    Returns:
+        The number of results written.
+
+    Raises:
+        ImportError: If the path ends with `.parquet` and pyarrow is not installed, see the
+            `esak[arrow]` extra.
+    """
+    model = RESOURCE_MODELS[resource]
+    adapter = TypeAdapter(list[model])
+    path = Path(path)
+    count = 0
+    writer = (
+        ParquetWriter(path, model, row_group_size)
+        if path.suffix == ".parquet"
+        else NdjsonWriter(path)
+    )
+    with writer:
+        for page in pages:
+            writer.write(adapter.validate_python(page))
+            count += len(page)
+    return count
+
+
+def export_parallel(  # noqa: PLR0913
+    session: Session,
+    endpoint: list[str | int],
+    path: str | Path,
+    *,
+    params: dict[str, Any] | None = None,
+    page_size: int = PAGE_SIZE,
+    workers: int = 4,
+) -> dict[Path, int]:
+    """Export a paginated endpoint with several writers, each requesting and writing a shard.
+
+    Worker `n` writes every `workers`-th page starting at page `n` to `<stem>-<n><suffix>`,
+    e.g. `comics-00000.parquet`.
+
+    Args:
+        session: The session to request the pages with.
+        endpoint: A list representing the endpoint path, e.g. `["comics"]`.
+        path: The file name the part files are named after.
+        params: Parameters to add to the requests, besides `offset` and `limit`.
+        page_size: The number of results to request per call, up to 100.
+        workers: The number of writers.
+
+    Returns:
+        The number of results written to each part file.
+    """
+    resource = next(x for x in reversed(endpoint) if isinstance(x, str))
+    path = Path(path)
+    parts = [path.with_name(f"{path.stem}-{x:05d}{path.suffix}") for x in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        counts = executor.map(
+            lambda x: export(
+                iter_pages(session, endpoint, params, page_size, shard=x, shards=workers),
+                resource,
+                parts[x],
+            ),
+            range(workers),
+        )
+        return dict(zip(parts, counts, strict=True))
@@ -0,0 +1,197 @@
+"""Hooks module.
+
+This module provides the following classes:
+
+- HookEvent
+- Hooks
+- Trace
+"""
+
+__all__ = ["EVENTS", "NO_TRACE", "HookEvent", "Hooks", "Trace"]
+
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+
+# The events a `Session` emits, in the order they occur during a request.
+EVENTS = ("on_request_start", "on_cache_hit", "on_retry", "on_response", "on_validate", "on_error")
+
+
+@dataclass(frozen=True)
+class HookEvent:
+    """The details of a phase of a `Session` request, passed to the registered callbacks.
+
+    Timings are monotonic, measured with `time.perf_counter`, in seconds.
+
+    Attributes:
+        name: The event, one of `EVENTS`.
+        endpoint: The endpoint path, e.g. `"series/466/comics"`, or for `on_validate` the name
+            of the validated model.
+        cache_key: The cache key of the request.
+        started: The `time.perf_counter` value when the request or validation started.
+        timings: The duration of each completed phase: `cache` for the cache lookup, `auth` for
+            hashing the credentials, `network` for the request, `decode` for parsing the JSON,
+            `store` for saving it in the cache and `validate` for validating the results.
+        size: The size of the response body in bytes.
+        status: The HTTP status code of the response, for `on_retry` of the failed attempt.
+        headers: The headers of the response.
+        count: The number of results.
+        attempt: The number of the attempt about to be made, for `on_retry`.
+        error: The exception raised, for `on_error`, or for `on_retry` by the failed attempt.
+    """
+
+    name: str
+    endpoint: str
+    cache_key: str | None = None
+    started: float = 0.0
+    timings: dict[str, float] = field(default_factory=dict)
+    size: int | None = None
+    status: int | None = None
+    headers: Mapping[str, str] | None = None
+    count: int | None = None
+    attempt: int | None = None
+    error: BaseException | None = None
+
+
+class Hooks:
+    """The Hooks object holds the callbacks registered for the events of a `Session`.
+
+    Each callback receives a `HookEvent`. Callbacks run in the thread making the request, and
+    exceptions raised by them are not caught. When no callback is registered a request only
+    pays for a truth test of the hooks.
+    """
+
+    def __init__(self) -> None:
+        self._callbacks: dict[str, tuple[Callable[[HookEvent], None], ...]] = dict.fromkeys(
+            EVENTS, ()
+        )
+
+    def __bool__(self) -> bool:
+        """Whether any callback is registered."""
+        return any(self._callbacks.values())
+
+    def register(
+        self, name: str, callback: Callable[[HookEvent], None]
+    ) -> Callable[[HookEvent], None]:
+        """Call `callback` on each occurrence of an event.
+
+        Args:
+            name: The event, one of `EVENTS`.
+            callback: Function receiving the `HookEvent`.
+
+        Returns:
+            The callback.
+
+        Raises:
+            ValueError: If the event is unknown.
+        """
+        if name not in self._callbacks:
+            raise ValueError(f"Unknown event: {name!r}")
+        self._callbacks[name] = (*self._callbacks[name], callback)
+        return callback
+
+    def unregister(self, name: str, callback: Callable[[HookEvent], None]) -> None:
+        """Stop calling a registered callback.
+
+        Args:
+            name: The event the callback was registered for.
+            callback: The registered callback.
+
+        Raises:
+            ValueError: If the callback is not registered for the event.
+        """
+        callbacks = list(self._callbacks.get(name, ()))
+        if callback not in callbacks:
+            raise ValueError(f"Callback not registered for {name!r}")
+        callbacks.remove(callback)
+        self._callbacks[name] = tuple(callbacks)
+
+    def emit(self, name: str, endpoint: str, **details: object) -> None:
+        """Call the callbacks registered for an event.
+
+        Args:
+            name: The event, one of `EVENTS`.
+            endpoint: The endpoint path or model name.
+            **details: The other attributes of the `HookEvent`.
+        """
+        if callbacks := self._callbacks[name]:
+            event = HookEvent(name, endpoint, **details)
+            for callback in callbacks:
+                callback(event)
+
+    def trace(self, endpoint: str, cache_key: str | None = None) -> "Trace":
+        """Start timing a request and emit `on_request_start`.
+
+        Args:
+            endpoint: The endpoint path, e.g. `"series/466/comics"`.
+            cache_key: The cache key of the request.
+
+        Returns:
+            The trace to record the phases of the request with.
+        """
+        trace = Trace(self, endpoint, cache_key)
+        trace.emit("on_request_start")
+        return trace
+
+
+class Trace:
+    """The Trace object times the phases of a single request and emits its events.
+
+    The status set with `set_status` is added to the events.
+
+    Args:
+        hooks: The hooks to emit the events to, None to record nothing.
+        endpoint: The endpoint path, e.g. `"series/466/comics"`.
+        cache_key: The cache key of the request.
+    """
+
+    def __init__(
+        self, hooks: Hooks | None, endpoint: str = "", cache_key: str | None = None
+    ) -> None:
+        self.hooks = hooks
+        self.endpoint = endpoint
+        self.cache_key = cache_key
+        self.timings: dict[str, float] = {}
+        self.status: int | None = None
+        self.started = self._mark = time.perf_counter() if hooks is not None else 0.0
+
+    def lap(self, phase: str) -> None:
+        """Record the time since the previous phase ended as the duration of `phase`.
+
+        Args:
+            phase: The name of the phase which just ended, e.g. `"network"`.
+        """
+        if self.hooks is not None:
+            now = time.perf_counter()
+            self.timings[phase] = now - self._mark
+            self._mark = now
+
+    def set_status(self, status: int | None) -> None:
+        """Record the status of the latest response, None if the request failed without one.
+
+        Args:
+            status: The HTTP status code.
+        """
+        if self.hooks is not None:
+            self.status = status
+
+    def emit(self, name: str, **details: object) -> None:
+        """Emit an event with the timings and the status recorded so far.
+
+        Args:
+            name: The event, one of `EVENTS`.
+            **details: The other attributes of the `HookEvent`, e.g. `count`.
+        """
+        if self.hooks is not None:
+            self.hooks.emit(
+                name,
+                self.endpoint,
+                cache_key=self.cache_key,
+                started=self.started,
+                timings=dict(self.timings),
+                **{"status": self.status, **details},
+            )
+
+
+# The trace used when no callback is registered, which records nothing.
+NO_TRACE = Trace(None)
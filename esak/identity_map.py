@@ -0,0 +1,58 @@
+"""Identity Map module.
+
+This module provides the following classes:
+
+- IdentityMap
+"""
+
+__all__ = ["IdentityMap"]
+
+from collections.abc import Callable
+from typing import Any
+from weakref import WeakValueDictionary
+
+from esak.schemas import BaseModel
+
+
+class IdentityMap:
+    """The IdentityMap object returns the same model instance for the same entity.
+
+    Entities are keyed on `(model, id, modified)`, so an entity that changed upstream is validated
+    again. Instances are held through weak references and are dropped from the map once nothing
+    else uses them. Shared instances are returned to every caller, so `Session` only uses the map
+    with frozen models, which can't be modified.
+    """
+
+    def __init__(self) -> None:
+        self._instances: WeakValueDictionary[tuple, BaseModel] = WeakValueDictionary()
+
+    def __len__(self) -> int:
+        """Number of live instances in the map."""
+        return len(self._instances)
+
+    def clear(self) -> None:
+        """Remove all instances from the map."""
+        self._instances.clear()
+
+    def resolve(
+        self,
+        model: type[BaseModel],
+        data: dict[str, Any],
+        validate: Callable[[dict[str, Any]], BaseModel],
+    ) -> BaseModel:
+        """Return the known instance for a result, validating it only if it is not known yet.
+
+        Args:
+            model: The model class the result is validated into.
+            data: The result from Marvel.
+            validate: Function validating the result into a model.
+
+        Returns:
+            The model for the result.
+        """
+        if (_id := data.get("id")) is None:
+            return validate(data)
+        key = (model, _id, data.get("modified"))
+        if (instance := self._instances.get(key)) is None:
+            instance = self._instances[key] = validate(data)
+        return instance
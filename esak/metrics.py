@@ -0,0 +1,359 @@
+"""Metrics module.
+
+This module provides the following classes:
+
+- Counter
+- Gauge
+- Histogram
+- MetricsRegistry
+"""
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsRegistry"]
+
+import bisect
+import math
+import re
+import threading
+from typing import Any
+
+from esak.hooks import HookEvent, Hooks
+
+# Upper bounds in seconds, from a cache hit to a slow upstream request.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUOTA_HEADER = "X-RateLimit-Remaining"
+
+_ID = re.compile(r"(?<=/)\d+(?=/|$)")
+
+
+class _Metric:
+    """A named metric with a value per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labels = labels
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, object]) -> tuple[str, ...]:
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects the labels {', '.join(self.labels) or 'none'}")
+        return tuple(str(labels[x]) for x in self.labels)
+
+    def samples(self) -> list[dict[str, Any]]:
+        """Read the current values.
+
+        Returns:
+            A dict per combination of label values, with the `labels` and the `value`.
+        """
+        with self._lock:
+            items = sorted(self._values.items())
+        return [{"labels": dict(zip(self.labels, k, strict=True)), "value": v} for k, v in items]
+
+    def render(self) -> list[str]:
+        """Render the metric in the Prometheus text exposition format.
+
+        Returns:
+            The lines of the metric.
+        """
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation, quote=False)}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        lines.extend(
+            f"{self.name}{_labels(x['labels'])} {_number(x['value'])}" for x in self.samples()
+        )
+        return lines
+
+
+class Counter(_Metric):
+    """The Counter object counts occurrences, it only goes up.
+
+    Args:
+        name: The metric name, e.g. `esak_requests_total`.
+        documentation: What the metric counts.
+        labels: The names of the labels the counts are split by.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1, **labels: object) -> None:
+        """Add to the count.
+
+        Args:
+            amount: The amount to add, at least 0.
+            **labels: The value of each label.
+
+        Raises:
+            ValueError: If the labels don't match or the amount is negative.
+        """
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    """The Gauge object holds a value which can go up and down.
+
+    Args:
+        name: The metric name, e.g. `esak_quota_remaining`.
+        documentation: What the metric measures.
+        labels: The names of the labels the values are split by.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: object) -> None:
+        """Replace the value.
+
+        Args:
+            value: The new value.
+            **labels: The value of each label.
+
+        Raises:
+            ValueError: If the labels don't match.
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """The Histogram object counts observations in cumulative buckets.
+
+    Args:
+        name: The metric name, e.g. `esak_request_duration_seconds`.
+        documentation: What the metric observes.
+        labels: The names of the labels the observations are split by.
+        buckets: The increasing upper bounds of the buckets, `+Inf` is added.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labels)
+        self.buckets = (*sorted(buckets), math.inf)
+
+    def observe(self, value: float, **labels: object) -> None:
+        """Count an observation.
+
+        Args:
+            value: The observed value, e.g. a duration in seconds.
+            **labels: The value of each label.
+
+        Raises:
+            ValueError: If the labels don't match.
+        """
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._values.get(key, ([0] * len(self.buckets), 0.0))
+            counts[index] += 1
+            self._values[key] = (counts, total + value)
+
+    def samples(self) -> list[dict[str, Any]]:
+        """Read the current observations.
+
+        Returns:
+            A dict per combination of label values, with the `labels`, the cumulative `buckets`
+            by upper bound, the `count` and the `sum` of the observations.
+        """
+        samples = []
+        for sample in super().samples():
+            counts, total = sample.pop("value")
+            cumulative, buckets = 0, {}
+            for bound, count in zip(self.buckets, counts, strict=True):
+                cumulative += count
+                buckets[_number(bound)] = cumulative
+            samples.append({**sample, "buckets": buckets, "count": cumulative, "sum": total})
+        return samples
+
+    def render(self) -> list[str]:
+        """Render the histogram in the Prometheus text exposition format.
+
+        Returns:
+            The lines of the histogram.
+        """
+        lines = [
+            f"# HELP {self.name} {_escape(self.documentation, quote=False)}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for sample in self.samples():
+            labels = sample["labels"]
+            for bound, count in sample["buckets"].items():
+                lines.append(f"{self.name}_bucket{_labels({**labels, 'le': bound})} {count}")
+            lines.append(f"{self.name}_sum{_labels(labels)} {_number(sample['sum'])}")
+            lines.append(f"{self.name}_count{_labels(labels)} {sample['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """The MetricsRegistry object holds the metrics of sessions and caches.
+
+    Pass the same registry to a `Session` and its `SqliteCache` to expose all their metrics
+    together, e.g. from the handler of a `/metrics` endpoint:
+
+    - `esak_requests_total`: requests sent to Marvel by endpoint and status.
+    - `esak_request_duration_seconds`: upstream latency by endpoint.
+    - `esak_retries_total`: retried requests by endpoint.
+    - `esak_quota_remaining`: requests left in the quota, when Marvel reports it.
+    - `esak_validation_duration_seconds`: validation latency by model.
+    - `esak_cache_requests_total`: cache lookups by tier and result, `hit` or `miss`.
+    - `esak_cache_duration_seconds`: cache latency by tier and operation, `get` or `store`.
+
+    Endpoints are labelled with their ids replaced, e.g. `comics/{id}/characters`, to bound the
+    number of series.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _Metric] = {}
+
+    def _get(self, cls: type[_Metric], name: str, documentation: str, **kwargs: Any) -> Any:  # noqa: ANN401
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = cls(name, documentation, **kwargs)
+            metric = self._metrics[name]
+        if not isinstance(metric, cls):
+            raise TypeError(f"{name} is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter.
+
+        Args:
+            name: The metric name.
+            documentation: What the metric counts.
+            labels: The names of the labels the counts are split by.
+
+        Returns:
+            The counter registered under the name.
+
+        Raises:
+            TypeError: If the name is registered as another kind of metric.
+        """
+        return self._get(Counter, name, documentation, labels=labels)
+
+    def gauge(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge.
+
+        Args:
+            name: The metric name.
+            documentation: What the metric measures.
+            labels: The names of the labels the values are split by.
+
+        Returns:
+            The gauge registered under the name.
+
+        Raises:
+            TypeError: If the name is registered as another kind of metric.
+        """
+        return self._get(Gauge, name, documentation, labels=labels)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram.
+
+        Args:
+            name: The metric name.
+            documentation: What the metric observes.
+            labels: The names of the labels the observations are split by.
+            buckets: The increasing upper bounds of the buckets.
+
+        Returns:
+            The histogram registered under the name.
+
+        Raises:
+            TypeError: If the name is registered as another kind of metric.
+        """
+        return self._get(Histogram, name, documentation, labels=labels, buckets=buckets)
+
+    def snapshot(self) -> dict[str, list[dict[str, Any]]]:
+        """Read the current value of every metric.
+
+        Returns:
+            The samples of each metric by name, see `Counter.samples` and `Histogram.samples`.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        return {name: metric.samples() for name, metric in metrics}
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            The exposition, served with the content type `text/plain; version=0.0.4`.
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+        return "".join(f"{line}\n" for _, metric in metrics for line in metric.render())
+
+    def observe(self, hooks: Hooks) -> None:
+        """Record the request, retry, quota and validation metrics of a `Session` from its hooks.
+
+        Args:
+            hooks: The hooks of the session.
+        """
+        requests = self.counter(
+            "esak_requests_total", "Requests sent to Marvel.", ("endpoint", "status")
+        )
+        latency = self.histogram(
+            "esak_request_duration_seconds", "Latency of requests to Marvel.", ("endpoint",)
+        )
+        retries = self.counter("esak_retries_total", "Retried requests.", ("endpoint",))
+        quota = self.gauge("esak_quota_remaining", "Requests left in the quota.")
+        validation = self.histogram(
+            "esak_validation_duration_seconds", "Latency of validating results.", ("model",)
+        )
+
+        def on_response(event: HookEvent) -> None:
+            endpoint = _ID.sub("{id}", event.endpoint)
+            requests.inc(endpoint=endpoint, status=event.status)
+            latency.observe(event.timings["network"], endpoint=endpoint)
+            if event.headers and (remaining := event.headers.get(QUOTA_HEADER)) is not None:
+                quota.set(float(remaining))
+
+        def on_error(event: HookEvent) -> None:
+            if "network" in event.timings:
+                on_response(event)
+            elif "auth" in event.timings:
+                requests.inc(endpoint=_ID.sub("{id}", event.endpoint), status="error")
+
+        hooks.register("on_response", on_response)
+        hooks.register("on_error", on_error)
+        hooks.register("on_retry", lambda x: retries.inc(endpoint=_ID.sub("{id}", x.endpoint)))
+        hooks.register(
+            "on_validate", lambda x: validation.observe(x.timings["validate"], model=x.endpoint)
+        )
+
+
+def _escape(value: str, *, quote: bool = True) -> str:
+    value = value.replace("\\", "\\\\").replace("\n", "\\n")
+    return value.replace('"', '\\"') if quote else value
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
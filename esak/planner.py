@@ -0,0 +1,173 @@
+"""Planner module.
+
+This module provides the following classes:
+
+- Call
+- QueryPlanner
+"""
+
+__all__ = ["FILTERS", "Call", "QueryPlanner"]
+
+from collections.abc import Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from esak.results import Results
+from esak.session import RELATED_LISTS, Session
+
+# The filters of each list endpoint which accept comma separated ids, as documented by Marvel.
+FILTERS: dict[str, frozenset[str]] = {
+    "characters": frozenset({"comics", "events", "series", "stories"}),
+    "comics": frozenset({"characters", "creators", "events", "series", "stories"}),
+    "creators": frozenset({"comics", "events", "series", "stories"}),
+    "events": frozenset({"characters", "comics", "creators", "series", "stories"}),
+    "series": frozenset({"characters", "comics", "creators", "events", "stories"}),
+    "stories": frozenset({"characters", "comics", "creators", "events", "series"}),
+}
+# The most ids Marvel accepts in a single filter.
+MAX_IDS = 10
+PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class Call:
+    """A request of a plan, each of its pages is requested.
+
+    Attributes:
+        endpoint: The endpoint path, e.g. `("comics",)` or `("characters", 1009610, "comics")`.
+        params: The parameters of the request, besides `offset` and `limit`.
+    """
+
+    endpoint: tuple[str | int, ...]
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+class QueryPlanner:
+    """The QueryPlanner object requests the entities related to many ids in few calls.
+
+    Marvel's list endpoints filter on up to 10 comma separated ids, returning the entities
+    related to any of them, e.g. `comics?characters=1009610,1009220`. Instead of requesting
+    `characters/{id}/comics` for each id, the planner splits the ids into chunks of that size,
+    requests the chunks and their pages concurrently, then merges the results and removes the
+    entities related to several ids.
+
+    Args:
+        session: The session to request the pages with, using its cache.
+        max_ids: The number of ids per filter.
+        page_size: The number of results to request per page, up to 100.
+        workers: The number of concurrent requests.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        max_ids: int = MAX_IDS,
+        page_size: int = PAGE_SIZE,
+        workers: int = 4,
+    ) -> None:
+        self.session = session
+        self.max_ids = max_ids
+        self.page_size = page_size
+        self.workers = workers
+
+    def plan(
+        self, resource: str, by: str, ids: Iterable[int], params: dict[str, Any] | None = None
+    ) -> list[Call]:
+        """Choose the calls requesting the entities of a resource related to ids.
+
+        A single id is requested through its related list, e.g. `characters/{id}/comics`, which
+        shares its cache entries with e.g. `Session.character_comics`. Several ids are filtered
+        on in chunks of `max_ids`, unless the list endpoint can't filter on them.
+
+        Args:
+            resource: The resource to request, e.g. `"comics"`.
+            by: The resource the ids belong to, e.g. `"characters"`.
+            ids: The ids, duplicates are ignored.
+            params: Other parameters, e.g. `{"orderBy": "title"}`.
+
+        Returns:
+            The calls, without the pagination.
+
+        Raises:
+            ValueError: If the resources aren't related or the parameters conflict with the plan.
+        """
+        params = dict(params or {})
+        if conflicts := {"offset", "limit", by} & set(params):
+            raise ValueError(f"Parameters set by the planner: {', '.join(sorted(conflicts))}")
+        ids = list(dict.fromkeys(ids))
+        related = resource in RELATED_LISTS.get(by, ())
+        filtered = by in FILTERS.get(resource, ())
+        if not related and not filtered:
+            raise ValueError(f"{resource} can't be requested by {by}")
+        if not filtered or (related and len(ids) == 1):
+            return [Call((by, x, resource), params) for x in ids]
+        chunks = (ids[x : x + self.max_ids] for x in range(0, len(ids), self.max_ids))
+        return [
+            Call((resource,), {**params, by: ",".join(str(x) for x in chunk)}) for chunk in chunks
+        ]
+
+    def fetch_results(
+        self, resource: str, by: str, ids: Iterable[int], params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        """Request every page of a plan concurrently and merge the results.
+
+        Args:
+            resource: The resource to request, e.g. `"comics"`.
+            by: The resource the ids belong to, e.g. `"characters"`.
+            ids: The ids.
+            params: Other parameters, e.g. `{"orderBy": "title"}`.
+
+        Returns:
+            The unvalidated results, each entity once, in the order of the calls and pages.
+
+        Raises:
+            ValueError: If the resources aren't related or the parameters conflict with the plan.
+        """
+        calls = self.plan(resource, by, ids, params)
+        pages: dict[tuple[int, int], list[dict[str, Any]]] = {}
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending: dict[Future, tuple[int, int]] = {
+                executor.submit(self._page, call, 0): (index, 0) for index, call in enumerate(calls)
+            }
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, offset = pending.pop(future)
+                    data = future.result()
+                    pages[index, offset] = data["results"]
+                    if offset == 0:
+                        total = data.get("total", len(data["results"]))
+                        for page in range(self.page_size, total, self.page_size):
+                            pending[executor.submit(self._page, calls[index], page)] = (index, page)
+        merged: dict[int, dict[str, Any]] = {}
+        for key in sorted(pages):
+            for result in pages[key]:
+                merged.setdefault(result["id"], result)
+        return list(merged.values())
+
+    def fetch(
+        self, resource: str, by: str, ids: Iterable[int], params: dict[str, Any] | None = None
+    ) -> Results:
+        """Request the entities of a resource related to any of the ids.
+
+        Args:
+            resource: The resource to request, e.g. `"comics"`.
+            by: The resource the ids belong to, e.g. `"characters"`.
+            ids: The ids.
+            params: Other parameters, e.g. `{"orderBy": "title"}`.
+
+        Returns:
+            `Results` of models, each entity once, or of the unchanged results when the session is
+            in raw mode.
+
+        Raises:
+            ValueError: If the resources aren't related or the parameters conflict with the plan.
+            ApiError: If a result is not valid.
+        """
+        return self.session.validate(resource, self.fetch_results(resource, by, ids, params))
+
+    def _page(self, call: Call, offset: int) -> dict[str, Any]:
+        params = {**call.params, "offset": offset, "limit": self.page_size}
+        return self.session.fetch_page(list(call.endpoint), params)
@@ -0,0 +1,280 @@
+"""Replay module.
+
+This module provides the following classes:
+
+- CacheSimulator
+- Recorder
+- TraceEntry
+
+This module provides the following functions:
+
+- load_trace
+- replay
+- simulate
+"""
+
+__all__ = ["CacheSimulator", "Recorder", "TraceEntry", "load_trace", "replay", "simulate"]
+
+import json
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qsl
+
+from esak.hooks import HookEvent, Hooks
+from esak.session import Session
+
+
+@dataclass(frozen=True)
+class TraceEntry:
+    """A request recorded by a `Recorder`, one line of a trace.
+
+    Attributes:
+        ts: The number of seconds between the start of the recording and the request.
+        endpoint: The endpoint path, e.g. `"series/466/comics"`.
+        params: The parameters without the authentication, sorted and url encoded.
+        cache: `hit` if the cache answered, `miss` if the response was stored in the cache,
+            `bypass` if it was not, or `error` if the request failed.
+        latency: The number of seconds the request took.
+        status: The HTTP status of the response, None if the cache answered.
+    """
+
+    ts: float
+    endpoint: str
+    params: str
+    cache: str
+    latency: float
+    status: int | None = None
+
+
+class Recorder:
+    """The Recorder object writes the requests of sessions to a trace, one JSON object per line.
+
+    The trace holds the access pattern without credentials or responses, so it can be shared
+    to tune cache sizes and expiry, see `simulate` and `replay`.
+
+    Args:
+        path: The file to append the trace to.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+
+    def observe(self, hooks: Hooks) -> None:
+        """Record the requests of a `Session` from its hooks.
+
+        Args:
+            hooks: The hooks of the session, e.g. `session.hooks`.
+        """
+        hooks.register("on_cache_hit", lambda x: self._write(x, "hit"))
+        hooks.register(
+            "on_response", lambda x: self._write(x, "miss" if "store" in x.timings else "bypass")
+        )
+        hooks.register("on_error", self._on_error)
+
+    def _on_error(self, event: HookEvent) -> None:
+        # Validation errors have no cache key, they happen after the request was recorded.
+        if event.cache_key is not None:
+            self._write(event, "error")
+
+    def _write(self, event: HookEvent, cache: str) -> None:
+        now = time.perf_counter()
+        entry = TraceEntry(
+            ts=round(event.started - self._start, 6),
+            endpoint=event.endpoint,
+            params=(event.cache_key or "").partition("?")[2],
+            cache=cache,
+            latency=round(now - event.started, 6),
+            status=event.status,
+        )
+        line = json.dumps(asdict(entry), separators=(",", ":"))
+        with self._lock:
+            self._file.write(f"{line}\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the trace file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "Recorder":  # noqa: PYI034
+        """Use the recorder as a context manager which closes it on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the recorder."""
+        self.close()
+
+
+def load_trace(path: str | Path) -> list[TraceEntry]:
+    """Read a trace written by a `Recorder`.
+
+    Args:
+        path: The trace file.
+
+    Returns:
+        The recorded requests, in the order they started.
+    """
+    with Path(path).open(encoding="utf-8") as stream:
+        entries = [TraceEntry(**json.loads(x)) for x in stream if x.strip()]
+    return sorted(entries, key=lambda x: x.ts)
+
+
+class CacheSimulator:
+    """The CacheSimulator object models a cache of responses without storing them.
+
+    Args:
+        capacity: The number of responses kept, evicting the least recently used one beyond.
+            None to keep every response.
+        ttl: The number of seconds a response is kept, None to keep it forever.
+    """
+
+    def __init__(self, capacity: int | None = None, ttl: float | None = None) -> None:
+        self.capacity = capacity
+        self.ttl = ttl
+        self._stored: OrderedDict[str, float] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of responses in the cache."""
+        return len(self._stored)
+
+    def access(self, key: str, now: float, *, store: bool = True) -> bool:
+        """Look up a response, storing it on a miss.
+
+        Args:
+            key: The cache key of the request.
+            now: The time of the request in seconds.
+            store: Store the response on a miss, False if the request failed.
+
+        Returns:
+            Whether the response was cached.
+        """
+        stored_at = self._stored.get(key)
+        if stored_at is not None and (self.ttl is None or now - stored_at < self.ttl):
+            self._stored.move_to_end(key)
+            return True
+        self._stored.pop(key, None)
+        if store:
+            self._stored[key] = now
+            if self.capacity is not None and len(self._stored) > self.capacity:
+                self._stored.popitem(last=False)
+        return False
+
+
+def simulate(
+    entries: Iterable[TraceEntry], capacity: int | None = None, ttl: float | None = None
+) -> dict[str, Any]:
+    """Replay a trace against a `CacheSimulator` to predict the effect of a cache configuration.
+
+    The latency of a simulated hit is the median latency of the recorded hits, and of a
+    simulated miss the recorded latency of the request, or the median latency of the recorded
+    misses if the request was a hit.
+
+    Args:
+        entries: The recorded requests, e.g. from `load_trace`.
+        capacity: The number of responses the simulated cache keeps.
+        ttl: The number of seconds the simulated cache keeps a response.
+
+    Returns:
+        The `capacity` and `ttl`, and the report described in `replay`.
+    """
+    entries = list(entries)
+    recorded = {
+        outcome: statistics.median(x.latency for x in entries if x.cache == outcome)
+        for outcome in ("hit", "miss")
+        if any(x.cache == outcome for x in entries)
+    }
+    cache = CacheSimulator(capacity, ttl)
+    outcomes, latencies = [], []
+    for entry in entries:
+        key = f"{entry.endpoint}?{entry.params}"
+        hit = cache.access(key, entry.ts, store=entry.cache != "error")
+        outcomes.append(hit)
+        if hit:
+            latencies.append(recorded.get("hit", 0.0))
+        elif entry.cache == "hit":
+            latencies.append(recorded.get("miss", entry.latency))
+        else:
+            latencies.append(entry.latency)
+    return {"capacity": capacity, "ttl": ttl, **_report(outcomes, latencies)}
+
+
+def replay(
+    entries: Iterable[TraceEntry], session: Session, speed: float | None = None
+) -> dict[str, Any]:
+    """Send the requests of a trace again with a session, e.g. to compare cache configurations.
+
+    Args:
+        entries: The recorded requests, e.g. from `load_trace`.
+        session: The session to send the requests with, with the cache to evaluate.
+        speed: Keep the recorded pace between the requests, sped up by this factor, e.g. `1`
+            for the original pace or `10` for ten times faster. None to send the requests
+            back to back.
+
+    Returns:
+        The number of `requests`, of cache `hits` and of `errors`, the `hit_ratio`, and the
+        latency percentiles `p50_ms`, `p90_ms`, `p99_ms` and `max_ms`.
+    """
+    hits: list[HookEvent] = []
+    session.hooks.register("on_cache_hit", hits.append)
+    outcomes, latencies, errors = [], [], 0
+    start = time.perf_counter()
+    try:
+        for entry in _paced(entries, speed, start):
+            before = len(hits)
+            began = time.perf_counter()
+            try:
+                session.fetch_page(_endpoint(entry.endpoint), dict(parse_qsl(entry.params)))
+            except Exception:  # noqa: BLE001
+                errors += 1
+            latencies.append(time.perf_counter() - began)
+            outcomes.append(len(hits) > before)
+    finally:
+        session.hooks.unregister("on_cache_hit", hits.append)
+    return {**_report(outcomes, latencies), "errors": errors}
+
+
+def _paced(
+    entries: Iterable[TraceEntry], speed: float | None, start: float
+) -> Iterator[TraceEntry]:
+    for entry in entries:
+        if speed is not None and (delay := entry.ts / speed - (time.perf_counter() - start)) > 0:
+            time.sleep(delay)
+        yield entry
+
+
+def _endpoint(path: str) -> list[str | int]:
+    return [int(x) if x.isdigit() else x for x in path.split("/")]
+
+
+def _report(outcomes: list[bool], latencies: list[float]) -> dict[str, Any]:
+    ordered = sorted(latencies)
+
+    def percentile(share: float) -> float:
+        if not ordered:
+            return 0.0
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * share))] * 1000, 3)
+
+    return {
+        "requests": len(outcomes),
+        "hits": sum(outcomes),
+        "hit_ratio": round(sum(outcomes) / len(outcomes), 4) if outcomes else 0.0,
+        "p50_ms": percentile(0.5),
+        "p90_ms": percentile(0.9),
+        "p99_ms": percentile(0.99),
+        "max_ms": percentile(1.0),
+    }
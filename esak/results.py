@@ -0,0 +1,189 @@
+"""Results module.
+
+This module provides the following classes:
+
+- Results
+"""
+
+__all__ = ["Results"]
+
+import array
+from collections.abc import Callable, Iterable
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from importlib.util import find_spec
+from math import nan
+from operator import attrgetter
+from typing import Any, Literal
+
+from pydantic import AnyUrl
+
+Backend = Literal["auto", "numpy", "arrow", "python"]
+_SCALARS = (bool, int, float, Decimal, str, date, AnyUrl)
+# The module providing each optional backend.
+_MODULES = {"numpy": "numpy", "arrow": "pyarrow"}
+
+
+class Results(list):
+    """A list of results returned by the list endpoints of a `Session`.
+
+    Besides behaving as a normal list, results can be exported as flat records or as typed columns,
+    so aggregations don't need to walk the models attribute by attribute.
+
+    Fields are attribute names of the results, nested attributes are selected with dots,
+    e.g. `"prices.print"`, `"dates.on_sale"` or `"series.id"`.
+    """
+
+    def records(self, fields: Iterable[str] | None = None) -> list[dict[str, Any]]:
+        """Export the results as flat dictionaries.
+
+        Args:
+            fields: Attributes to include, defaults to the top level scalar attributes.
+
+        Returns:
+            A list with a dictionary of field to value for each result.
+        """
+        columns = self._collect(fields)
+        names = list(columns)
+        return [dict(zip(names, row, strict=True)) for row in zip(*columns.values(), strict=True)]
+
+    def to_columns(
+        self, fields: Iterable[str] | None = None, backend: Backend = "auto"
+    ) -> dict[str, Any]:
+        """Export the results as typed columns, built in a single pass over the results.
+
+        Integers, decimals, floats, dates and datetimes become typed arrays, everything else is
+        kept as a list of values. Datetimes with a timezone are converted to UTC.
+
+        Args:
+            fields: Attributes to include, defaults to the top level scalar attributes.
+            backend: "numpy" for NumPy arrays, "arrow" for PyArrow arrays, "python" for
+                `array.array`/lists, or "auto" to use NumPy when it is installed, else PyArrow
+                when it is installed, else Python.
+
+        Returns:
+            A dictionary of field to column.
+
+        Raises:
+            ImportError: If the requested backend is not installed, see the `esak[numpy]` and
+                `esak[arrow]` extras.
+        """
+        if backend == "auto":
+            backend = next((x for x in ("numpy", "arrow") if find_spec(_MODULES[x])), "python")
+        convert = {"numpy": _numpy_column, "arrow": _arrow_column, "python": _python_column}[
+            backend
+        ]
+        return {
+            name: convert(_column_kind(values), values)
+            for name, values in self._collect(fields).items()
+        }
+
+    def _collect(self, fields: Iterable[str] | None) -> dict[str, list[Any]]:
+        names = list(fields) if fields else self._scalar_fields()
+        getters = [_getter(x) for x in names]
+        columns: list[list[Any]] = [[] for _ in names]
+        pairs = list(zip(getters, columns, strict=True))
+        for item in self:
+            for getter, column in pairs:
+                column.append(getter(item))
+        return dict(zip(names, columns, strict=True))
+
+    def _scalar_fields(self) -> list[str]:
+        if not self:
+            return []
+        first = self[0]
+        values = first if isinstance(first, dict) else first.__dict__
+        return [
+            name for name, value in values.items() if value is None or isinstance(value, _SCALARS)
+        ]
+
+
+def _getter(path: str) -> Callable[[Any], Any]:
+    fast = attrgetter(path)
+    parts = path.split(".")
+
+    def get(item: Any) -> Any:  # noqa: ANN401
+        try:
+            return fast(item)
+        except AttributeError:
+            for part in parts:
+                if item is None:
+                    return None
+                item = item.get(part) if isinstance(item, dict) else getattr(item, part)
+            return item
+
+    return get
+
+
+def _column_kind(values: list[Any]) -> str:  # noqa: PLR0911
+    value = next((x for x in values if x is not None), None)
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float | Decimal):
+        return "float"
+    if isinstance(value, datetime):
+        return "datetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, str | AnyUrl):
+        return "str"
+    return "object"
+
+
+def _prepare(kind: str, values: list[Any]) -> list[Any]:
+    if kind == "float":
+        return [nan if x is None else float(x) for x in values]
+    if kind == "datetime":
+        return [x if x is None or x.tzinfo is None else x.astimezone(timezone.utc) for x in values]
+    if kind == "str":
+        return [None if x is None else str(x) for x in values]
+    return values
+
+
+def _python_column(kind: str, values: list[Any]) -> Any:  # noqa: ANN401
+    values = _prepare(kind, values)
+    if kind == "int" and None not in values:
+        return array.array("q", values)
+    if kind == "float":
+        return array.array("d", values)
+    return values
+
+
+def _numpy_column(kind: str, values: list[Any]) -> Any:  # noqa: ANN401
+    import numpy as np  # noqa: PLC0415
+
+    values = _prepare(kind, values)
+    if kind == "int":
+        return np.array(values, dtype=np.int64 if None not in values else np.float64)
+    if kind == "float":
+        return np.array(values, dtype=np.float64)
+    if kind == "bool" and None not in values:
+        return np.array(values, dtype=np.bool_)
+    if kind == "date":
+        return np.array(values, dtype="datetime64[D]")
+    if kind == "datetime":
+        return np.array(
+            [None if x is None else x.replace(tzinfo=None) for x in values], dtype="datetime64[us]"
+        )
+    return np.array(values, dtype=object)
+
+
+def _arrow_column(kind: str, values: list[Any]) -> Any:  # noqa: ANN401
+    import pyarrow as pa  # noqa: PLC0415
+
+    types = {
+        "bool": pa.bool_(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "date": pa.date32(),
+        "datetime": pa.timestamp("us", tz="UTC"),
+        "str": pa.string(),
+    }
+    values = _prepare(kind, values)
+    if kind == "float":
+        return pa.array(values, type=types[kind], from_pandas=True)
+    if kind in types:
+        return pa.array(values, type=types[kind])
+    return pa.array([None if x is None else str(x) for x in values], type=pa.string())
@@ -3,11 +3,21 @@
 This module provides the following classes:
 
 - BaseModel
+
+This module provides the following functions:
+
+- derive_model
+- origin_model
 """
 
-__all__ = ["BaseModel"]
+__all__ = ["BaseModel", "derive_model", "origin_model"]
+
+from copy import copy
+from typing import Any, TypeVar
 
-from pydantic import BaseModel as PydanticModel
+from pydantic import BaseModel as PydanticModel, ConfigDict, field_validator, model_validator
+
+ModelT = TypeVar("ModelT", bound="BaseModel")
 
 
 def to_camel_case(value: str) -> str:
@@ -31,5 +41,87 @@ class BaseModel(
     validate_assignment=True,
     revalidate_instances="always",
     extra="ignore",
+    defer_build=True,
 ):
-    """Base model for esak resources."""
+    """Base model for esak resources.
+
+    Core schemas are built on first use rather than at import, so only the resources a program
+    actually validates pay that cost.
+    """
+
+
+def origin_model(model: type[ModelT]) -> type[ModelT]:
+    """Find the esak model a derived model was built from.
+
+    Args:
+        model: An esak model or a model created by `derive_model`.
+
+    Returns:
+        The original esak model.
+    """
+    return getattr(model, "__esak_origin__", model)
+
+
+def derive_model(  # noqa: PLR0913
+    model: type[ModelT],
+    fields: tuple[str, ...],
+    annotations: dict[str, Any] | None = None,
+    config: ConfigDict | None = None,
+    validators: dict[str, Any] | None = None,
+    *,
+    drop_validators: tuple[str, ...] = (),
+) -> type[ModelT]:
+    """Build a new model from a subset of the fields and the validators of `model`.
+
+    Args:
+        model: The esak model to derive from.
+        fields: Attribute names to keep.
+        annotations: Replacement type annotations, keyed by attribute name.
+        config: Config values to override on top of the config of `model`.
+        validators: Extra validators to add to the new model, keyed by name.
+        drop_validators: Names of model validators of `model` to leave out.
+
+    Returns:
+        A new model class with the same name as `model`.
+    """
+    annotations = annotations or {}
+    namespace: dict[str, Any] = {
+        "__module__": model.__module__,
+        "__qualname__": model.__qualname__,
+        "__doc__": model.__doc__,
+        "__esak_origin__": origin_model(model),
+        "__annotations__": {},
+        "model_config": {**model.model_config, **(config or {})},
+    }
+    for klass in reversed(model.__mro__[: model.__mro__.index(BaseModel)]):
+        namespace.update(
+            (name, value)
+            for name, value in vars(klass).items()
+            if not name.startswith("__") and name not in {"model_config", "_abc_impl"}
+        )
+    for name in fields:
+        info = model.model_fields[name]
+        namespace["__annotations__"][name] = annotations.get(name, info.annotation)
+        namespace[name] = copy(info)
+
+    decorators = model.__pydantic_decorators__
+    for name, decorator in decorators.field_validators.items():
+        kept = [x for x in decorator.info.fields if x in fields]
+        if kept:
+            namespace[name] = field_validator(*kept, mode=decorator.info.mode)(
+                _unwrap(decorator.func)
+            )
+    for name, decorator in decorators.model_validators.items():
+        if name in drop_validators:
+            namespace.pop(name, None)
+        else:
+            namespace[name] = model_validator(mode=decorator.info.mode)(_unwrap(decorator.func))
+    for name, private in model.__private_attributes__.items():
+        namespace[name] = copy(private)
+    namespace.update(validators or {})
+
+    return type(model.__name__, (BaseModel,), namespace)
+
+
+def _unwrap(func: Any) -> Any:  # noqa: ANN401
+    return getattr(func, "__func__", func)
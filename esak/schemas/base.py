@@ -8,12 +8,26 @@ This module provides the following classes:
 __all__ = ["BaseResource"]
 
 from datetime import datetime
-
-from pydantic import Field, HttpUrl, field_validator
-
-from esak.schemas import BaseModel
+from typing import TYPE_CHECKING, Any
+
+from pydantic import (
+    Field,
+    HttpUrl,
+    PrivateAttr,
+    ValidatorFunctionWrapHandler,
+    field_validator,
+    model_validator,
+)
+
+from esak.results import Results
+from esak.schemas import BaseModel, origin_model
+from esak.schemas.dates import parse_datetime
+from esak.schemas.generic import ResourceList
 from esak.schemas.urls import Urls
 
+if TYPE_CHECKING:
+    from esak.session import Session
+
 
 class BaseResource(BaseModel):
     r"""Base resource for esak resources.
@@ -32,17 +46,42 @@ class BaseResource(BaseModel):
     thumbnail: HttpUrl | None = None
     urls: Urls | None = None
 
+    _resource_lists: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)
+    _related: dict[str, Results] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="wrap")
+    def keep_resource_lists(cls, data: Any, handler: ValidatorFunctionWrapHandler) -> Any:  # noqa: ANN401
+        """Keep the counts of the embedded resource lists which are reduced to their items.
+
+        Args:
+            data: Input data of the model
+            handler: The validator of the model
+
+        Returns:
+            The validated model
+        """
+        instance = handler(data)
+        if isinstance(data, dict):
+            instance._resource_lists = {  # noqa: SLF001
+                key: {x: value.get(x) for x in ("available", "returned", "collectionURI")}
+                for key, value in data.items()
+                if isinstance(value, dict) and "available" in value
+            }
+        elif isinstance(data, BaseModel) and data is not instance:
+            instance._resource_lists = getattr(data, "_resource_lists", {})  # noqa: SLF001
+        return instance
+
     @field_validator("modified", mode="before")
-    def check_modified(cls, value: str) -> str | None:
-        """Check if modified date starts with '-'.
+    def check_modified(cls, value: str | datetime | None) -> datetime | None:
+        """Parse the modified date, ignoring placeholder dates which start with '-'.
 
         Args:
             value: String value of modified
 
         Returns:
-            Input value or None
+            Parsed datetime or None
         """
-        return value if value[0] != "-" else None
+        return parse_datetime(value)
 
     @field_validator("thumbnail", mode="before")
     def dict_to_image_url(cls, value: dict[str, str] | None) -> str | None:
@@ -67,3 +106,65 @@ class BaseResource(BaseModel):
             Dict of type to url mapped from list or None
         """
         return {x["type"]: x["url"] for x in value} if value else None
+
+    def resource_list(self, name: str) -> ResourceList | None:
+        """Get the counts of an embedded list, e.g. `"characters"`.
+
+        Marvel only embeds the first 20 items of each list, the counts show whether more are
+        available.
+
+        Args:
+            name: Attribute name of the list.
+
+        Returns:
+            A `ResourceList` object or None if the list was not part of the response.
+        """
+        if (value := self._resource_lists.get(name)) is None:
+            return None
+        return ResourceList.model_validate(value)
+
+    def related(self, name: str) -> Results | None:
+        """Get a related list requested with `include`, e.g. `comic(1, include=["characters"])`.
+
+        Only the first page of the list is included, up to 20 items, `complete` requests the
+        others.
+
+        Args:
+            name: Name of the related list, e.g. `"characters"`.
+
+        Returns:
+            `Results` holding full models of the related items or None if the list was not
+            included.
+        """
+        return self._related.get(name)
+
+    def complete(self, name: str, session: "Session", page_size: int = 100) -> Results:
+        """Fetch the items of an embedded list which were left out of the response.
+
+        Only the remainder is requested, through the matching paginated `Session` endpoint, e.g.
+        `comic_characters` for the `characters` of a `Comic`. The embedded items are assumed to
+        be the first items of that endpoint.
+
+        Args:
+            name: Attribute name of the list, e.g. `"characters"`.
+            session: The session to request the missing items with.
+            page_size: The number of items to request per call, up to 100.
+
+        Returns:
+            `Results` holding full models of the missing items, empty if nothing is missing.
+
+        Raises:
+            ValueError: If the resource has no embedded list called `name`.
+        """
+        if (resource_list := self.resource_list(name)) is None:
+            raise ValueError(f"{type(self).__name__} has no resource list {name!r}")
+        endpoint = getattr(session, f"{origin_model(type(self)).__name__.lower()}_{name}")
+        results = Results()
+        offset = resource_list.returned
+        while offset < resource_list.available:
+            page = endpoint(self.id, {"offset": offset, "limit": page_size})
+            if not page:
+                break
+            results.extend(page)
+            offset += len(page)
+        return results
@@ -6,13 +6,14 @@ This module provides the following classes:
 """
 
 __all__ = ["Comic"]
-from datetime import date, datetime
+from datetime import date
 from decimal import Decimal
 
 from pydantic import ConfigDict, Field, HttpUrl, field_validator
 
 from esak.schemas import BaseModel
 from esak.schemas.base import BaseResource
+from esak.schemas.dates import parse_date
 from esak.schemas.generic import GenericCreator, GenericItem, GenericStory
 
 
@@ -41,12 +42,7 @@ class Dates(BaseModel):
         Returns:
             Parsed date or None
         """
-        if value:
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except ValueError:
-                return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").date()
-        return None
+        return parse_date(value)
 
 
 class Prices(BaseModel):
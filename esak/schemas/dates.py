@@ -0,0 +1,119 @@
+"""The Dates module.
+
+This module provides the following functions:
+
+- parse_date
+- parse_datetime
+- utc_timestamp
+"""
+
+__all__ = ["parse_date", "parse_datetime", "utc_timestamp"]
+
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from pydantic import TypeAdapter, ValidationError
+
+# Matches the formats Marvel uses: "2021-08-25", "2008-05-19 00:00:00" and
+# "2021-08-25T00:00:00-0400", with or without a colon in the offset, and fractional seconds.
+_PATTERN = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?(?:Z|([+-])(\d{2}):?(\d{2}))?)?"
+)
+# Parses the other ISO 8601 timestamps pydantic accepts, e.g. without seconds.
+_DATETIME = TypeAdapter(datetime)
+_UTC_OFFSETS: dict[str, timezone] = {}
+
+
+def parse_date(value: str | date | None) -> date | None:
+    """Parse the date part of a Marvel date or timestamp string.
+
+    Args:
+        value: String value to parse as date
+
+    Returns:
+        Parsed date or None if the value is empty or a placeholder such as "-0001-11-30".
+
+    Raises:
+        ValueError: If the value is not in a known format.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if value[0] == "-":
+        return None
+    if not (match := _PATTERN.fullmatch(value)):
+        raise ValueError(f"Unknown date format: {value!r}")
+    return date(int(match[1]), int(match[2]), int(match[3]))
+
+
+def parse_datetime(value: str | datetime | None) -> datetime | None:
+    """Parse a Marvel timestamp string.
+
+    The formats Marvel uses are parsed directly, other ISO 8601 timestamps are parsed by pydantic.
+
+    Args:
+        value: String value to parse as datetime
+
+    Returns:
+        Parsed datetime, timezone aware if the value has an offset, or None if the value is empty
+        or a placeholder such as "-0001-11-30T00:00:00-0500".
+
+    Raises:
+        ValueError: If the value is not in a known format.
+    """
+    if not value:
+        return None
+    if isinstance(value, datetime):
+        return value
+    if value[0] == "-":
+        return None
+    if not (match := _PATTERN.fullmatch(value)):
+        try:
+            return _DATETIME.validate_python(value)
+        except ValidationError as err:
+            raise ValueError(f"Unknown datetime format: {value!r}") from err
+    year, month, day, hour, minute, second, fraction, sign, offset_hour, offset_minute = (
+        match.groups()
+    )
+    tzinfo = None
+    if sign:
+        key = f"{sign}{offset_hour}{offset_minute}"
+        if (tzinfo := _UTC_OFFSETS.get(key)) is None:
+            offset = timedelta(hours=int(offset_hour), minutes=int(offset_minute))
+            tzinfo = _UTC_OFFSETS[key] = timezone(-offset if sign == "-" else offset)
+    elif value.endswith("Z"):
+        tzinfo = timezone.utc
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo=tzinfo,
+    )
+
+
+def utc_timestamp(value: str | datetime | None) -> str | None:
+    """Convert a Marvel timestamp to an ISO 8601 string in UTC, which sorts chronologically.
+
+    Args:
+        value: String value to convert, timestamps without an offset are taken as UTC.
+
+    Returns:
+        The timestamp in UTC, e.g. "2021-08-25T04:00:00+00:00", or None if the value is empty or
+        a placeholder.
+
+    Raises:
+        ValueError: If the value is not in a known format.
+    """
+    if (timestamp := parse_datetime(value)) is None:
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc).isoformat()
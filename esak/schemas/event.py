@@ -6,11 +6,12 @@ This module provides the following classes:
 """
 
 __all__ = ["Event"]
-from datetime import date, datetime
+from datetime import date
 
 from pydantic import field_validator
 
 from esak.schemas.base import BaseResource
+from esak.schemas.dates import parse_date
 from esak.schemas.generic import GenericCreator, GenericItem, GenericStory
 
 
@@ -53,7 +54,7 @@ class Event(BaseResource):
         Returns:
             Parsed date or None
         """
-        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S").date() if value else None
+        return parse_date(value)
 
     @field_validator("creators", "characters", "stories", "comics", "series", mode="before")
     def map_generic_items(cls, value: dict) -> list[dict]:
@@ -0,0 +1,68 @@
+"""The Frozen module.
+
+This module provides the following functions:
+
+- freeze
+"""
+
+__all__ = ["freeze"]
+
+from functools import cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+
+from pydantic import ConfigDict
+
+from esak.schemas import BaseModel, ModelT, derive_model
+
+FROZEN_CONFIG = ConfigDict(frozen=True, validate_assignment=False, revalidate_instances="never")
+# Model validators which only keep attributes in line when others are assigned, which frozen models
+# don't allow.
+ASSIGNMENT_VALIDATORS = ("sync_id",)
+
+
+def freeze(model: type[ModelT]) -> type[ModelT]:
+    """Create a read-only, hashable variant of `model`.
+
+    Instances of the variant can't be changed, so they can be shared, e.g. through the identity
+    map, or used as dict keys. Lists are stored as tuples and nested models are frozen as well.
+    Instances are not revalidated when nested in other models, and the validators which only keep
+    attributes in line on assignment, e.g. the id of a `GenericItem`, are left out, so results are
+    validated faster than with `model`, see `benchmarks/frozen_models.py`. Variants are cached, so
+    the same class is returned for each call.
+
+    Args:
+        model: The esak model to freeze.
+
+    Returns:
+        A frozen model class.
+    """
+    if model.model_config.get("frozen"):
+        return model
+    return _freeze(model)
+
+
+@cache
+def _freeze(model: type[BaseModel]) -> type[BaseModel]:
+    annotations = {
+        name: _freeze_annotation(info.annotation) for name, info in model.model_fields.items()
+    }
+    return derive_model(
+        model,
+        tuple(model.model_fields),
+        annotations,
+        FROZEN_CONFIG,
+        drop_validators=ASSIGNMENT_VALIDATORS,
+    )
+
+
+def _freeze_annotation(annotation: Any) -> Any:  # noqa: ANN401
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return freeze(annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list:
+        return tuple[_freeze_annotation(args[0]), ...]
+    if origin in (Union, UnionType):
+        return Union[tuple(_freeze_annotation(x) for x in args)]  # noqa: UP007
+    return annotation
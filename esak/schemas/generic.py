@@ -2,37 +2,121 @@
 
 This module provides the following classes:
 
+- CompactCreator
+- CompactItem
+- CompactStory
+- GenericCreator
 - GenericItem
 - GenericStory
-- GenericCreator
+- ResourceList
 """
 
-__all__ = ["GenericCreator", "GenericItem", "GenericStory"]
+__all__ = [
+    "CompactCreator",
+    "CompactItem",
+    "CompactStory",
+    "GenericCreator",
+    "GenericItem",
+    "GenericStory",
+    "ResourceList",
+]
 
-from pydantic import Field, HttpUrl
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import Field, HttpUrl, model_validator
 
 from esak.schemas import BaseModel
 
 
+@dataclass(frozen=True, slots=True)
+class CompactItem:
+    """The CompactItem object is a lightweight, read-only version of a GenericItem.
+
+    Sessions always return `GenericItem` objects, callers must convert the items they keep, e.g.
+    `[x.compact() for x in comic.characters]`.
+
+    Attributes:
+        id: The unique ID of the Generic resource.
+        name: The name of the Generic Item.
+        resource_uri: The path to the generic resource.
+    """
+
+    id: int
+    name: str
+    resource_uri: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompactStory(CompactItem):
+    """The CompactStory object is a lightweight, read-only version of a GenericStory.
+
+    Attributes:
+        type: The story type.
+    """
+
+    type: str
+
+
+@dataclass(frozen=True, slots=True)
+class CompactCreator(CompactItem):
+    """The CompactCreator object is a lightweight, read-only version of a GenericCreator.
+
+    Attributes:
+        role: The role of the creator in the parent entity.
+    """
+
+    role: str
+
+
 class GenericItem(BaseModel):
     """The GenericItem object contains basic information.
 
     Attributes:
         name: The name of the Generic Item.
         resource_uri: The path to the generic resource.
+        id: The unique ID of the Generic resource, parsed from the resource_uri whenever it is
+            set.
     """
 
     name: str
     resource_uri: HttpUrl = Field(alias="resourceURI")
+    id: int
 
-    @property
-    def id(self) -> int:
+    @model_validator(mode="before")
+    def parse_id(cls, data: Any) -> Any:  # noqa: ANN401
         """Pull the id number from the resource_uri.
 
+        Args:
+            data: Input data of the model
+
         Returns:
-            The unique ID of the Generic resource.
+            Input data with the id added
         """
-        return int(self.resource_uri.__str__().split("/")[-1])
+        if isinstance(data, dict) and "id" not in data:
+            uri = data.get("resourceURI", data.get("resource_uri"))
+            if uri is not None:
+                return {**data, "id": str(uri).rsplit("/", 1)[-1]}
+        return data
+
+    @model_validator(mode="after")
+    def sync_id(self) -> "GenericItem":  # noqa: N804
+        """Parse the id from the resource_uri again, which also runs when it is reassigned.
+
+        Returns:
+            The model with its id matching the resource_uri
+        """
+        if (uri := self.__dict__.get("resource_uri")) is not None:
+            self.__dict__["id"] = int(str(uri).rsplit("/", 1)[-1])
+        return self
+
+    def compact(self) -> CompactItem:
+        """Convert to a slotted object which uses less memory.
+
+        Returns:
+            A `CompactItem` object.
+        """
+        return CompactItem(self.id, self.name, str(self.resource_uri))
 
 
 class GenericStory(GenericItem):
@@ -44,6 +128,14 @@ class GenericStory(GenericItem):
 
     type: str
 
+    def compact(self) -> CompactStory:
+        """Convert to a slotted object which uses less memory.
+
+        Returns:
+            A `CompactStory` object.
+        """
+        return CompactStory(self.id, self.name, str(self.resource_uri), self.type)
+
 
 class GenericCreator(GenericItem):
     """The GenericCreator object extends the GenericItem object to include role information.
@@ -53,3 +145,43 @@ class GenericCreator(GenericItem):
     """
 
     role: str
+
+    def compact(self) -> CompactCreator:
+        """Convert to a slotted object which uses less memory.
+
+        Returns:
+            A `CompactCreator` object.
+        """
+        return CompactCreator(self.id, self.name, str(self.resource_uri), self.role)
+
+
+class ResourceList(BaseModel):
+    """The ResourceList object describes how complete an embedded list of GenericItems is.
+
+    Attributes:
+        available: The number of total available items in this list.
+        returned: The number of items returned in the embedded list (up to 20).
+        collection_uri: The path to the full list of items in this collection.
+    """
+
+    available: int
+    returned: int
+    collection_uri: HttpUrl = Field(alias="collectionURI")
+
+    @property
+    def is_truncated(self) -> bool:
+        """Whether the embedded list holds fewer items than are available.
+
+        Returns:
+            True if there are more items available than returned.
+        """
+        return self.available > self.returned
+
+    @property
+    def missing(self) -> int:
+        """The number of items not included in the embedded list.
+
+        Returns:
+            Count of available items which were not returned.
+        """
+        return max(self.available - self.returned, 0)
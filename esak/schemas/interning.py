@@ -0,0 +1,153 @@
+"""The Interning module.
+
+This module provides the following classes:
+
+- InternPool
+
+This module provides the following functions:
+
+- interned
+"""
+
+__all__ = ["InternPool", "interned"]
+
+from functools import cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
+from weakref import WeakValueDictionary
+
+from pydantic import ValidationInfo, ValidatorFunctionWrapHandler, model_validator
+
+from esak.schemas import BaseModel, ModelT, derive_model, origin_model
+from esak.schemas.generic import GenericItem
+
+CONTEXT_KEY = "intern_pool"
+# The default number of distinct strings shared by a pool.
+MAX_STRINGS = 100_000
+
+
+class InternPool:
+    """The InternPool object shares repeated values between validated models.
+
+    Identical `GenericItem`, `GenericStory` and `GenericCreator` values are validated once and the
+    same instance is reused afterwards, while string attributes of every model are deduplicated.
+
+    Shared items are held through weak references and are dropped from the pool once no model
+    uses them. Shared strings are kept until the pool is cleared, up to `max_strings` of them;
+    further strings aren't deduplicated. Shared instances are returned to every model using them,
+    so modifying one modifies all of them: only use the pool with frozen models, as `Session`
+    does.
+
+    Args:
+        max_strings: The number of distinct strings to share.
+    """
+
+    def __init__(self, max_strings: int = MAX_STRINGS) -> None:
+        self.items: WeakValueDictionary[tuple, BaseModel] = WeakValueDictionary()
+        self.strings: dict[str, str] = {}
+        self.max_strings = max_strings
+
+    def __len__(self) -> int:
+        """Number of live shared item instances in the pool."""
+        return len(self.items)
+
+    def clear(self) -> None:
+        """Remove all shared values from the pool."""
+        self.items.clear()
+        self.strings.clear()
+
+    def intern_strings(self, instance: ModelT) -> ModelT:
+        """Replace the string attributes of a model with their shared copies.
+
+        Args:
+            instance: The model to update in place.
+
+        Returns:
+            The same model.
+        """
+        values = instance.__dict__
+        strings = self.strings
+        for name, value in values.items():
+            if type(value) is str:
+                if (shared := strings.get(value)) is not None:
+                    values[name] = shared
+                elif len(strings) < self.max_strings:
+                    strings[value] = value
+        return instance
+
+
+def interned(model: type[ModelT]) -> type[ModelT]:
+    """Create a variant of `model` which uses the `InternPool` in the validation context.
+
+    Validation behaves as normal unless a pool is passed with
+    `validate_python(data, context={"intern_pool": pool})`. Variants are cached, so the same class
+    is returned for each call.
+
+    Args:
+        model: The esak model to use the pool with.
+
+    Returns:
+        A model class which shares values through the pool.
+    """
+    if "intern_values" in model.__pydantic_decorators__.model_validators:
+        return model
+    return _interned(model)
+
+
+@cache
+def _interned(model: type[BaseModel]) -> type[BaseModel]:
+    annotations = {
+        name: _interned_annotation(info.annotation) for name, info in model.model_fields.items()
+    }
+    validator = _share_instance if issubclass(origin_model(model), GenericItem) else _intern_strings
+    return derive_model(
+        model,
+        tuple(model.model_fields),
+        annotations,
+        validators={"intern_values": model_validator(mode="wrap")(validator)},
+    )
+
+
+def _interned_annotation(annotation: Any) -> Any:  # noqa: ANN401
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return interned(annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is list:
+        return list[_interned_annotation(args[0])]
+    if origin is tuple:
+        return tuple[tuple(_interned_annotation(x) for x in args)]
+    if origin in (Union, UnionType):
+        return Union[tuple(_interned_annotation(x) for x in args)]  # noqa: UP007
+    return annotation
+
+
+def _share_instance(
+    cls: type[BaseModel],
+    data: Any,  # noqa: ANN401
+    handler: ValidatorFunctionWrapHandler,
+    info: ValidationInfo,
+) -> BaseModel:
+    pool = info.context.get(CONTEXT_KEY) if info.context else None
+    if pool is None or not isinstance(data, dict):
+        return handler(data)
+    try:
+        key = (cls, *data.items())
+        return pool.items[key]
+    except KeyError:
+        instance = pool.items[key] = pool.intern_strings(handler(data))
+        return instance
+    except TypeError:
+        return pool.intern_strings(handler(data))
+
+
+def _intern_strings(
+    cls: type[BaseModel],  # noqa: ARG001
+    data: Any,  # noqa: ANN401
+    handler: ValidatorFunctionWrapHandler,
+    info: ValidationInfo,
+) -> BaseModel:
+    pool = info.context.get(CONTEXT_KEY) if info.context else None
+    if pool is None:
+        return handler(data)
+    return pool.intern_strings(handler(data))
@@ -0,0 +1,42 @@
+"""The Projection module.
+
+This module provides the following functions:
+
+- project
+"""
+
+__all__ = ["project"]
+
+from collections.abc import Iterable
+from functools import lru_cache
+
+from esak.schemas import BaseModel, ModelT, derive_model
+
+
+def project(model: type[ModelT], fields: Iterable[str] | None = None) -> type[ModelT]:
+    """Create a model containing only the requested fields of `model`.
+
+    Projected models are cached, so asking for the same set of fields again returns the same
+    class. Validation then only parses the requested fields, the rest of the record is ignored.
+
+    Args:
+        model: The esak model to project.
+        fields: Attribute names to keep, if empty or None the model is returned unchanged.
+
+    Returns:
+        A model class with only the requested fields.
+
+    Raises:
+        ValueError: If any of the fields are not attributes of the model.
+    """
+    if not fields:
+        return model
+    requested = set(fields)
+    if unknown := requested - model.model_fields.keys():
+        raise ValueError(f"{model.__name__} has no field(s): {', '.join(sorted(unknown))}")
+    return _project(model, tuple(x for x in model.model_fields if x in requested))
+
+
+@lru_cache(maxsize=256)
+def _project(model: type[BaseModel], fields: tuple[str, ...]) -> type[BaseModel]:
+    return derive_model(model, fields)
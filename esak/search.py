@@ -0,0 +1,243 @@
+"""Search module.
+
+This module provides the following classes:
+
+- SearchIndex
+"""
+
+__all__ = ["SearchIndex"]
+
+import json
+import re
+import sqlite3
+import threading
+from typing import Any
+
+from esak.results import Results
+from esak.schemas.base import BaseResource
+from esak.schemas.character import Character
+from esak.schemas.comic import Comic
+from esak.schemas.creator import Creator
+from esak.schemas.dates import utc_timestamp
+from esak.schemas.event import Event
+from esak.schemas.series import Series
+from esak.sqlite_cache import SqliteCache
+from esak.store import EntityStore, cached_results
+
+# The resources which can be searched, with their model and the key holding their name.
+SEARCHABLE: dict[str, tuple[type[BaseResource], str]] = {
+    "characters": (Character, "name"),
+    "comics": (Comic, "title"),
+    "creators": (Creator, "fullName"),
+    "events": (Event, "title"),
+    "series": (Series, "title"),
+}
+# The values of `orderBy` which sort on the name, per resource, as accepted by Marvel.
+NAME_ORDER = {"characters": "name", "comics": "title", "events": "name", "series": "title"}
+DEFAULT_LIMIT = 20
+
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+class SearchIndex:
+    """The SearchIndex object answers name lookups locally with a SQLite FTS5 index.
+
+    Names of characters, comics, creators, events and series are indexed from mirrored or cached
+    results. `starts_with` answers the same queries as the `nameStartsWith` and `titleStartsWith`
+    parameters of the list endpoints, in the same order, and `search` matches any word of a name.
+
+    The index implements the `esak.sync.Store` interface, so it can be kept up to date by `Sync`.
+
+    Args:
+        db_name: Path and database name to use.
+
+    Raises:
+        RuntimeError: If the SQLite library was built without FTS5.
+    """
+
+    def __init__(self, db_name: str = "esak_search.db") -> None:
+        self.con = sqlite3.connect(db_name, check_same_thread=False)
+        self.lock = threading.Lock()
+        try:
+            with self.lock, self.con:
+                self.con.executescript(
+                    """
+                    CREATE TABLE IF NOT EXISTS entries (
+                        rowid INTEGER PRIMARY KEY, resource TEXT, id INTEGER, name TEXT,
+                        modified TEXT, json TEXT, UNIQUE (resource, id)
+                    );
+                    CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+                        name, content='entries', content_rowid='rowid',
+                        tokenize='unicode61 remove_diacritics 2'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+                        INSERT INTO entries_fts(rowid, name) VALUES (new.rowid, new.name);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+                        INSERT INTO entries_fts(entries_fts, rowid, name)
+                        VALUES ('delete', old.rowid, old.name);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS entries_update AFTER UPDATE ON entries BEGIN
+                        INSERT INTO entries_fts(entries_fts, rowid, name)
+                        VALUES ('delete', old.rowid, old.name);
+                        INSERT INTO entries_fts(rowid, name) VALUES (new.rowid, new.name);
+                    END;
+                    """
+                )
+        except sqlite3.OperationalError as err:
+            raise RuntimeError(f"SQLite full-text search is not available: {err}") from err
+
+    def __len__(self) -> int:
+        """Number of indexed entities."""
+        with self.lock:
+            return self.con.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def upsert(self, resource: str, results: list[dict[str, Any]]) -> None:
+        """Index the names of entities, replacing older copies of them.
+
+        Results of resources which can't be searched, e.g. stories, are ignored.
+
+        Args:
+            resource: The resource name, e.g. `"characters"`.
+            results: The unvalidated results from Marvel.
+        """
+        if resource not in SEARCHABLE:
+            return
+        key = SEARCHABLE[resource][1]
+        rows = [
+            (resource, x["id"], x.get(key) or "", utc_timestamp(x.get("modified")), json.dumps(x))
+            for x in results
+        ]
+        with self.lock, self.con:
+            self.con.executemany(
+                "INSERT INTO entries(resource, id, name, modified, json) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (resource, id) DO UPDATE SET name = excluded.name, "
+                "modified = excluded.modified, json = excluded.json "
+                "WHERE COALESCE(excluded.modified, '') >= COALESCE(entries.modified, '')",
+                rows,
+            )
+
+    def import_cache(self, cache: SqliteCache) -> int:
+        """Index the entities of every list and entity response in a cache.
+
+        Args:
+            cache: The cache to read the responses from.
+
+        Returns:
+            The number of results read.
+        """
+        count = 0
+        for resource, results, _ in cached_results(cache):
+            self.upsert(resource, results)
+            count += len(results)
+        return count
+
+    def import_store(self, store: EntityStore) -> int:
+        """Index the entities of an `EntityStore`.
+
+        Args:
+            store: The store to read the entities from.
+
+        Returns:
+            The number of entities read.
+        """
+        count = 0
+        for resource in SEARCHABLE:
+            for results in store.batches(resource):
+                self.upsert(resource, results)
+                count += len(results)
+        return count
+
+    def starts_with(
+        self, resource: str, prefix: str, params: dict[str, Any] | None = None
+    ) -> Results:
+        """Find the entities whose name starts with `prefix`, ignoring case.
+
+        The full-text index narrows the candidates down to names whose words start like the
+        prefix, which are then checked against the whole prefix.
+
+        Args:
+            resource: The resource name, e.g. `"characters"`.
+            prefix: The start of the name, as passed to `nameStartsWith` or `titleStartsWith`.
+            params: `orderBy`, `limit` and `offset` as passed to the list endpoints. Results are
+                ordered by name unless `orderBy` is `modified` or `-modified`.
+
+        Returns:
+            `Results` of models.
+
+        Raises:
+            ValueError: If the resource can't be searched or a parameter is not supported.
+        """
+        query = None
+        if tokens := _TOKEN.findall(prefix):
+            # A complete last word must not match longer words.
+            query = "^" + _phrase(tokens) + (" *" if _TOKEN.fullmatch(prefix[-1]) else "")
+        return self._query(resource, params, query, prefix)
+
+    def search(self, resource: str, text: str, params: dict[str, Any] | None = None) -> Results:
+        """Find the entities with a word in their name starting with each word of `text`.
+
+        Args:
+            resource: The resource name, e.g. `"characters"`.
+            text: The words to look for, in any order, e.g. `"park spid"`.
+            params: `orderBy`, `limit` and `offset` as passed to the list endpoints. Results are
+                ordered by relevance unless `orderBy` is given.
+
+        Returns:
+            `Results` of models.
+
+        Raises:
+            ValueError: If the resource can't be searched or a parameter is not supported.
+        """
+        if not (tokens := _TOKEN.findall(text)):
+            return Results()
+        query = " AND ".join(f"{_phrase([x])} *" for x in tokens)
+        return self._query(resource, params, query, relevance=True)
+
+    def _query(
+        self,
+        resource: str,
+        params: dict[str, Any] | None,
+        query: str | None = None,
+        prefix: str | None = None,
+        *,
+        relevance: bool = False,
+    ) -> Results:
+        if resource not in SEARCHABLE:
+            raise ValueError(f"Unknown resource: {resource!r}")
+        params = params or {}
+        if unsupported := set(params) - {"orderBy", "limit", "offset"}:
+            raise ValueError(f"Unsupported parameter: {', '.join(sorted(unsupported))}")
+        order_by = params.get("orderBy")
+        if order_by is None:
+            order = "rank" if relevance else "e.name COLLATE NOCASE"
+        elif order_by.removeprefix("-") == NAME_ORDER.get(resource):
+            order = "e.name COLLATE NOCASE"
+        elif order_by.removeprefix("-") == "modified":
+            order = "e.modified"
+        else:
+            raise ValueError(f"Unsupported orderBy for {resource}: {order_by!r}")
+        if order_by and order_by.startswith("-"):
+            order += " DESC"
+        source, conditions, args = "entries AS e", ["e.resource = ?"], [resource]
+        if query is not None:
+            source = "entries_fts JOIN entries AS e ON e.rowid = entries_fts.rowid"
+            conditions.append("entries_fts MATCH ?")
+            args.append(query)
+        if prefix is not None:
+            escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append("e.name LIKE ? ESCAPE '\\'")
+            args.append(f"{escaped}%")
+        sql = (
+            f"SELECT e.json FROM {source} WHERE {' AND '.join(conditions)} "  # noqa: S608
+            f"ORDER BY {order}, e.id LIMIT ? OFFSET ?"
+        )
+        args.extend([int(params.get("limit", DEFAULT_LIMIT)), int(params.get("offset", 0))])
+        with self.lock:
+            rows = self.con.execute(sql, args).fetchall()
+        model = SEARCHABLE[resource][0]
+        return Results(model.model_validate(json.loads(x[0])) for x in rows)
+
+
+def _phrase(tokens: list[str]) -> str:
+    return '"' + " ".join(tokens) + '"'
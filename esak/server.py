@@ -0,0 +1,327 @@
+"""Server module.
+
+This module provides the following classes:
+
+- StandInServer
+
+This module provides the following functions:
+
+- load_fixtures
+"""
+
+__all__ = ["FAULTS", "StandInServer", "load_fixtures"]
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter, deque
+from hashlib import md5
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlparse
+
+from esak.session import RESOURCE_MODELS
+from esak.sqlite_cache import SqliteCache
+
+# The injectable faults: an internal error, an unavailable gateway, a connection closed
+# without a response and a truncated JSON body.
+FAULTS = ("error", "unavailable", "disconnect", "malformed")
+AUTH_PARAMS = frozenset({"apikey", "hash", "ts"})
+MAX_LIMIT = 100
+PREFIX = "/v1/public/"
+
+_PATH = re.compile(r"(\w+)(?:/(\d+)(?:/(\w+))?)?")
+
+
+def load_fixtures(
+    path: str | Path,
+) -> tuple[dict[str, dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """Load the responses recorded in a cache database.
+
+    Args:
+        path: The `SqliteCache` database, e.g. one filled by a `Session` or the test fixtures.
+
+    Returns:
+        The recorded data of each response by canonical path, e.g. `"comics/16926"` or
+        `"comics?title=Hulk"`, and the distinct recorded results of each resource.
+    """
+    responses: dict[str, dict[str, Any]] = {}
+    records: dict[str, dict[int, dict[str, Any]]] = {}
+    for key, data in SqliteCache(str(path)).items():
+        url = urlparse(key)
+        if PREFIX not in url.path or not isinstance(data, dict):
+            continue
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        canonical = _canonical(url.path.split(PREFIX, 1)[1], params)
+        responses[canonical] = data
+        if match := _PATH.fullmatch(canonical.split("?", 1)[0]):
+            resource = match[3] or match[1]
+            for result in data.get("results", ()):
+                records.setdefault(resource, {})[result["id"]] = result
+    return responses, {k: list(v.values()) for k, v in records.items()}
+
+
+def _canonical(path: str, params: dict[str, str]) -> str:
+    params = {k: v for k, v in params.items() if k not in AUTH_PARAMS}
+    return f"{path}?{urlencode(sorted(params.items()))}" if params else path
+
+
+def _check_paging(params: dict[str, str]) -> str | None:
+    limit, offset = params.get("limit", "20"), params.get("offset", "0")
+    if not limit.isdecimal() or int(limit) < 1:
+        return "You must pass an integer limit greater than 0."
+    if int(limit) > MAX_LIMIT:
+        return "You may not request more than 100 items."
+    if not offset.isdecimal():
+        return "You must pass an integer offset greater than or equal to 0."
+    return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "StandInServer"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = dict(parse_qsl(url.query, keep_blank_values=True))
+        status, body, fault = self.server.respond(url.path, params)
+        if fault == "disconnect":
+            self.close_connection = True
+            return
+        headers = {"Content-Type": "application/json"}
+        if (remaining := self.server.quota_remaining()) is not None:
+            headers["X-RateLimit-Remaining"] = str(remaining)
+        if status == 200:  # noqa: PLR2004
+            headers["ETag"] = f'"{body["etag"]}"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, body = 304, None
+        payload = json.dumps(body).encode() if body is not None else b""
+        if fault == "malformed":
+            payload = payload[: len(payload) // 2]
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        """Don't log requests."""
+
+
+class StandInServer(ThreadingHTTPServer):
+    """The StandInServer object serves a local stand-in for `gateway.marvel.com/v1/public`.
+
+    Requests recorded in a cache database are answered with the recorded data. Other requests
+    for a resource, its entities or its related lists are answered with synthetic results:
+    the recorded results of the resource, cycled with new ids, `total` of them per list.
+    Parameters other than `offset` and `limit` are ignored for synthetic results.
+
+    Like Marvel, the server requires an `apikey`, rejects a `limit` above 100 or a `limit` or
+    `offset` which isn't a valid integer with a 409 error, and adds an `etag` to each
+    response, answering `304 Not Modified` when it matches `If-None-Match`.
+
+    Args:
+        fixtures: The cache database to serve the recorded responses of, None to serve only
+            synthetic results, which then need `records`.
+        records: Results to create synthetic results from, by resource, in addition to those
+            of the fixtures.
+        host: The address to listen on.
+        port: The port to listen on, by default any free port.
+        total: The number of synthetic results of each list.
+        latency: The number of seconds to wait before each response.
+        jitter: A random number of seconds up to this is added to or removed from the latency.
+        quota: The number of requests allowed per `quota_window`, answered with `429` beyond.
+            None for no limit.
+        quota_window: The number of seconds after which the quota is reset.
+        fault_rate: The probability of a request failing with one of `faults`.
+        faults: The faults to pick from at random, see `FAULTS`.
+        seed: Seed of the random latency and faults, to reproduce a run.
+    """
+
+    daemon_threads = True
+
+    def __init__(  # noqa: PLR0913
+        self,
+        fixtures: str | Path | None = None,
+        *,
+        records: dict[str, list[dict[str, Any]]] | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        total: int = 1000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        quota: int | None = None,
+        quota_window: float = 86400.0,
+        fault_rate: float = 0.0,
+        faults: tuple[str, ...] = ("error",),
+        seed: int | None = None,
+    ) -> None:
+        if unknown := set(faults) - set(FAULTS):
+            raise ValueError(f"Unknown fault: {', '.join(sorted(unknown))}")
+        super().__init__((host, port), _Handler)
+        self.responses, self.records = load_fixtures(fixtures) if fixtures else ({}, {})
+        for resource, results in (records or {}).items():
+            self.records[resource] = [*self.records.get(resource, ()), *results]
+        self.total = total
+        self.latency = latency
+        self.jitter = jitter
+        self.quota = quota
+        self.quota_window = quota_window
+        self.fault_rate = fault_rate
+        self.faults = faults
+        self.requests: Counter[str] = Counter()
+        self._random = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+        self._injected: deque[str] = deque()
+        self._window_start = time.monotonic()
+        self._used = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def api_url(self) -> str:
+        """The url to set as `Session.api_url` to send requests to the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}{PREFIX}{{}}"
+
+    def inject(self, fault: str, count: int = 1) -> None:
+        """Fail the next requests with a fault, before any random fault.
+
+        Args:
+            fault: The fault, one of `FAULTS`, or `"quota"` to answer `429`.
+            count: The number of requests to fail.
+
+        Raises:
+            ValueError: If the fault is unknown.
+        """
+        if fault not in (*FAULTS, "quota"):
+            raise ValueError(f"Unknown fault: {fault}")
+        with self._lock:
+            self._injected.extend([fault] * count)
+
+    def quota_remaining(self) -> int | None:
+        """The number of requests left in the current quota window, None without a quota."""
+        if self.quota is None:
+            return None
+        with self._lock:
+            return max(self.quota - self._used, 0)
+
+    def respond(  # noqa: PLR0911
+        self, path: str, params: dict[str, str]
+    ) -> tuple[int, dict[str, Any] | None, str | None]:
+        """Answer a request, as the handler of each connection does.
+
+        Args:
+            path: The path of the request, e.g. `/v1/public/comics`.
+            params: The query parameters.
+
+        Returns:
+            The status, the JSON body and the fault to simulate, if any.
+        """
+        fault = self._admit(path.removeprefix(PREFIX), params)
+        self._sleep()
+        if fault == "quota":
+            message = "You have exceeded your rate limit.  Please try again later."
+            return 429, {"code": "RequestThrottled", "message": message}, None
+        if fault == "error":
+            return 500, {"code": 500, "status": "Internal Server Error"}, None
+        if fault == "unavailable":
+            return 503, {"code": 503, "status": "Service Unavailable"}, None
+        if not params.get("apikey"):
+            return (
+                409,
+                {"code": "MissingParameter", "message": "You must provide a user key."},
+                fault,
+            )
+        if (error := _check_paging(params)) is not None:
+            return 409, {"code": 409, "status": error}, fault
+        data = self._data(path.removeprefix(PREFIX), params)
+        if data is None:
+            return 404, {"code": 404, "status": "We couldn't find that resource."}, fault
+        etag = md5(json.dumps(data, sort_keys=True).encode()).hexdigest()  # noqa: S324
+        return 200, {"code": 200, "status": "Ok", "etag": etag, "data": data}, fault
+
+    def _admit(self, path: str, params: dict[str, str]) -> str | None:
+        """Count a request against the quota and pick the fault to simulate, if any."""
+        with self._lock:
+            self.requests[_canonical(path, params)] += 1
+            if self._injected:
+                return self._injected.popleft()
+            if self.quota is not None:
+                if time.monotonic() - self._window_start >= self.quota_window:
+                    self._window_start, self._used = time.monotonic(), 0
+                if self._used >= self.quota:
+                    return "quota"
+                self._used += 1
+            if self.fault_rate and self._random.random() < self.fault_rate:
+                return self._random.choice(self.faults)
+        return None
+
+    def _sleep(self) -> None:
+        if self.latency or self.jitter:
+            with self._lock:
+                offset = self._random.uniform(-self.jitter, self.jitter)
+            time.sleep(max(self.latency + offset, 0))
+
+    def _data(self, path: str, params: dict[str, str]) -> dict[str, Any] | None:
+        """Find the recorded data of a request, or create synthetic data."""
+        if (data := self.responses.get(_canonical(path, params))) is not None:
+            return data
+        if not (match := _PATH.fullmatch(path)):
+            return None
+        resource, _id, related = match[1], match[2], match[3]
+        resource = related or resource
+        if resource not in RESOURCE_MODELS or not (records := self.records.get(resource)):
+            return None
+        if _id is not None and related is None:
+            if not 0 < int(_id) <= self.total:
+                return None
+            result = {**records[(int(_id) - 1) % len(records)], "id": int(_id)}
+            return {"offset": 0, "limit": 20, "total": 1, "count": 1, "results": [result]}
+        offset, limit = int(params.get("offset", 0)), int(params.get("limit", 20))
+        results = [
+            {**records[x % len(records)], "id": x + 1}
+            for x in range(offset, min(offset + limit, self.total))
+        ]
+        return {
+            "offset": offset,
+            "limit": limit,
+            "total": self.total,
+            "count": len(results),
+            "results": results,
+        }
+
+    def start(self) -> "StandInServer":
+        """Serve requests in a background thread.
+
+        Returns:
+            The server.
+        """
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self) -> "StandInServer":  # noqa: PYI034
+        """Serve requests in a background thread until the context exits."""
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop serving requests."""
+        self.stop()
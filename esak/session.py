@@ -8,10 +8,16 @@ This module provides the following classes:
 __all__ = ["Session"]
 
 import platform
+import time
 from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from contextvars import copy_context
 from datetime import datetime
+from functools import lru_cache, partial, wraps
 from hashlib import md5
-from typing import Any, Optional
+from typing import Any, Optional, TypeVar
 from urllib.parse import urlencode
 
 import requests
@@ -19,27 +25,111 @@ from pydantic import TypeAdapter, ValidationError
 
 from esak import __version__
 from esak.exceptions import ApiError, CacheError
+from esak.hooks import NO_TRACE, Hooks, Trace
+from esak.identity_map import IdentityMap
+from esak.metrics import MetricsRegistry
+from esak.results import Results
+from esak.schemas import BaseModel
+from esak.schemas.base import BaseResource
 from esak.schemas.character import Character
 from esak.schemas.comic import Comic
 from esak.schemas.creator import Creator
 from esak.schemas.event import Event
+from esak.schemas.frozen import freeze
+from esak.schemas.interning import InternPool, interned
+from esak.schemas.projection import project
 from esak.schemas.series import Series
 from esak.schemas.story import Story
 from esak.sqlite_cache import SqliteCache
+from esak.streaming import iter_results
+from esak.tracing import NO_SPAN, Tracer, cache_key_hash
+
+RESOURCE_MODELS: dict[str, type[BaseResource]] = {
+    "characters": Character,
+    "comics": Comic,
+    "creators": Creator,
+    "events": Event,
+    "series": Series,
+    "stories": Story,
+}
+# The related lists of each resource, e.g. `comics/{id}/characters`.
+RELATED_LISTS: dict[str, tuple[str, ...]] = {
+    "characters": ("comics", "events", "series", "stories"),
+    "comics": ("characters", "creators", "events", "stories"),
+    "creators": ("comics", "events", "series", "stories"),
+    "events": ("characters", "comics", "creators", "series", "stories"),
+    "series": ("characters", "comics", "creators", "events", "stories"),
+    "stories": ("characters", "comics", "creators", "events", "series"),
+}
+STREAM_CHUNK_SIZE = 64 * 1024
+# Statuses worth retrying: quota exceeded and transient upstream errors.
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_BACKOFF = 0.5
+
+
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _traced(method: _Method) -> _Method:
+    """Open a span named after an endpoint method around each call when the session traces."""
+    name = f"esak.{method.__name__}"
+
+    @wraps(method)
+    def wrapper(self: "Session", *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if self.tracer is None:
+            return method(self, *args, **kwargs)
+        with self.tracer.span(name):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+@lru_cache(maxsize=256)
+def _type_adapter(type_: Any) -> TypeAdapter:  # noqa: ANN401
+    return TypeAdapter(type_)
 
 
 class Session:
     """Session to request api endpoints.
 
+    Callbacks timing the phases of each request can be registered on `hooks`, see
+    `esak.hooks.Hooks`.
+
     Args:
         public_key: The public_key for authentication with Marvel
         private_key: The private_key used for authentication with Marvel
         timeout: Set how long requests will wait for a response (in seconds).
         cache: SqliteCache to use
+        frozen: Return read-only, hashable models, which skip the validation kept for assignments
+            and are validated faster than the default ones.
+        raw: Return the results from Marvel as dicts instead of validating them into models, lists
+            of them are still returned as `Results`. The `fields` of an endpoint keep only those
+            keys. Only `stream` and `validate` can override the mode per call.
+        intern: Share identical nested items and repeated strings between the returned models,
+            which are frozen so a shared item can't be modified through one of them.
+        identity_map: Return the same model instance when an unchanged entity is received again,
+            which is frozen so the shared instance can't be modified through one of its holders.
+        retries: Retry a request this many times on connection errors, timeouts, quota errors and
+            server errors, waiting twice as long before each new attempt.
+        metrics: Registry to record request, retry, quota and validation metrics in.
+        tracer: Open a span for each endpoint call, with child spans for the cache lookup, the
+            request and the validation, see `esak.tracing.Tracer`.
     """
 
-    def __init__(
-        self, public_key: str, private_key: str, timeout: int = 30, cache: SqliteCache | None = None
+    def __init__(  # noqa: PLR0913
+        self,
+        public_key: str,
+        private_key: str,
+        timeout: int = 30,
+        cache: SqliteCache | None = None,
+        *,
+        frozen: bool = False,
+        raw: bool = False,
+        intern: bool = False,
+        identity_map: bool = False,
+        retries: int = 0,
+        metrics: MetricsRegistry | None = None,
+        tracer: Tracer | None = None,
     ):
         self.headers = {
             "User-Agent": f"esak/{__version__} ({platform.system()}; {platform.release()})"
@@ -48,7 +138,17 @@ class Session:
         self.private_key = private_key
         self.timeout = timeout
         self.cache = cache
+        self.frozen = frozen or intern or identity_map
+        self.raw = raw
+        self.intern_pool = InternPool() if intern else None
+        self.identity_map = IdentityMap() if identity_map else None
         self.api_url = "http://gateway.marvel.com:80/v1/public/{}"
+        self.retries = retries
+        self.hooks = Hooks()
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.observe(self.hooks)
+        self.tracer = tracer if tracer is not None and tracer.enabled else None
 
     @staticmethod
     def _create_cached_params(params: dict[str, Any]) -> str:
@@ -135,6 +235,142 @@ class Session:
             except AttributeError as e:
                 raise CacheError(f"Cache object passed in is missing attribute: {e!r}") from e
 
+    def _span(self, name: str, attributes: dict[str, Any] | None = None) -> AbstractContextManager:
+        """Open a tracing span, or a span doing nothing when the session doesn't trace.
+
+        Args:
+            name: The span name, e.g. `"esak.http"`.
+            attributes: The initial attributes of the span.
+
+        Returns:
+            A context manager yielding the span.
+        """
+        if self.tracer is None:
+            return NO_SPAN
+        return self.tracer.span(name, attributes)
+
+    def _resolve_model(
+        self, model: type[BaseModel], fields: list[str] | None = None
+    ) -> type[BaseModel]:
+        """Select the model variant used to validate results.
+
+        Args:
+            model: The esak model for the endpoint.
+            fields: Only include these attributes in the model.
+
+        Returns:
+            The model class to validate with.
+        """
+        if self.frozen:
+            model = freeze(model)
+        if self.intern_pool is not None:
+            model = interned(model)
+        return project(model, fields)
+
+    def _validate(
+        self,
+        model: type[BaseModel],
+        data: dict[str, Any] | list[dict[str, Any]],
+        fields: list[str] | None = None,
+        *,
+        raw: bool | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Validate API results into models.
+
+        Args:
+            model: The esak model for the endpoint.
+            data: A single result or a list of results.
+            fields: Only include these attributes in the models, or in raw mode only keep the
+                keys of these attributes in the results.
+            raw: Return the results without validating them, defaults to the mode of the session.
+
+        Returns:
+            A model or `Results` of models, or in raw mode the results, with lists wrapped in
+            `Results`.
+
+        Raises:
+            ValueError: If any of the fields are not attributes of the model.
+        """
+        if self.raw if raw is None else raw:
+            if fields:
+                info = project(model, fields).model_fields
+                keys = [x.alias or name for name, x in info.items()]
+                if isinstance(data, list):
+                    data = [{x: result[x] for x in keys if x in result} for result in data]
+                else:
+                    data = {x: data[x] for x in keys if x in data}
+            return Results(data) if isinstance(data, list) else data
+        with self._span("esak.validate", {"esak.model": model.__name__}) as span:
+            count = len(data) if isinstance(data, list) else 1
+            span.set_attribute("esak.result_count", count)
+            if not self.hooks:
+                return self._validate_models(model, data, fields)
+            started = time.perf_counter()
+            try:
+                result = self._validate_models(model, data, fields)
+            except ValidationError as err:
+                self.hooks.emit("on_error", model.__name__, started=started, error=err)
+                raise
+            self.hooks.emit(
+                "on_validate",
+                model.__name__,
+                started=started,
+                timings={"validate": time.perf_counter() - started},
+                count=count,
+            )
+            return result
+
+    def _validate_models(
+        self,
+        model: type[BaseModel],
+        data: dict[str, Any] | list[dict[str, Any]],
+        fields: list[str] | None = None,
+    ) -> Any:  # noqa: ANN401
+        """Validate API results into models, see `_validate`."""
+        model = self._resolve_model(model, fields)
+        context = {"intern_pool": self.intern_pool} if self.intern_pool is not None else None
+        if self.identity_map is not None:
+            validate = partial(_type_adapter(model).validate_python, context=context)
+            if isinstance(data, list):
+                return Results(self.identity_map.resolve(model, x, validate) for x in data)
+            return self.identity_map.resolve(model, data, validate)
+        if isinstance(data, list):
+            return Results(_type_adapter(list[model]).validate_python(data, context=context))
+        return _type_adapter(model).validate_python(data, context=context)
+
+    def _create_url(self, endpoint: list[str | int], params: dict[str, Any]) -> tuple[str, str]:
+        """Build the request url and the cache key for an endpoint.
+
+        Args:
+            endpoint: A list representing the endpoint path.
+            params: A dictionary of query parameters for the API request.
+
+        Returns:
+            The url without parameters and the cache key.
+        """
+        url = self.api_url.format("/".join(str(e) for e in endpoint))
+        return url, f"{url}{self._create_cached_params(params)}"
+
+    @staticmethod
+    def _check_response(data: dict[str, Any], status: int | None = None) -> None:
+        """Raise an error if the response from Marvel contains one.
+
+        Args:
+            data: The decoded response, or the values of it outside `data.results`.
+            status: The HTTP status code of the response, the numeric `code` of the response is
+                reported instead when there is one.
+
+        Raises:
+            ApiError: If the API response contains an error message or if the code is not 200
+        """
+        code = data.get("code", 200)
+        if isinstance(code, int):
+            status = code
+        if "message" in data:
+            raise ApiError(data["message"], status=status)
+        if code != 200:  # noqa: PLR2004
+            raise ApiError(data.get("status"), status=status)
+
     def _call(self, endpoint: list[str | int], params: Optional[dict[str, Any]] = None) -> Any:  # noqa: ANN401
         """Make an API call to the endpoint and return the results.
 
@@ -145,62 +381,251 @@ class Session:
         Returns:
             The 'results' field from the API response.
 
+        Raises:
+            ApiError: If the API response contains an error message or if the status code is not 200
+        """
+        return self.fetch_page(endpoint, params)["results"]
+
+    def fetch_page(
+        self,
+        endpoint: list[str | int],
+        params: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Request a page of an endpoint and return it without validating the results.
+
+        Args:
+            endpoint: A list representing the endpoint path, e.g. `["series", 466, "comics"]`.
+            params: Parameters to add to the request.
+            use_cache: Read the page from and store it in the cache of the session.
+
+        Returns:
+            The 'data' field from the API response, holding `offset`, `limit`, `total`, `count`
+            and `results`.
+
         Raises:
             ApiError: If the API response contains an error message or if the status code is not 200
         """
         if params is None:
             params = {}
 
-        url = self.api_url.format("/".join(str(e) for e in endpoint))
-        cache_params = self._create_cached_params(params)
-        cache_key = f"{url}{cache_params}"
-        cached_response = self._get_results_from_cache(cache_key)
+        url, cache_key = self._create_url(endpoint, params)
+        trace = NO_TRACE
+        if self.hooks:
+            trace = self.hooks.trace("/".join(str(x) for x in endpoint), cache_key)
+        with self._span("esak.fetch_page") as span:
+            if span.is_recording():
+                span.set_attribute("esak.endpoint", "/".join(str(x) for x in endpoint))
+                span.set_attribute("esak.cache_key_hash", cache_key_hash(cache_key))
+            try:
+                data = self._fetch(url, cache_key, params, trace, span, use_cache=use_cache)
+            except Exception as err:
+                trace.emit("on_error", error=err)
+                raise
+            span.set_attribute("esak.result_count", len(data.get("results", ())))
+            return data
+
+    def validate(
+        self,
+        resource: str,
+        results: list[dict[str, Any]],
+        fields: list[str] | None = None,
+        *,
+        raw: bool | None = None,
+    ) -> Results:
+        """Validate results, e.g. from `fetch_page`, as the endpoint methods of the session do.
+
+        Args:
+            resource: The resource name of the results, e.g. `"comics"`.
+            results: The unvalidated results from Marvel.
+            fields: Only include these attributes in the models.
+            raw: Return the results without validating them, defaults to the mode of the session.
+
+        Returns:
+            `Results` of models, or of the results in raw mode.
+
+        Raises:
+            ValueError: If the resource is unknown.
+            ApiError: If a result is not valid.
+        """
+        if (model := RESOURCE_MODELS.get(resource)) is None:
+            raise ValueError(f"Unknown resource: {resource!r}")
+        try:
+            return self._validate(model, results, fields, raw=raw)
+        except ValidationError as err:
+            raise ApiError(err) from err
+
+    def _fetch(  # noqa: PLR0913
+        self,
+        url: str,
+        cache_key: str,
+        params: dict[str, Any],
+        trace: Trace,
+        span: Any,  # noqa: ANN401
+        *,
+        use_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Request a page, see `fetch_page`, recording each phase on `trace` and `span`."""
+        cached_response = None
+        if use_cache and self.cache:
+            with self._span("esak.cache") as cache_span:
+                cached_response = self._get_results_from_cache(cache_key)
+                cache_span.set_attribute("esak.cache.hit", cached_response is not None)
+        trace.lap("cache")
 
         if cached_response is not None:
-            return cached_response["results"]
+            trace.emit("on_cache_hit", count=len(cached_response.get("results", ())))
+            return cached_response
 
         self._update_params(params)
-        response = requests.get(url, params=params, headers=self.headers, timeout=self.timeout)
+        trace.lap("auth")
+        response = self._request(url, params, trace)
+        trace.lap("network")
+        span.set_attribute("http.response.status_code", response.status_code)
 
         data = response.json()
+        trace.lap("decode")
 
-        if "message" in data:
-            raise ApiError(data["message"])
-        if data.get("code", 200) != 200:  # noqa: PLR2004
-            raise ApiError(data.get("status"))
+        self._check_response(data, response.status_code)
         if "data" in data:
             data = data["data"]
 
-        if response.status_code == 200:  # noqa: PLR2004
+        if use_cache and response.status_code == 200:  # noqa: PLR2004
             self._save_results_to_cache(cache_key, data)
+            trace.lap("store")
+
+        if trace.hooks is not None:
+            trace.emit(
+                "on_response",
+                size=len(response.content),
+                headers=response.headers,
+                count=len(data.get("results", ())),
+            )
+        return data
+
+    def _request(
+        self, url: str, params: dict[str, Any], trace: Trace, *, stream: bool = False
+    ) -> requests.Response:
+        """Send a request, retrying it up to `retries` times if it fails transiently.
 
-        return data["results"]
+        Args:
+            url: The url without parameters.
+            params: The query parameters, including the authentication.
+            trace: The trace of the request, which `on_retry` is emitted on.
+            stream: Read the body of the response as it is iterated over.
 
-    def comic(self, _id: int) -> Comic:
+        Returns:
+            The response of the last attempt.
+        """
+        with self._span("esak.http", {"http.request.method": "GET", "url.full": url}) as span:
+            attempt = 0
+            while True:
+                try:
+                    response = requests.get(
+                        url,
+                        params=params,
+                        headers=self.headers,
+                        timeout=self.timeout,
+                        stream=stream,
+                    )
+                except (requests.ConnectionError, requests.Timeout) as err:
+                    if attempt >= self.retries:
+                        raise
+                    status, error = None, err
+                else:
+                    status, error = response.status_code, None
+                    if status not in RETRY_STATUSES or attempt >= self.retries:
+                        trace.set_status(status)
+                        span.set_attribute("http.response.status_code", status)
+                        span.set_attribute("esak.retry.attempts", attempt)
+                        return response
+                    response.close()
+                trace.set_status(status)
+                span.add_event(
+                    "retry",
+                    {"esak.retry.attempt": attempt + 1, "esak.retry.reason": str(error or status)},
+                )
+                time.sleep(RETRY_BACKOFF * 2**attempt)
+                attempt += 1
+                trace.emit("on_retry", attempt=attempt, error=error)
+
+    def _entity(
+        self, model: type[BaseResource], resource: str, _id: int, include: list[str] | None = None
+    ) -> Any:  # noqa: ANN401
+        """Request a single entity together with its included related lists.
+
+        The entity and each related list are requested concurrently, so the slowest call sets the
+        latency instead of the sum of the calls. Each related list is requested through its
+        `Session` endpoint, e.g. `comic_characters`, so it is cached and validated as usual. Only
+        the first page of each related list is included, as requested by its endpoint without
+        parameters, see `BaseResource.complete` to request the others.
+
+        Args:
+            model: The esak model for the endpoint.
+            resource: The resource name of the endpoint, e.g. `"comics"`.
+            _id: The id of the entity.
+            include: Names of the related lists to request, e.g. `["characters", "creators"]`.
+
+        Returns:
+            The validated entity with the related lists attached, see `BaseResource.related`. In
+            raw mode a copy of the result with the related results under `"included"`. With the
+            identity map, the lists are attached to the shared instance.
+
+        Raises:
+            ValueError: If `include` names an unknown related list.
+        """
+        if not include:
+            return self._validate(model, self._call([resource, _id])[0])
+        if unknown := [x for x in include if x not in RELATED_LISTS[resource]]:
+            raise ValueError(f"{model.__name__} has no related list {unknown[0]!r}")
+        prefix = model.__name__.lower()
+        endpoints = {name: getattr(self, f"{prefix}_{name}") for name in include}
+        with ThreadPoolExecutor(max_workers=len(endpoints) + 1) as executor:
+            # Run each call in a copy of the context, so its spans are children of the current one.
+            entity = executor.submit(copy_context().run, self._call, [resource, _id])
+            futures = {
+                name: executor.submit(copy_context().run, x, _id) for name, x in endpoints.items()
+            }
+            result = entity.result()[0]
+            related = {name: future.result() for name, future in futures.items()}
+        if self.raw:
+            return {**result, "included": related}
+        instance = self._validate(model, result)
+        instance._related = {**instance._related, **related}  # noqa: SLF001
+        return instance
+
+    @_traced
+    def comic(self, _id: int, include: list[str] | None = None) -> Comic:
         """Request data for a comic based on it's `_id`.
 
         Args:
             _id: The comic id.
+            include: Related lists to request concurrently and attach, e.g. `["characters"]`,
+                any of characters, creators, events or stories.
 
         Returns:
             A `Comic` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["comics", _id])[0]
-            adapter = TypeAdapter(Comic)
-            return adapter.validate_python(result)
+            return self._entity(Comic, "comics", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def comic_characters(self, _id: int, params: dict[str, Any] | None = None) -> list[Character]:
+    @_traced
+    def comic_characters(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Character]:
         """Request a list of characters from a comic.
 
         Args:
             _id: The comic id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Character` objects.
@@ -213,17 +638,20 @@ class Session:
 
         try:
             results = self._call(["comics", _id, "characters"], params=params)
-            adapter = TypeAdapter(list[Character])
-            return adapter.validate_python(results)
+            return self._validate(Character, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def comic_creators(self, _id: int, params: dict[str, Any] | None = None) -> list[Creator]:
+    @_traced
+    def comic_creators(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Creator]:
         """Request a list of creators from a comic.
 
         Args:
             _id: The comic id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Creator` objects.
@@ -236,17 +664,20 @@ class Session:
 
         try:
             results = self._call(["comics", _id, "creators"], params=params)
-            adapter = TypeAdapter(list[Creator])
-            return adapter.validate_python(results)
+            return self._validate(Creator, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def comic_events(self, _id: int, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def comic_events(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events from a comic.
 
         Args:
             _id: The comic id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -259,17 +690,20 @@ class Session:
 
         try:
             results = self._call(["comics", _id, "events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def comic_stories(self, _id: int, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def comic_stories(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories from a comic.
 
         Args:
             _id: The comic id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -282,16 +716,19 @@ class Session:
 
         try:
             results = self._call(["comics", _id, "stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def comics_list(self, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def comics_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -304,36 +741,41 @@ class Session:
 
         try:
             results = self._call(["comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series(self, _id: int) -> Series:
+    @_traced
+    def series(self, _id: int, include: list[str] | None = None) -> Series:
         """Request data for a series based on it's `_id`.
 
         Args:
             _id: The series id.
+            include: Related lists to request concurrently and attach, e.g. `["characters"]`,
+                any of characters, comics, creators, events or stories.
 
         Returns:
             A `Series` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["series", _id])[0]
-            adapter = TypeAdapter(Series)
-            return adapter.validate_python(result)
+            return self._entity(Series, "series", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_characters(self, _id: int, params: dict[str, Any] | None = None) -> list[Character]:
+    @_traced
+    def series_characters(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Character]:
         """Request a list of characters from a series.
 
         Args:
             _id: The series id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Character` objects.
@@ -346,17 +788,20 @@ class Session:
 
         try:
             results = self._call(["series", _id, "characters"], params=params)
-            adapter = TypeAdapter(list[Character])
-            return adapter.validate_python(results)
+            return self._validate(Character, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_comics(self, _id: int, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def series_comics(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics from a series.
 
         Args:
             _id: The series id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -369,17 +814,20 @@ class Session:
 
         try:
             results = self._call(["series", _id, "comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_creators(self, _id: int, params: dict[str, Any] | None = None) -> list[Creator]:
+    @_traced
+    def series_creators(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Creator]:
         """Request a list of creators from a series.
 
         Args:
             _id: The series id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Creator` objects.
@@ -392,17 +840,20 @@ class Session:
 
         try:
             results = self._call(["series", _id, "creators"], params=params)
-            adapter = TypeAdapter(list[Creator])
-            return adapter.validate_python(results)
+            return self._validate(Creator, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_events(self, _id: int, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def series_events(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events from a series.
 
         Args:
             _id: The series id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -415,17 +866,20 @@ class Session:
 
         try:
             results = self._call(["series", _id, "events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_stories(self, _id: int, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def series_stories(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories from a series.
 
         Args:
             _id: The series id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -438,16 +892,19 @@ class Session:
 
         try:
             results = self._call(["series", _id, "stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def series_list(self, params: dict[str, Any] | None = None) -> list[Series]:
+    @_traced
+    def series_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Series]:
         """Request a list of series.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns: A list of `Series` objects.
         """
@@ -456,36 +913,41 @@ class Session:
 
         try:
             results = self._call(["series"], params=params)
-            adapter = TypeAdapter(list[Series])
-            return adapter.validate_python(results)
+            return self._validate(Series, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creator(self, _id: int) -> Creator:
+    @_traced
+    def creator(self, _id: int, include: list[str] | None = None) -> Creator:
         """Request data for a creator based on it's `_id`.
 
         Args:
             _id: The creator id.
+            include: Related lists to request concurrently and attach, e.g. `["comics"]`,
+                any of comics, events, series or stories.
 
         Returns:
             A `Creator` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["creators", _id])[0]
-            adapter = TypeAdapter(Creator)
-            return adapter.validate_python(result)
+            return self._entity(Creator, "creators", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creator_comics(self, _id: int, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def creator_comics(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics from a creator.
 
         Args:
             _id: The creator id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -498,17 +960,20 @@ class Session:
 
         try:
             results = self._call(["creators", _id, "comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creator_events(self, _id: int, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def creator_events(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events from a creator.
 
         Args:
             _id: The creator id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -521,17 +986,20 @@ class Session:
 
         try:
             results = self._call(["creators", _id, "events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creator_series(self, _id: int, params: dict[str, Any] | None = None) -> list[Series]:
+    @_traced
+    def creator_series(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Series]:
         """Request a list of series by a creator.
 
         Args:
             _id: The creator id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Series` objects.
@@ -544,17 +1012,20 @@ class Session:
 
         try:
             results = self._call(["creators", _id, "series"], params=params)
-            adapter = TypeAdapter(list[Series])
-            return adapter.validate_python(results)
+            return self._validate(Series, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creator_stories(self, _id: int, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def creator_stories(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories from a creator.
 
         Args:
             _id: The creator id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -567,16 +1038,19 @@ class Session:
 
         try:
             results = self._call(["creators", _id, "stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def creators_list(self, params: dict[str, Any] | None = None) -> list[Creator]:
+    @_traced
+    def creators_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Creator]:
         """Request a list of creators.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Creator` objects.
@@ -586,36 +1060,41 @@ class Session:
 
         try:
             results = self._call(["creators"], params=params)
-            adapter = TypeAdapter(list[Creator])
-            return adapter.validate_python(results)
+            return self._validate(Creator, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def character(self, _id: int) -> Character:
+    @_traced
+    def character(self, _id: int, include: list[str] | None = None) -> Character:
         """Request data for a character based on it's `_id`.
 
         Args:
             _id: The character id.
+            include: Related lists to request concurrently and attach, e.g. `["comics"]`,
+                any of comics, events, series or stories.
 
         Returns:
             A `Character` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["characters", _id])[0]
-            adapter = TypeAdapter(Character)
-            return adapter.validate_python(result)
+            return self._entity(Character, "characters", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def character_comics(self, _id: int, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def character_comics(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics for a character.
 
         Args:
             _id: The character id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -628,17 +1107,20 @@ class Session:
 
         try:
             results = self._call(["characters", _id, "comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def character_events(self, _id: int, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def character_events(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events for a character.
 
         Args:
             _id: The character id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -651,17 +1133,20 @@ class Session:
 
         try:
             results = self._call(["characters", _id, "events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def character_series(self, _id: int, params: dict[str, Any] | None = None) -> list[Series]:
+    @_traced
+    def character_series(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Series]:
         """Request a list of series for a character.
 
         Args:
             _id: The character id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Series` objects.
@@ -674,17 +1159,20 @@ class Session:
 
         try:
             results = self._call(["characters", _id, "series"], params=params)
-            adapter = TypeAdapter(list[Series])
-            return adapter.validate_python(results)
+            return self._validate(Series, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def character_stories(self, _id: int, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def character_stories(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories for a character.
 
         Args:
             _id: The character id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -697,16 +1185,19 @@ class Session:
 
         try:
             results = self._call(["characters", _id, "stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def characters_list(self, params: dict[str, Any] | None = None) -> list[Character]:
+    @_traced
+    def characters_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Character]:
         """Request a list of characters.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Character` objects.
@@ -719,36 +1210,41 @@ class Session:
 
         try:
             results = self._call(["characters"], params=params)
-            adapter = TypeAdapter(list[Character])
-            return adapter.validate_python(results)
+            return self._validate(Character, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story(self, _id: int) -> Story:
+    @_traced
+    def story(self, _id: int, include: list[str] | None = None) -> Story:
         """Request data for a Story based on it's `_id`.
 
         Args:
             _id: The story id.
+            include: Related lists to request concurrently and attach, e.g. `["characters"]`,
+                any of characters, comics, creators, events or series.
 
         Returns:
             A `Story` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["stories", _id])[0]
-            adapter = TypeAdapter(Story)
-            return adapter.validate_python(result)
+            return self._entity(Story, "stories", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story_characters(self, _id: int, params: dict[str, Any] | None = None) -> list[Character]:
+    @_traced
+    def story_characters(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Character]:
         """Request a list of characters from a story.
 
         Args:
             _id: The story id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Character` objects.
@@ -761,17 +1257,20 @@ class Session:
 
         try:
             results = self._call(["stories", _id, "characters"], params=params)
-            adapter = TypeAdapter(list[Character])
-            return adapter.validate_python(results)
+            return self._validate(Character, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story_comics(self, _id: int, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def story_comics(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics for a story.
 
         Args:
             _id: The story id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -784,17 +1283,20 @@ class Session:
 
         try:
             results = self._call(["stories", _id, "comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story_creators(self, _id: int, params: dict[str, Any] | None = None) -> list[Creator]:
+    @_traced
+    def story_creators(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Creator]:
         """Request a list of creators from a story.
 
         Args:
             _id: The story id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Creator` objects.
@@ -807,17 +1309,20 @@ class Session:
 
         try:
             results = self._call(["stories", _id, "creators"], params=params)
-            adapter = TypeAdapter(list[Creator])
-            return adapter.validate_python(results)
+            return self._validate(Creator, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story_events(self, _id: int, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def story_events(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events for a story.
 
         Args:
             _id: The story id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -830,17 +1335,20 @@ class Session:
 
         try:
             results = self._call(["stories", _id, "events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def story_series(self, _id: int, params: dict[str, Any] | None = None) -> list[Series]:
+    @_traced
+    def story_series(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Series]:
         """Request a list of series for a story.
 
         Args:
             _id: The story id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Series` objects.
@@ -853,16 +1361,19 @@ class Session:
 
         try:
             results = self._call(["stories", _id, "series"], params=params)
-            adapter = TypeAdapter(list[Series])
-            return adapter.validate_python(results)
+            return self._validate(Series, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def stories_list(self, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def stories_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -875,36 +1386,41 @@ class Session:
 
         try:
             results = self._call(["stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event(self, _id: int) -> Event:
+    @_traced
+    def event(self, _id: int, include: list[str] | None = None) -> Event:
         """Request data for an event based on it's `_id`.
 
         Args:
             _id: The event id.
+            include: Related lists to request concurrently and attach, e.g. `["characters"]`,
+                any of characters, comics, creators, series or stories.
 
         Returns:
             A `Event` object.
 
         Raises:
             ApiError: If requested information is not valid.
+            ValueError: If `include` names an unknown related list.
         """
         try:
-            result = self._call(["events", _id])[0]
-            adapter = TypeAdapter(Event)
-            return adapter.validate_python(result)
+            return self._entity(Event, "events", _id, include)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event_characters(self, _id: int, params: dict[str, Any] | None = None) -> list[Character]:
+    @_traced
+    def event_characters(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Character]:
         """Request a list of characters from an event.
 
         Args:
             _id: The event id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Character` objects.
@@ -917,17 +1433,20 @@ class Session:
 
         try:
             results = self._call(["events", _id, "characters"], params=params)
-            adapter = TypeAdapter(list[Character])
-            return adapter.validate_python(results)
+            return self._validate(Character, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event_comics(self, _id: int, params: dict[str, Any] | None = None) -> list[Comic]:
+    @_traced
+    def event_comics(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Comic]:
         """Request a list of comics for an event.
 
         Args:
             _id: The event id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Comic` objects.
@@ -940,17 +1459,20 @@ class Session:
 
         try:
             results = self._call(["events", _id, "comics"], params=params)
-            adapter = TypeAdapter(list[Comic])
-            return adapter.validate_python(results)
+            return self._validate(Comic, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event_creators(self, _id: int, params: dict[str, Any] | None = None) -> list[Creator]:
+    @_traced
+    def event_creators(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Creator]:
         """Request a list of creators from an event.
 
         Args:
             _id: The event id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Creator` objects.
@@ -963,17 +1485,20 @@ class Session:
 
         try:
             results = self._call(["events", _id, "creators"], params=params)
-            adapter = TypeAdapter(list[Creator])
-            return adapter.validate_python(results)
+            return self._validate(Creator, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event_series(self, _id: int, params: dict[str, Any] | None = None) -> list[Series]:
+    @_traced
+    def event_series(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Series]:
         """Request a list of series for an event.
 
         Args:
             _id: The event id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Series` objects.
@@ -986,17 +1511,20 @@ class Session:
 
         try:
             results = self._call(["events", _id, "series"], params=params)
-            adapter = TypeAdapter(list[Series])
-            return adapter.validate_python(results)
+            return self._validate(Series, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def event_stories(self, _id: int, params: dict[str, Any] | None = None) -> list[Story]:
+    @_traced
+    def event_stories(
+        self, _id: int, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Story]:
         """Request a list of stories for an event.
 
         Args:
             _id: The event id.
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Story` objects.
@@ -1009,16 +1537,19 @@ class Session:
 
         try:
             results = self._call(["events", _id, "stories"], params=params)
-            adapter = TypeAdapter(list[Story])
-            return adapter.validate_python(results)
+            return self._validate(Story, results, fields)
         except ValidationError as err:
             raise ApiError(err) from err
 
-    def events_list(self, params: dict[str, Any] | None = None) -> list[Event]:
+    @_traced
+    def events_list(
+        self, params: dict[str, Any] | None = None, fields: list[str] | None = None
+    ) -> list[Event]:
         """Request a list of events.
 
         Args:
             params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
 
         Returns:
             A list of `Event` objects.
@@ -1031,7 +1562,138 @@ class Session:
 
         try:
             results = self._call(["events"], params=params)
-            adapter = TypeAdapter(list[Event])
-            return adapter.validate_python(results)
+            return self._validate(Event, results, fields)
+        except ValidationError as err:
+            raise ApiError(err) from err
+
+    def stream(
+        self,
+        endpoint: list[str | int],
+        params: dict[str, Any] | None = None,
+        fields: list[str] | None = None,
+        *,
+        raw: bool | None = None,
+    ) -> Iterator[BaseResource | dict[str, Any]]:
+        """Request an endpoint and yield validated results one by one as they are read.
+
+        The response body is parsed incrementally, so memory is bounded by a single result
+        instead of the whole page. Cached pages are read from the cache, but streamed pages are
+        not stored in it.
+
+        Args:
+            endpoint: A list representing the endpoint path, e.g. `["series", 466, "comics"]`.
+            params: Parameters to add to the request.
+            fields: Only validate and return these attributes of each result.
+            raw: Yield the results without validating them, defaults to the mode of the session.
+
+        Yields:
+            The model of the resource the endpoint returns for each result, or the result in raw
+            mode.
+
+        Raises:
+            ApiError: If requested information is not valid.
+        """
+        if params is None:
+            params = {}
+
+        model = RESOURCE_MODELS[next(x for x in reversed(endpoint) if isinstance(x, str))]
+        url, cache_key = self._create_url(endpoint, params)
+        trace = NO_TRACE
+        if self.hooks:
+            trace = self.hooks.trace("/".join(str(x) for x in endpoint), cache_key)
+        # A span around the iteration, which `_traced` can't open for a generator.
+        with self._span("esak.stream") as span:
+            if span.is_recording():
+                span.set_attribute("esak.endpoint", "/".join(str(x) for x in endpoint))
+                span.set_attribute("esak.cache_key_hash", cache_key_hash(cache_key))
+            try:
+                yield from self._stream(
+                    url, cache_key, params, trace, span, model=model, fields=fields, raw=raw
+                )
+            except Exception as err:
+                trace.emit("on_error", error=err)
+                raise
+
+    def _stream(  # noqa: PLR0913
+        self,
+        url: str,
+        cache_key: str,
+        params: dict[str, Any],
+        trace: Trace,
+        span: Any,  # noqa: ANN401
+        *,
+        model: type[BaseResource],
+        fields: list[str] | None,
+        raw: bool | None,
+    ) -> Iterator[BaseResource | dict[str, Any]]:
+        """Stream the results of a page, see `stream`, recording each phase like `_fetch`."""
+        cached_response = None
+        if self.cache:
+            cached_response = self._get_results_from_cache(cache_key)
+        trace.lap("cache")
+        if cached_response is not None:
+            trace.emit("on_cache_hit", count=len(cached_response.get("results", ())))
+            yield from self._validate_each(model, cached_response["results"], fields, raw=raw)
+            return
+
+        self._update_params(params)
+        trace.lap("auth")
+        with self._request(url, params, trace, stream=True) as response:
+            trace.lap("network")
+            span.set_attribute("http.response.status_code", response.status_code)
+            if response.status_code != 200:  # noqa: PLR2004
+                message = f"Unexpected status code: {response.status_code}"
+                try:
+                    data = response.json()
+                except requests.JSONDecodeError as err:
+                    raise ApiError(message, status=response.status_code) from err
+                self._check_response(data, response.status_code)
+                raise ApiError(message, status=response.status_code)
+            size = count = 0
+
+            def chunks() -> Iterator[bytes]:
+                nonlocal size
+                for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                    size += len(chunk)
+                    yield chunk
+
+            meta: dict[str, Any] = {}
+            try:
+                results = iter_results(chunks(), meta)
+                for result in self._validate_each(model, results, fields, raw=raw):
+                    count += 1
+                    yield result
+            except ValueError as err:
+                raise ApiError(err) from err
+            self._check_response(meta, response.status_code)
+        trace.lap("decode")
+        span.set_attribute("esak.result_count", count)
+        trace.emit("on_response", size=size, headers=response.headers, count=count)
+
+    def _validate_each(
+        self,
+        model: type[BaseResource],
+        results: Iterable[dict[str, Any]],
+        fields: list[str] | None = None,
+        *,
+        raw: bool | None = None,
+    ) -> Iterator[BaseResource | dict[str, Any]]:
+        """Validate results one at a time.
+
+        Args:
+            model: The esak model for the endpoint.
+            results: An iterable of results.
+            fields: Only include these attributes in the models.
+            raw: Yield the results without validating them, defaults to the mode of the session.
+
+        Yields:
+            A model for each result, or the result in raw mode.
+
+        Raises:
+            ApiError: If a result is not valid.
+        """
+        try:
+            for result in results:
+                yield self._validate(model, result, fields, raw=raw)
         except ValidationError as err:
             raise ApiError(err) from err
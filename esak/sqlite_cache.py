@@ -8,21 +8,47 @@ This module provides the following classes:
 __all__ = ["SqliteCache"]
 import json
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+from esak.metrics import MetricsRegistry
+
+# The number of entries read at a time when iterating over the cache.
+BATCH_SIZE = 100
+
 
 class SqliteCache:
     """The SqliteCache object to cache search results from Marvel.
 
+    The cache can be shared between threads, e.g. by the concurrent requests of `include`.
+
     Args:
         db_name: Path and database name to use.
         expire: The number of days to keep the cache results before they expire.
+        metrics: Registry to record hits, misses and latency in, under the tier `sqlite`.
     """
 
-    def __init__(self, db_name: str = "esak_cache.db", expire: int | None = None) -> None:
+    def __init__(
+        self,
+        db_name: str = "esak_cache.db",
+        expire: int | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
         self.expire = expire
-        self.con = sqlite3.connect(db_name)
+        self.metrics = metrics
+        if metrics is not None:
+            self._lookups = metrics.counter(
+                "esak_cache_requests_total", "Cache lookups.", ("tier", "result")
+            )
+            self._latency = metrics.histogram(
+                "esak_cache_duration_seconds", "Latency of the cache.", ("tier", "operation")
+            )
+        self.con = sqlite3.connect(db_name, check_same_thread=False)
+        self.lock = threading.Lock()
         self.cur = self.con.cursor()
         self.cur.execute("CREATE TABLE IF NOT EXISTS responses (key, json, expire)")
         self.cleanup()
@@ -36,8 +62,40 @@ class SqliteCache:
         Returns:
             Selected results or None
         """
-        self.cur.execute("SELECT json FROM responses WHERE key = ?", (key,))
-        return json.loads(result[0]) if (result := self.cur.fetchone()) else None
+        started = time.perf_counter()
+        with self.lock:
+            self.cur.execute("SELECT json FROM responses WHERE key = ?", (key,))
+            result = self.cur.fetchone()
+        value = json.loads(result[0]) if result else None
+        if self.metrics is not None:
+            self._latency.observe(time.perf_counter() - started, tier="sqlite", operation="get")
+            self._lookups.inc(tier="sqlite", result="miss" if value is None else "hit")
+        return value
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        """Iterate over the cached data, reading it a batch at a time.
+
+        Yields:
+            Each key with its data.
+        """
+        for key, value in self._rows("key, json"):
+            yield key, json.loads(value)
+
+    def _rows(self, columns: str) -> Iterator[tuple[Any, ...]]:
+        """Iterate over the entries a batch at a time, only holding the lock to read a batch."""
+        last = 0
+        while True:
+            with self.lock:
+                batch = self.con.execute(
+                    f"SELECT rowid, {columns} FROM responses WHERE rowid > ? "  # noqa: S608
+                    "ORDER BY rowid LIMIT ?",
+                    (last, BATCH_SIZE),
+                ).fetchall()
+            for row in batch:
+                yield row[1:]
+            if len(batch) < BATCH_SIZE:
+                return
+            last = batch[-1][0]
 
     def store(self, key: str, value: Any) -> None:  # noqa: ANN401
         """Save data to the cache database.
@@ -46,20 +104,101 @@ class SqliteCache:
             key: Item id.
             value: Data to save.
         """
-        self.cur.execute(
-            "INSERT INTO responses(key, json, expire) VALUES(?, ?, ?)",
-            (key, json.dumps(value), self._determine_expire_str()),
-        )
-        self.con.commit()
+        started = time.perf_counter()
+        row = (key, json.dumps(value), self._determine_expire_str())
+        with self.lock:
+            self.cur.execute("INSERT INTO responses(key, json, expire) VALUES(?, ?, ?)", row)
+            self.con.commit()
+        if self.metrics is not None:
+            self._latency.observe(time.perf_counter() - started, tier="sqlite", operation="store")
 
     def cleanup(self) -> None:
         """Remove any expired data from the cache database."""
         if not self.expire:
             return
-        self.cur.execute(
-            "DELETE FROM responses WHERE expire < ?;", (datetime.now().strftime("%Y-%m-%d"),)
-        )
-        self.con.commit()
+        with self.lock:
+            self.cur.execute(
+                "DELETE FROM responses WHERE expire < ?;", (datetime.now().strftime("%Y-%m-%d"),)
+            )
+            self.con.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Describe the contents of the cache database.
+
+        Returns:
+            The number of `entries`, of distinct `keys` and of `expired` entries, and the `size` of
+            the database in bytes.
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+        with self.lock:
+            entries, keys, expired = self.cur.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT key), COUNT(*) FILTER (WHERE expire < ?) "
+                "FROM responses",
+                (today,),
+            ).fetchone()
+            page_count = self.cur.execute("PRAGMA page_count").fetchone()[0]
+            page_size = self.cur.execute("PRAGMA page_size").fetchone()[0]
+        return {
+            "entries": entries,
+            "keys": keys,
+            "expired": expired if self.expire else 0,
+            "size": page_count * page_size,
+        }
+
+    def vacuum(self) -> int:
+        """Remove expired data and older duplicates of a key, then compact the database.
+
+        Returns:
+            The number of removed entries.
+        """
+        self.cleanup()
+        with self.lock:
+            removed = self.cur.execute(
+                "DELETE FROM responses WHERE rowid NOT IN "
+                "(SELECT MAX(rowid) FROM responses GROUP BY key)"
+            ).rowcount
+            self.con.commit()
+            self.con.execute("VACUUM")
+        return removed
+
+    def export_entries(self, path: str | Path) -> int:
+        """Write the cached data to a newline delimited JSON file.
+
+        Args:
+            path: The file to write, each line holds the `key`, `json` and `expire` of an entry.
+
+        Returns:
+            The number of written entries.
+        """
+        count = 0
+        with Path(path).open("w", encoding="utf-8") as stream:
+            for key, value, expire in self._rows("key, json, expire"):
+                entry = {"key": key, "json": json.loads(value), "expire": expire}
+                stream.write(f"{json.dumps(entry)}\n")
+                count += 1
+        return count
+
+    def import_entries(self, path: str | Path) -> int:
+        """Add the entries of a file written by `export_entries` which are not cached yet.
+
+        Args:
+            path: The file to read.
+
+        Returns:
+            The number of added entries.
+        """
+        with Path(path).open(encoding="utf-8") as stream:
+            entries = [json.loads(x) for x in stream if x.strip()]
+        added = 0
+        with self.lock:
+            for entry in entries:
+                added += self.cur.execute(
+                    "INSERT INTO responses(key, json, expire) SELECT ?, ?, ? "
+                    "WHERE NOT EXISTS (SELECT 1 FROM responses WHERE key = ?)",
+                    (entry["key"], json.dumps(entry["json"]), entry["expire"], entry["key"]),
+                ).rowcount
+            self.con.commit()
+        return added
 
     def _determine_expire_str(self) -> str:
         dt = datetime.now() + timedelta(days=self.expire) if self.expire else datetime.now()
@@ -0,0 +1,1064 @@
+"""Store module.
+
+This module provides the following classes:
+
+- EntityStore
+
+This module provides the following functions:
+
+- cached_results
+"""
+
+__all__ = ["EntityStore", "cached_results"]
+
+import json
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from esak.results import Results
+from esak.schemas.base import BaseResource
+from esak.schemas.character import Character
+from esak.schemas.comic import Comic
+from esak.schemas.creator import Creator
+from esak.schemas.dates import parse_date, utc_timestamp
+from esak.schemas.event import Event
+from esak.schemas.series import Series
+from esak.schemas.story import Story
+from esak.sqlite_cache import SqliteCache
+
+# Resources which are linked to comics through a join table, with their singular name.
+RELATIONS = {
+    "characters": "character",
+    "creators": "creator",
+    "events": "event",
+    "stories": "story",
+}
+DEFAULT_LIMIT = 20
+# The number of entities read at a time when iterating over a table.
+BATCH_SIZE = 100
+
+Condition = tuple[str, list[Any]]
+
+
+@dataclass(frozen=True)
+class _Table:
+    model: type[BaseResource]
+    columns: dict[str, Callable[[dict[str, Any]], Any]]
+    filters: dict[str, Callable[[Any], Condition]]
+    order: dict[str, str]
+    indexes: tuple[str, ...] = field(default=("modified",))
+    # The name column, which results are ordered by when no orderBy is given, as Marvel does.
+    name: str | None = None
+
+
+def _equals(column: str) -> Callable[[Any], Condition]:
+    return lambda value: (f"{column} = ?", [value])
+
+
+def _starts_with(column: str) -> Callable[[Any], Condition]:
+    def condition(value: Any) -> Condition:  # noqa: ANN401
+        escaped = str(value).replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return f"{column} LIKE ? ESCAPE '\\'", [f"{escaped}%"]
+
+    return condition
+
+
+def _since(column: str) -> Callable[[Any], Condition]:
+    return lambda value: (f"{column} >= ?", [utc_timestamp(value)])
+
+
+def _between(column: str) -> Callable[[Any], Condition]:
+    def condition(value: Any) -> Condition:  # noqa: ANN401
+        dates = [parse_date(x.strip()) for x in str(value).split(",")]
+        if len(dates) != 2 or None in dates:  # noqa: PLR2004
+            raise ValueError(f"Expected two dates separated by a comma: {value!r}")
+        return f"{column} BETWEEN ? AND ?", [x.isoformat() for x in dates]
+
+    return condition
+
+
+def _flag(sql: str) -> Callable[[Any], Condition]:
+    return lambda value: (sql if str(value).lower() == "true" else "1", [])
+
+
+def _day(value: str | None) -> str | None:
+    return parsed.isoformat() if (parsed := parse_date(value)) else None
+
+
+def _item_id(item: dict[str, Any] | None) -> int | None:
+    return int(item["resourceURI"].rsplit("/", 1)[-1]) if item else None
+
+
+def _items(result: dict[str, Any], name: str) -> list[dict[str, Any]]:
+    return (result.get(name) or {}).get("items") or []
+
+
+def _is_complete(result: dict[str, Any], name: str) -> bool:
+    value = result.get(name) or {}
+    return value.get("returned", 0) >= value.get("available", 0)
+
+
+def _comic_date(kind: str) -> Callable[[dict[str, Any]], str | None]:
+    def extract(result: dict[str, Any]) -> str | None:
+        return next((_day(x["date"]) for x in result.get("dates") or [] if x["type"] == kind), None)
+
+    return extract
+
+
+def _get(key: str) -> Callable[[dict[str, Any]], Any]:
+    return lambda result: result.get(key)
+
+
+_MODIFIED = {"modified": lambda result: utc_timestamp(result.get("modified"))}
+_SINCE = {"modifiedSince": _since("modified")}
+_TABLES: dict[str, _Table] = {
+    "comics": _Table(
+        Comic,
+        {
+            "title": _get("title"),
+            "issue_number": _get("issueNumber"),
+            "variant_description": _get("variantDescription"),
+            "format": _get("format"),
+            "digital_id": _get("digitalId"),
+            "upc": _get("upc"),
+            "isbn": _get("isbn"),
+            "ean": _get("ean"),
+            "issn": _get("issn"),
+            "diamond_code": _get("diamondCode"),
+            "series_id": lambda result: _item_id(result.get("series")),
+            "on_sale": _comic_date("onsaleDate"),
+            "foc_date": _comic_date("focDate"),
+            **_MODIFIED,
+        },
+        {
+            "format": _equals("format"),
+            "noVariants": _flag("COALESCE(variant_description, '') = ''"),
+            "dateRange": _between("on_sale"),
+            "title": _equals("title"),
+            "titleStartsWith": _starts_with("title"),
+            "startYear": lambda value: (
+                "series_id IN (SELECT id FROM series WHERE start_year = ?)",
+                [value],
+            ),
+            "issueNumber": _equals("issue_number"),
+            "diamondCode": _equals("diamond_code"),
+            "digitalId": _equals("digital_id"),
+            "upc": _equals("upc"),
+            "isbn": _equals("isbn"),
+            "ean": _equals("ean"),
+            "issn": _equals("issn"),
+            "hasDigitalIssue": _flag("digital_id > 0"),
+            **_SINCE,
+        },
+        {
+            "focDate": "foc_date",
+            "onsaleDate": "on_sale",
+            "title": "title",
+            "issueNumber": "issue_number",
+            "modified": "modified",
+        },
+        ("series_id", "on_sale", "modified"),
+    ),
+    "series": _Table(
+        Series,
+        {
+            "title": _get("title"),
+            "start_year": _get("startYear"),
+            "end_year": _get("endYear"),
+            "rating": _get("rating"),
+            "series_type": _get("type"),
+            **_MODIFIED,
+        },
+        {
+            "title": _equals("title"),
+            "titleStartsWith": _starts_with("title"),
+            "startYear": _equals("start_year"),
+            "seriesType": _equals("series_type"),
+            **_SINCE,
+        },
+        {"title": "title", "startYear": "start_year", "modified": "modified"},
+        name="title",
+    ),
+    "characters": _Table(
+        Character,
+        {"name": _get("name"), **_MODIFIED},
+        {"name": _equals("name"), "nameStartsWith": _starts_with("name"), **_SINCE},
+        {"name": "name", "modified": "modified"},
+        name="name",
+    ),
+    "creators": _Table(
+        Creator,
+        {
+            "first_name": _get("firstName"),
+            "middle_name": _get("middleName"),
+            "last_name": _get("lastName"),
+            "suffix": _get("suffix"),
+            "full_name": _get("fullName"),
+            **_MODIFIED,
+        },
+        {
+            "firstName": _equals("first_name"),
+            "middleName": _equals("middle_name"),
+            "lastName": _equals("last_name"),
+            "suffix": _equals("suffix"),
+            "nameStartsWith": _starts_with("full_name"),
+            "firstNameStartsWith": _starts_with("first_name"),
+            "middleNameStartsWith": _starts_with("middle_name"),
+            "lastNameStartsWith": _starts_with("last_name"),
+            **_SINCE,
+        },
+        {
+            "lastName": "last_name",
+            "firstName": "first_name",
+            "middleName": "middle_name",
+            "suffix": "suffix",
+            "modified": "modified",
+        },
+        name="full_name",
+    ),
+    "events": _Table(
+        Event,
+        {
+            "title": _get("title"),
+            "start_date": lambda result: _day(result.get("start")),
+            "end_date": lambda result: _day(result.get("end")),
+            **_MODIFIED,
+        },
+        {"name": _equals("title"), "nameStartsWith": _starts_with("title"), **_SINCE},
+        {"name": "title", "startDate": "start_date", "modified": "modified"},
+        name="title",
+    ),
+    "stories": _Table(
+        Story,
+        {"title": _get("title"), "story_type": _get("type"), **_MODIFIED},
+        _SINCE,
+        {"id": "id", "modified": "modified"},
+    ),
+}
+
+
+def _comic_ids(resource: str, ids: str) -> str:
+    """SQL selecting the ids of the comics linked to `ids` of `resource`."""
+    if resource == "comics":
+        return ids
+    if resource == "series":
+        return f"SELECT id FROM comics WHERE series_id IN ({ids})"  # noqa: S608
+    return f"SELECT comic_id FROM comic_{resource} WHERE {RELATIONS[resource]}_id IN ({ids})"  # noqa: S608
+
+
+def _linked_ids(resource: str, comic_ids: str) -> str:
+    """SQL selecting the ids of `resource` linked to the comics selected by `comic_ids`."""
+    if resource == "comics":
+        return comic_ids
+    if resource == "series":
+        return f"SELECT series_id FROM comics WHERE id IN ({comic_ids})"  # noqa: S608
+    return f"SELECT {RELATIONS[resource]}_id FROM comic_{resource} WHERE comic_id IN ({comic_ids})"  # noqa: S608
+
+
+def cached_results(
+    cache: SqliteCache,
+) -> Iterator[tuple[str, list[dict[str, Any]], tuple[str, int] | None]]:
+    """Yield the results of every list and entity response in a cache.
+
+    Args:
+        cache: The cache to read the responses from.
+
+    Yields:
+        The resource name, the results and, for related lists such as `characters/1/comics`,
+        the resource name and id of the entity the results were requested for.
+    """
+    for key, value in cache.items():
+        path = urlparse(key).path.split("/public/", 1)[-1].split("/")
+        related_to = None
+        if len(path) == 3 and path[1].isdigit():  # noqa: PLR2004
+            related_to = (path[0], int(path[1]))
+        elif len(path) > 2 or (len(path) == 2 and not path[1].isdigit()):  # noqa: PLR2004
+            continue
+        resource = path[-1] if related_to else path[0]
+        if resource in _TABLES and isinstance(value, dict):
+            yield resource, value.get("results") or [], related_to
+
+
+class EntityStore:
+    """The EntityStore object keeps mirrored Marvel entities in normalized SQLite tables.
+
+    Each resource has its own table with the attributes used for filtering and ordering, and
+    comics are linked to their characters, creators, events and stories through join tables. The
+    query methods mirror the `Session` methods and accept the same `params`, so queries such as
+    `series_comics` or `character_comics` are answered locally without an API call.
+
+    Without `orderBy`, results are ordered by name or title, ignoring case, except comics and
+    stories which are ordered by id.
+
+    Relations which don't involve comics, e.g. `character_series`, are answered through the comics
+    linking both sides, so they only include what the stored comics show. Older copies of an
+    entity never replace a newer one.
+
+    The store can be filled by `esak.sync.Sync`, which it implements the `Store` interface for, or
+    from the responses in a `SqliteCache`.
+
+    Args:
+        db_name: Path and database name to use.
+    """
+
+    def __init__(self, db_name: str = "esak_store.db") -> None:
+        self.con = sqlite3.connect(db_name, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.con:
+            for name, table in _TABLES.items():
+                self.con.execute(
+                    f"CREATE TABLE IF NOT EXISTS {name} "
+                    f"(id INTEGER PRIMARY KEY, {', '.join(table.columns)}, json TEXT NOT NULL)"
+                )
+                for column in table.indexes:
+                    self.con.execute(
+                        f"CREATE INDEX IF NOT EXISTS {name}_{column} ON {name}({column})"
+                    )
+            for name, singular in RELATIONS.items():
+                role = ", role TEXT" if name == "creators" else ""
+                self.con.execute(
+                    f"CREATE TABLE IF NOT EXISTS comic_{name} (comic_id INTEGER, "
+                    f"{singular}_id INTEGER{role}, PRIMARY KEY (comic_id, {singular}_id)) "
+                    "WITHOUT ROWID"
+                )
+                self.con.execute(
+                    f"CREATE INDEX IF NOT EXISTS comic_{name}_{singular} "
+                    f"ON comic_{name}({singular}_id)"
+                )
+
+    def upsert(
+        self,
+        resource: str,
+        results: list[dict[str, Any]],
+        related_to: tuple[str, int] | None = None,
+    ) -> None:
+        """Insert or update entities and their links to comics.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+            results: The unvalidated results from Marvel.
+            related_to: The resource name and id of the entity the results were requested for,
+                e.g. `("characters", 1009220)` for the results of `character_comics`.
+
+        Raises:
+            ValueError: If the resource is unknown.
+        """
+        if (table := _TABLES.get(resource)) is None:
+            raise ValueError(f"Unknown resource: {resource!r}")
+        columns = ["id", *table.columns, "json"]
+        updates = ", ".join(f"{x} = excluded.{x}" for x in columns[1:])
+        sql = (
+            f"INSERT INTO {resource}({', '.join(columns)}) "
+            f"VALUES({', '.join('?' * len(columns))}) ON CONFLICT(id) DO UPDATE SET {updates} "
+            f"WHERE COALESCE(excluded.modified, '') >= COALESCE({resource}.modified, '') "
+            "RETURNING id"
+        )
+        with self.lock, self.con:
+            for result in results:
+                row = (
+                    result["id"],
+                    *(extract(result) for extract in table.columns.values()),
+                    json.dumps(result),
+                )
+                # An older copy updates no row and returns nothing, its links are stale too.
+                if self.con.execute(sql, row).fetchone() is not None:
+                    self._link(resource, result)
+            if related_to is not None:
+                self._link_related(resource, results, *related_to)
+
+    def _link(self, resource: str, result: dict[str, Any]) -> None:
+        if resource == "comics":
+            for name in RELATIONS:
+                if _is_complete(result, name):
+                    self.con.execute(
+                        f"DELETE FROM comic_{name} WHERE comic_id = ?",  # noqa: S608
+                        (result["id"],),
+                    )
+                self._insert_links(
+                    name, [(result["id"], _item_id(x), x.get("role")) for x in _items(result, name)]
+                )
+        elif resource in RELATIONS:
+            self._insert_links(
+                resource, [(_item_id(x), result["id"], None) for x in _items(result, "comics")]
+            )
+
+    def _link_related(
+        self, resource: str, results: list[dict[str, Any]], parent: str, parent_id: int
+    ) -> None:
+        if resource == "comics" and parent in RELATIONS:
+            self._insert_links(parent, [(x["id"], parent_id, None) for x in results])
+        elif parent == "comics" and resource in RELATIONS:
+            self._insert_links(resource, [(parent_id, x["id"], None) for x in results])
+
+    def _insert_links(self, name: str, links: Iterable[tuple[int, int, str | None]]) -> None:
+        singular = RELATIONS[name]
+        if name == "creators":
+            self.con.executemany(
+                "INSERT INTO comic_creators(comic_id, creator_id, role) VALUES(?, ?, ?) "
+                "ON CONFLICT DO UPDATE SET role = COALESCE(excluded.role, role)",
+                links,
+            )
+        else:
+            self.con.executemany(
+                f"INSERT OR IGNORE INTO comic_{name}(comic_id, {singular}_id) VALUES(?, ?)",
+                [x[:2] for x in links],
+            )
+
+    def import_cache(self, cache: SqliteCache) -> int:
+        """Store the entities of every list and entity response in a cache.
+
+        Args:
+            cache: The cache to read the responses from.
+
+        Returns:
+            The number of results stored.
+        """
+        count = 0
+        for resource, results, related_to in cached_results(cache):
+            self.upsert(resource, results, related_to)
+            count += len(results)
+        return count
+
+    def batches(self, resource: str) -> Iterator[list[dict[str, Any]]]:
+        """Iterate over the stored entities of a resource in order of id, a batch at a time.
+
+        The lock is only held to read each batch, so other threads may write in between.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+
+        Yields:
+            Lists of up to `BATCH_SIZE` unvalidated results.
+
+        Raises:
+            ValueError: If the resource is unknown.
+        """
+        if resource not in _TABLES:
+            raise ValueError(f"Unknown resource: {resource!r}")
+        last = -1
+        while True:
+            with self.lock:
+                rows = self.con.execute(
+                    f"SELECT id, json FROM {resource} WHERE id > ? "  # noqa: S608
+                    "ORDER BY id LIMIT ?",
+                    (last, BATCH_SIZE),
+                ).fetchall()
+            if rows:
+                yield [json.loads(x[1]) for x in rows]
+            if len(rows) < BATCH_SIZE:
+                return
+            last = rows[-1][0]
+
+    def comic(self, _id: int) -> Comic | None:
+        """Get a stored comic based on it's `_id`.
+
+        Args:
+            _id: The comic id.
+
+        Returns:
+            A `Comic` object or None if the comic is not stored.
+        """
+        return self._get("comics", _id)
+
+    def comic_characters(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the characters of a comic.
+
+        Args:
+            _id: The comic id.
+            params: Parameters as passed to `Session.comic_characters`.
+
+        Returns:
+            `Results` holding `Character` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("characters", params, comics=_id)
+
+    def comic_creators(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the creators of a comic.
+
+        Args:
+            _id: The comic id.
+            params: Parameters as passed to `Session.comic_creators`.
+
+        Returns:
+            `Results` holding `Creator` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("creators", params, comics=_id)
+
+    def comic_events(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the events of a comic.
+
+        Args:
+            _id: The comic id.
+            params: Parameters as passed to `Session.comic_events`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params, comics=_id)
+
+    def comic_stories(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the stories of a comic.
+
+        Args:
+            _id: The comic id.
+            params: Parameters as passed to `Session.comic_stories`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params, comics=_id)
+
+    def comics_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored comics.
+
+        Args:
+            params: Parameters as passed to `Session.comics_list`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params)
+
+    def series(self, _id: int) -> Series | None:
+        """Get a stored series based on it's `_id`.
+
+        Args:
+            _id: The series id.
+
+        Returns:
+            A `Series` object or None if the series is not stored.
+        """
+        return self._get("series", _id)
+
+    def series_characters(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the characters of a series.
+
+        Args:
+            _id: The series id.
+            params: Parameters as passed to `Session.series_characters`.
+
+        Returns:
+            `Results` holding `Character` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("characters", params, series=_id)
+
+    def series_comics(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the comics of a series.
+
+        Args:
+            _id: The series id.
+            params: Parameters as passed to `Session.series_comics`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params, series=_id)
+
+    def series_creators(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the creators of a series.
+
+        Args:
+            _id: The series id.
+            params: Parameters as passed to `Session.series_creators`.
+
+        Returns:
+            `Results` holding `Creator` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("creators", params, series=_id)
+
+    def series_events(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the events of a series.
+
+        Args:
+            _id: The series id.
+            params: Parameters as passed to `Session.series_events`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params, series=_id)
+
+    def series_stories(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the stories of a series.
+
+        Args:
+            _id: The series id.
+            params: Parameters as passed to `Session.series_stories`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params, series=_id)
+
+    def series_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored series.
+
+        Args:
+            params: Parameters as passed to `Session.series_list`.
+
+        Returns:
+            `Results` holding `Series` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("series", params)
+
+    def creator(self, _id: int) -> Creator | None:
+        """Get a stored creator based on it's `_id`.
+
+        Args:
+            _id: The creator id.
+
+        Returns:
+            A `Creator` object or None if the creator is not stored.
+        """
+        return self._get("creators", _id)
+
+    def creator_comics(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the comics of a creator.
+
+        Args:
+            _id: The creator id.
+            params: Parameters as passed to `Session.creator_comics`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params, creators=_id)
+
+    def creator_events(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the events of a creator.
+
+        Args:
+            _id: The creator id.
+            params: Parameters as passed to `Session.creator_events`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params, creators=_id)
+
+    def creator_series(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the series of a creator.
+
+        Args:
+            _id: The creator id.
+            params: Parameters as passed to `Session.creator_series`.
+
+        Returns:
+            `Results` holding `Series` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("series", params, creators=_id)
+
+    def creator_stories(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the stories of a creator.
+
+        Args:
+            _id: The creator id.
+            params: Parameters as passed to `Session.creator_stories`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params, creators=_id)
+
+    def creators_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored creators.
+
+        Args:
+            params: Parameters as passed to `Session.creators_list`.
+
+        Returns:
+            `Results` holding `Creator` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("creators", params)
+
+    def character(self, _id: int) -> Character | None:
+        """Get a stored character based on it's `_id`.
+
+        Args:
+            _id: The character id.
+
+        Returns:
+            A `Character` object or None if the character is not stored.
+        """
+        return self._get("characters", _id)
+
+    def character_comics(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the comics of a character.
+
+        Args:
+            _id: The character id.
+            params: Parameters as passed to `Session.character_comics`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params, characters=_id)
+
+    def character_events(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the events of a character.
+
+        Args:
+            _id: The character id.
+            params: Parameters as passed to `Session.character_events`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params, characters=_id)
+
+    def character_series(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the series of a character.
+
+        Args:
+            _id: The character id.
+            params: Parameters as passed to `Session.character_series`.
+
+        Returns:
+            `Results` holding `Series` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("series", params, characters=_id)
+
+    def character_stories(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the stories of a character.
+
+        Args:
+            _id: The character id.
+            params: Parameters as passed to `Session.character_stories`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params, characters=_id)
+
+    def characters_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored characters.
+
+        Args:
+            params: Parameters as passed to `Session.characters_list`.
+
+        Returns:
+            `Results` holding `Character` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("characters", params)
+
+    def story(self, _id: int) -> Story | None:
+        """Get a stored story based on it's `_id`.
+
+        Args:
+            _id: The story id.
+
+        Returns:
+            A `Story` object or None if the story is not stored.
+        """
+        return self._get("stories", _id)
+
+    def story_characters(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the characters of a story.
+
+        Args:
+            _id: The story id.
+            params: Parameters as passed to `Session.story_characters`.
+
+        Returns:
+            `Results` holding `Character` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("characters", params, stories=_id)
+
+    def story_comics(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the comics of a story.
+
+        Args:
+            _id: The story id.
+            params: Parameters as passed to `Session.story_comics`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params, stories=_id)
+
+    def story_creators(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the creators of a story.
+
+        Args:
+            _id: The story id.
+            params: Parameters as passed to `Session.story_creators`.
+
+        Returns:
+            `Results` holding `Creator` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("creators", params, stories=_id)
+
+    def story_events(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the events of a story.
+
+        Args:
+            _id: The story id.
+            params: Parameters as passed to `Session.story_events`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params, stories=_id)
+
+    def story_series(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the series of a story.
+
+        Args:
+            _id: The story id.
+            params: Parameters as passed to `Session.story_series`.
+
+        Returns:
+            `Results` holding `Series` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("series", params, stories=_id)
+
+    def stories_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored stories.
+
+        Args:
+            params: Parameters as passed to `Session.stories_list`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params)
+
+    def event(self, _id: int) -> Event | None:
+        """Get a stored event based on it's `_id`.
+
+        Args:
+            _id: The event id.
+
+        Returns:
+            A `Event` object or None if the event is not stored.
+        """
+        return self._get("events", _id)
+
+    def event_characters(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the characters of a event.
+
+        Args:
+            _id: The event id.
+            params: Parameters as passed to `Session.event_characters`.
+
+        Returns:
+            `Results` holding `Character` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("characters", params, events=_id)
+
+    def event_comics(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the comics of a event.
+
+        Args:
+            _id: The event id.
+            params: Parameters as passed to `Session.event_comics`.
+
+        Returns:
+            `Results` holding `Comic` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("comics", params, events=_id)
+
+    def event_creators(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the creators of a event.
+
+        Args:
+            _id: The event id.
+            params: Parameters as passed to `Session.event_creators`.
+
+        Returns:
+            `Results` holding `Creator` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("creators", params, events=_id)
+
+    def event_series(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the series of a event.
+
+        Args:
+            _id: The event id.
+            params: Parameters as passed to `Session.event_series`.
+
+        Returns:
+            `Results` holding `Series` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("series", params, events=_id)
+
+    def event_stories(self, _id: int, params: dict[str, Any] | None = None) -> Results:
+        """Query the stories of a event.
+
+        Args:
+            _id: The event id.
+            params: Parameters as passed to `Session.event_stories`.
+
+        Returns:
+            `Results` holding `Story` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("stories", params, events=_id)
+
+    def events_list(self, params: dict[str, Any] | None = None) -> Results:
+        """Query the stored events.
+
+        Args:
+            params: Parameters as passed to `Session.events_list`.
+
+        Returns:
+            `Results` holding `Event` objects.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        return self._list("events", params)
+
+    def _get(self, resource: str, _id: int) -> Any:  # noqa: ANN401
+        with self.lock:
+            sql = f"SELECT json FROM {resource} WHERE id = ?"  # noqa: S608
+            row = self.con.execute(sql, (_id,)).fetchone()
+        return _TABLES[resource].model.model_validate(json.loads(row[0])) if row else None
+
+    def _list(self, resource: str, params: dict[str, Any] | None = None, **related: int) -> Results:
+        """Query a resource table with the filters, ordering and paging of the Marvel API.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+            params: Parameters as passed to the `Session` methods, e.g. `{"titleStartsWith": "X"}`.
+            **related: An id of a related resource to filter on, e.g. `series=466`.
+
+        Returns:
+            `Results` of models.
+
+        Raises:
+            ValueError: If a parameter is not supported by the store.
+        """
+        table = _TABLES[resource]
+        params = {**(params or {}), **related}
+        conditions, args = [], []
+        for key, value in params.items():
+            if key in ("orderBy", "limit", "offset"):
+                continue
+            if key in _TABLES:
+                ids = [int(x) for x in str(value).split(",")]
+                placeholders = ", ".join("?" * len(ids))
+                conditions.append(f"id IN ({_linked_ids(resource, _comic_ids(key, placeholders))})")
+                args.extend(ids)
+            elif key in table.filters:
+                condition, values = table.filters[key](value)
+                conditions.append(condition)
+                args.extend(values)
+            else:
+                raise ValueError(f"Unsupported parameter for {resource}: {key!r}")
+        order = []
+        for key in str(params.get("orderBy", "")).split(","):
+            if not key:
+                continue
+            if (column := table.order.get(key.removeprefix("-"))) is None:
+                raise ValueError(f"Unsupported orderBy for {resource}: {key!r}")
+            order.append(f"{column} {'DESC' if key.startswith('-') else 'ASC'}")
+        if not order and table.name:
+            order.append(f"{table.name} COLLATE NOCASE")
+        sql = (
+            f"SELECT json FROM {resource} WHERE {' AND '.join(conditions) or '1'} "  # noqa: S608
+            f"ORDER BY {', '.join([*order, 'id'])} LIMIT ? OFFSET ?"
+        )
+        args.extend([int(params.get("limit", DEFAULT_LIMIT)), int(params.get("offset", 0))])
+        with self.lock:
+            rows = self.con.execute(sql, args).fetchall()
+        return Results(table.model.model_validate(json.loads(x[0])) for x in rows)
@@ -0,0 +1,152 @@
+"""Streaming module.
+
+This module provides the following functions:
+
+- iter_results
+"""
+
+__all__ = ["iter_results"]
+
+import codecs
+from collections.abc import Iterable, Iterator
+from json import JSONDecodeError, JSONDecoder
+from typing import Any
+
+_DECODER = JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Reader:
+    """Incrementally decode JSON values from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._done = False
+        self.buffer = ""
+        self.pos = 0
+
+    def fill(self, size: int = 0) -> bool:
+        """Append chunks to the buffer, dropping what has already been read.
+
+        Args:
+            size: Keep reading chunks until the buffer holds this many unread characters.
+
+        Returns:
+            Whether anything was appended or more chunks may follow.
+        """
+        if self._done:
+            return False
+        parts = [self.buffer[self.pos :]]
+        unread = length = len(parts[0])
+        while True:
+            text = ""
+            for chunk in self._chunks:
+                if text := self._decoder.decode(chunk):
+                    break
+            else:
+                self._done = True
+                text = self._decoder.decode(b"", final=True)
+            parts.append(text)
+            length += len(text)
+            if self._done or length >= size:
+                break
+        # Joined once, so a value spanning many chunks isn't copied again for each chunk.
+        self.buffer = "".join(parts)
+        self.pos = 0
+        return length > unread or not self._done
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character without consuming it."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def expect(self, char: str) -> None:
+        """Consume `char`, which must be the next character."""
+        if (found := self.peek()) != char:
+            raise ValueError(f"Expected {char!r} but found {found!r} in JSON document")
+        self.pos += 1
+
+    def value(self) -> Any:  # noqa: ANN401
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                # Read at least as much again before the next attempt, so a value spanning many
+                # chunks is decoded a logarithmic number of times instead of once per chunk.
+                if not self.fill(2 * (len(self.buffer) - self.pos)):
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk.
+            if end == len(self.buffer) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_results(
+    chunks: Iterable[bytes], meta: dict[str, Any] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Yield each entry of `data.results` from a Marvel response body as it is read.
+
+    Only one result is held in memory at a time, on top of the chunk being read.
+
+    Args:
+        chunks: The response body as an iterable of byte chunks.
+        meta: Optional dict which is filled with the other values of the response and of its
+            `data` object, e.g. `code`, `etag`, `offset`, `total` or `message`.
+
+    Yields:
+        Each result as a dict.
+
+    Raises:
+        ValueError: If the body is not a valid JSON object.
+    """
+    meta = {} if meta is None else meta
+    reader = _Reader(chunks)
+    for key in _members(reader):
+        if key == "data" and reader.peek() == "{":
+            for data_key in _members(reader):
+                if data_key == "results" and reader.peek() == "[":
+                    yield from _items(reader)
+                else:
+                    meta[data_key] = reader.value()
+        else:
+            meta[key] = reader.value()
+
+
+def _members(reader: _Reader) -> Iterator[str]:
+    reader.expect("{")
+    if reader.peek() == "}":
+        reader.pos += 1
+        return
+    while True:
+        key = reader.value()
+        reader.expect(":")
+        yield key
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("}")
+        return
+
+
+def _items(reader: _Reader) -> Iterator[Any]:
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.pos += 1
+        return
+    while True:
+        yield reader.value()
+        if reader.peek() == ",":
+            reader.pos += 1
+            continue
+        reader.expect("]")
+        return
@@ -0,0 +1,179 @@
+"""Sync module.
+
+This module provides the following classes:
+
+- Checkpoint
+- Store
+- Sync
+- SyncState
+"""
+
+__all__ = ["Checkpoint", "Store", "Sync", "SyncState"]
+
+import sqlite3
+import threading
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from esak.session import RESOURCE_MODELS, Session
+
+PAGE_SIZE = 100
+
+
+class Store(Protocol):
+    """The interface of a local store that `Sync` writes changed entities to."""
+
+    def upsert(self, resource: str, results: list[dict[str, Any]]) -> None:
+        """Insert or replace entities.
+
+        Entities may be received more than once, e.g. when resuming a sync, so replacing an
+        entity with the same id must be harmless.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+            results: The unvalidated results from Marvel.
+        """
+
+
+@dataclass
+class Checkpoint:
+    """The progress of syncing a resource.
+
+    Attributes:
+        since: The `modified` timestamp used as `modifiedSince`, None to request everything.
+        offset: The number of results modified at `since` which are already stored.
+        running: Whether a sync was started and has not finished yet.
+    """
+
+    since: str | None = None
+    offset: int = 0
+    running: bool = False
+
+
+class SyncState:
+    """The SyncState object to keep the checkpoint of each resource in a SQLite database.
+
+    Args:
+        db_name: Path and database name to use.
+    """
+
+    def __init__(self, db_name: str = "esak_sync.db") -> None:
+        self.con = sqlite3.connect(db_name, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.con.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints "
+            "(resource TEXT PRIMARY KEY, since TEXT, offset INTEGER, running INTEGER)"
+        )
+
+    def get(self, resource: str) -> Checkpoint:
+        """Retrieve the checkpoint of a resource.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+
+        Returns:
+            The stored checkpoint or an empty one if the resource was never synced.
+        """
+        with self.lock:
+            row = self.con.execute(
+                "SELECT since, offset, running FROM checkpoints WHERE resource = ?", (resource,)
+            ).fetchone()
+        return Checkpoint(row[0], row[1], bool(row[2])) if row else Checkpoint()
+
+    def save(self, resource: str, checkpoint: Checkpoint) -> None:
+        """Save the checkpoint of a resource.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+            checkpoint: The progress to save.
+        """
+        with self.lock:
+            self.con.execute(
+                "INSERT OR REPLACE INTO checkpoints(resource, since, offset, running) "
+                "VALUES(?, ?, ?, ?)",
+                (resource, checkpoint.since, checkpoint.offset, int(checkpoint.running)),
+            )
+            self.con.commit()
+
+
+class Sync:
+    """The Sync object to mirror the Marvel catalog incrementally into a local store.
+
+    Each resource is requested through its list endpoint with `orderBy=modified` and
+    `modifiedSince` set to the newest `modified` timestamp already stored, so only entities which
+    changed since the previous sync are requested. Pages continue from the newest timestamp of the
+    previous page instead of a growing offset, so entities modified during a sync are not skipped.
+    The checkpoint is saved after each page, and an interrupted sync resumes where it stopped.
+
+    Args:
+        session: The session to request the list endpoints with, its cache is not used.
+        store: The store to upsert the changed entities into.
+        state: The state to keep the checkpoints in.
+        page_size: The number of results to request per call, up to 100.
+    """
+
+    def __init__(
+        self, session: Session, store: Store, state: SyncState, page_size: int = PAGE_SIZE
+    ) -> None:
+        self.session = session
+        self.store = store
+        self.state = state
+        self.page_size = page_size
+
+    def run(self, resources: list[str] | None = None) -> dict[str, int]:
+        """Sync several resources, one after the other.
+
+        Args:
+            resources: The resource names to sync, defaults to the whole catalog.
+
+        Returns:
+            The number of upserted results for each resource.
+        """
+        return {x: self.sync(x) for x in resources or RESOURCE_MODELS}
+
+    def sync(self, resource: str) -> int:
+        """Sync the entities of a resource which changed since its previous sync.
+
+        Args:
+            resource: The resource name, e.g. `"comics"`.
+
+        Returns:
+            The number of upserted results.
+
+        Raises:
+            ValueError: If the resource is unknown.
+            ApiError: If a request fails, the checkpoint of the last stored page is kept.
+        """
+        if resource not in RESOURCE_MODELS:
+            raise ValueError(f"Unknown resource: {resource!r}")
+        checkpoint = self.state.get(resource)
+        if not checkpoint.running:
+            checkpoint = Checkpoint(checkpoint.since, 0, running=True)
+            self.state.save(resource, checkpoint)
+        count = 0
+        while True:
+            params: dict[str, Any] = {
+                "orderBy": "modified",
+                "limit": self.page_size,
+                "offset": checkpoint.offset,
+            }
+            if checkpoint.since:
+                params["modifiedSince"] = checkpoint.since
+            results = self.session.fetch_page([resource], params, use_cache=False)["results"]
+            if results:
+                self.store.upsert(resource, results)
+                count += len(results)
+                checkpoint = _advance(checkpoint, results)
+            if len(results) < self.page_size:
+                break
+            self.state.save(resource, checkpoint)
+        self.state.save(resource, Checkpoint(checkpoint.since))
+        return count
+
+
+def _advance(checkpoint: Checkpoint, results: list[dict[str, Any]]) -> Checkpoint:
+    newest = results[-1].get("modified")
+    if not newest or newest.startswith("-") or newest == checkpoint.since:
+        return Checkpoint(checkpoint.since, checkpoint.offset + len(results), running=True)
+    offset = sum(1 for x in results if x.get("modified") == newest)
+    return Checkpoint(newest, offset, running=True)
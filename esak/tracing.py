@@ -0,0 +1,222 @@
+"""Tracing module.
+
+This module provides the following classes:
+
+- InMemoryExporter
+- Span
+- Tracer
+
+This module provides the following functions:
+
+- cache_key_hash
+"""
+
+__all__ = ["NO_SPAN", "InMemoryExporter", "Span", "Tracer", "cache_key_hash"]
+
+import hashlib
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Any
+
+from esak import __version__
+
+_CURRENT: ContextVar["Span | None"] = ContextVar("esak_span", default=None)
+
+
+@dataclass(eq=False)
+class Span:
+    """A span recorded by an `InMemoryExporter`, mirroring the OpenTelemetry span interface.
+
+    Attributes:
+        name: The span name, e.g. `"esak.http"`.
+        parent: The span which was current when this span started.
+        attributes: The attributes set on the span.
+        events: The name and attributes of each event added to the span.
+        status: `"UNSET"`, or `"ERROR"` if an exception escaped the span.
+        start_time: When the span started, in nanoseconds since the epoch.
+        end_time: When the span ended, None while it is running.
+    """
+
+    name: str
+    parent: "Span | None" = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    events: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    status: str = "UNSET"
+    start_time: int = 0
+    end_time: int | None = None
+
+    def is_recording(self) -> bool:
+        """Whether the span is still running."""
+        return self.end_time is None
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute.
+
+        Args:
+            key: The attribute name, e.g. `"http.response.status_code"`.
+            value: The attribute value.
+        """
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
+        """Add an event which happened during the span.
+
+        Args:
+            name: The event name, e.g. `"retry"`.
+            attributes: The attributes of the event.
+        """
+        self.events.append((name, dict(attributes or {})))
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Add an `exception` event describing an exception.
+
+        Args:
+            exception: The exception.
+        """
+        self.add_event(
+            "exception",
+            {"exception.type": type(exception).__name__, "exception.message": str(exception)},
+        )
+
+
+class _NoOpSpan(AbstractContextManager):
+    """A span which records nothing, used when tracing is disabled."""
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        return None
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:  # noqa: ANN401
+        pass
+
+    def add_event(self, name: str, attributes: dict[str, Any] | None = None) -> None:
+        pass
+
+    def record_exception(self, exception: BaseException) -> None:
+        pass
+
+
+# The span used when tracing is disabled, which is also its own context manager.
+NO_SPAN = _NoOpSpan()
+
+
+class InMemoryExporter:
+    """The InMemoryExporter object keeps the spans of a `Tracer` in memory, e.g. for tests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        """Keep a finished span.
+
+        Args:
+            span: The span.
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    def get_finished_spans(self) -> list[Span]:
+        """Read the finished spans in the order they ended.
+
+        Returns:
+            The finished spans.
+        """
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        """Forget the finished spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    """The Tracer object opens the spans of a `Session` with OpenTelemetry.
+
+    Each endpoint call of the session opens a span named after the method, e.g. `esak.comic`,
+    with the child spans `esak.fetch_page` for each page, `esak.validate` for the validation,
+    and below each page `esak.cache` for the cache lookup and `esak.http` for the request,
+    which has a `retry` event per retried attempt.
+
+    Args:
+        tracer: The OpenTelemetry tracer to use, by default the tracer named `esak` of the
+            global tracer provider. Spans do nothing if OpenTelemetry is not installed, see the
+            `esak[otel]` extra.
+        exporter: Record the spans in this exporter instead of OpenTelemetry.
+    """
+
+    def __init__(self, tracer: Any = None, exporter: InMemoryExporter | None = None) -> None:  # noqa: ANN401
+        self.exporter = exporter
+        self.tracer = tracer
+        if tracer is None and exporter is None:
+            try:
+                from opentelemetry import trace  # noqa: PLC0415
+            except ImportError:
+                pass
+            else:
+                self.tracer = trace.get_tracer("esak", __version__)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether spans are recorded."""
+        return self.exporter is not None or self.tracer is not None
+
+    def span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> AbstractContextManager[Any]:
+        """Open a span as a child of the current span.
+
+        Exceptions escaping the span are recorded on it and set its status to error.
+
+        Args:
+            name: The span name, e.g. `"esak.http"`.
+            attributes: The initial attributes of the span.
+
+        Returns:
+            A context manager which yields the span and ends it on exit.
+        """
+        if self.exporter is not None:
+            return self._record(name, attributes)
+        if self.tracer is not None:
+            return self.tracer.start_as_current_span(name, attributes=attributes)
+        return NO_SPAN
+
+    @contextmanager
+    def _record(self, name: str, attributes: dict[str, Any] | None) -> Iterator[Span]:
+        span = Span(name, _CURRENT.get(), dict(attributes or {}), start_time=time.time_ns())
+        token = _CURRENT.set(span)
+        try:
+            yield span
+        except BaseException as err:
+            span.record_exception(err)
+            span.status = "ERROR"
+            raise
+        finally:
+            span.end_time = time.time_ns()
+            _CURRENT.reset(token)
+            self.exporter.export(span)
+
+
+def cache_key_hash(key: str) -> str:
+    """Hash a cache key, which keeps it short and keeps query parameters out of the traces.
+
+    Args:
+        key: The cache key.
+
+    Returns:
+        The first 16 hexadecimal digits of the SHA-256 of the key.
+    """
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
@@ -8,7 +8,7 @@ import json
 import pytest
 import requests_mock
 
-from esak import api
+from esak import api, sqlite_cache
 from esak.exceptions import CacheError
 from esak.sqlite_cache import SqliteCache
 
@@ -71,3 +71,25 @@ def test_sql_store(dummy_pubkey: str, dummy_privkey: str) -> None:
             "without deleting the database."
         )
         raise AssertionError from None
+
+
+def test_sql_items() -> None:
+    """Test iterating over the cached data."""
+    cache = SqliteCache(":memory:")
+    cache.store("a", {"results": [1]})
+    cache.store("b", [2])
+    assert dict(cache.items()) == {"a": {"results": [1]}, "b": [2]}
+
+
+def test_sql_items_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the cached data is read a batch at a time, without holding the lock in between."""
+    monkeypatch.setattr(sqlite_cache, "BATCH_SIZE", 2)
+    cache = SqliteCache(":memory:")
+    for x in range(5):
+        cache.store(str(x), x)
+    entries = []
+    for key, value in cache.items():
+        entries.append((key, value))
+        if key == "0":
+            cache.store("5", 5)
+    assert entries == [(str(x), x) for x in range(6)]
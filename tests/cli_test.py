@@ -0,0 +1,141 @@
+"""Test CLI module.
+
+This module contains tests for the esak command line tool.
+"""
+
+import json
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+import requests_mock
+
+from esak import cli
+from esak.cli import main
+from esak.server import StandInServer
+
+CACHE = "tests/testing_mock.sqlite"
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+@pytest.fixture
+def cache_copy(tmp_path: Path) -> str:
+    """A copy of the test cache which can be changed."""
+    path = tmp_path / "cache.sqlite"
+    shutil.copy(CACHE, path)
+    return str(path)
+
+
+def test_get(capsys: pytest.CaptureFixture) -> None:
+    """Test requesting an endpoint as text and as JSON."""
+    assert main(["--cache", CACHE, "get", "comics/16926"]) == 0
+    assert capsys.readouterr().out == "16926\tAmazing Fantasy (1962) #15\n"
+
+    assert main(["--cache", CACHE, "--json", "get", "series/24396/comics", "--fields", "id"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert len(results) == 20
+    assert set(results[0]) == {"id"}
+
+
+def test_get_errors(capsys: pytest.CaptureFixture) -> None:
+    """Test invalid endpoints and API errors."""
+    with pytest.raises(SystemExit):
+        main(["get", "villains/1"])
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}/1", status_code=409, json={"code": 409, "status": "Limit too large"})
+        assert main(["--no-cache", "get", "comics/1"]) == 1
+    assert "Limit too large" in capsys.readouterr().err
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}/1", exc=requests.ConnectionError("Connection refused"))
+        assert main(["--no-cache", "--timeout", "2", "get", "comics/1"]) == 1
+    assert capsys.readouterr().err == "esak: error: Connection refused\n"
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}/1", json={"code": 200, "data": {"results": [{"id": 1}]}})
+        assert main(["--no-cache", "get", "comics/1", "--fields", "bogus"]) == 1
+    assert capsys.readouterr().err == "esak: error: Comic has no field(s): bogus\n"
+
+
+def test_crawl(capsys: pytest.CaptureFixture) -> None:
+    """Test every page of an endpoint is requested into the cache."""
+    comics = [{"id": x} for x in range(250)]
+
+    def callback(request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401, ARG001
+        params = parse_qs(urlparse(request.url).query)
+        offset, limit = int(params["offset"][0]), int(params["limit"][0])
+        results = comics[offset : offset + limit]
+        return {"code": 200, "data": {"offset": offset, "total": 250, "results": results}}
+
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=callback)
+        assert main(["--cache", ":memory:", "--json", "crawl", "comics", "--workers", "3"]) == 0
+        assert r.call_count == 3
+    output = capsys.readouterr()
+    summary = json.loads(output.out)
+    assert summary["pages"] == 3
+    assert summary["results"] == summary["total"] == 250
+    assert "page 3/3: 250/250 results" in output.err
+
+
+def test_cache(cache_copy: str, tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """Test the cache maintenance commands."""
+    assert main(["--cache", cache_copy, "--json", "cache", "stats"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["entries"] == stats["keys"] > 0
+
+    export = str(tmp_path / "cache.ndjson")
+    assert main(["--cache", cache_copy, "--json", "cache", "export", export]) == 0
+    assert json.loads(capsys.readouterr().out)["exported"] == stats["entries"]
+    fresh = str(tmp_path / "fresh.sqlite")
+    assert main(["--cache", fresh, "--json", "cache", "import", export]) == 0
+    assert json.loads(capsys.readouterr().out)["imported"] == stats["entries"]
+    assert main(["--cache", fresh, "cache", "import", export]) == 0
+    assert capsys.readouterr().out.startswith("imported: 0\n")
+
+    assert main(["--cache", cache_copy, "--json", "cache", "vacuum"]) == 0
+    assert json.loads(capsys.readouterr().out)["removed"] == 0
+
+
+def test_bench(capsys: pytest.CaptureFixture) -> None:
+    """Test measuring the latency of an endpoint."""
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}/1", json={"code": 200, "data": {"results": [{"id": 1}]}})
+        assert (
+            main(["--cache", ":memory:", "-q", "--json", "bench", "comics/1", "--repeat", "3"]) == 0
+        )
+        assert r.call_count == 4
+    summary = json.loads(capsys.readouterr().out)
+    assert summary["runs"] == 3
+    assert set(summary) == {"endpoint", "runs", "network", "cache"}
+    assert summary["cache"]["min_ms"] <= summary["cache"]["max_ms"]
+
+
+def test_serve(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture) -> None:
+    """Test serving the stand-in from the cache until interrupted."""
+    responses = []
+
+    class OneRequest(StandInServer):
+        """Stand-in answering a single request before being interrupted."""
+
+        def serve_forever(self, poll_interval: float = 0.5) -> None:  # noqa: ARG002
+            """Answer a request of a client thread, then stop as on Ctrl+C."""
+            url = self.api_url.format("comics/16926")
+            client = threading.Thread(
+                target=lambda: responses.append(
+                    requests.get(url, params={"apikey": "a"}, timeout=5)
+                )
+            )
+            client.start()
+            self.handle_request()
+            client.join()
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(cli, "StandInServer", OneRequest)
+    assert main(["--cache", CACHE, "--json", "serve", "--port", "0"]) == 0
+    assert responses[0].json()["data"]["results"][0]["id"] == 16926
+    output = capsys.readouterr()
+    assert json.loads(output.out) == {"requests": 1}
+    assert f"from {CACHE}" in output.err
@@ -4,6 +4,8 @@ This module contains pytest fixtures.
 """
 
 import os
+from collections.abc import Callable
+from typing import Any
 
 import pytest
 
@@ -32,3 +34,17 @@ def talker(dummy_pubkey: str, dummy_privkey: str) -> Session:
         private_key=dummy_privkey,
         cache=SqliteCache("tests/testing_mock.sqlite"),
     )
+
+
+@pytest.fixture(scope="session")
+def make_session(dummy_pubkey: str, dummy_privkey: str) -> Callable[..., Session]:
+    """Factory of sessions reading the test cache, taking the keyword arguments of `Session`.
+
+    For example `make_session(frozen=True)` or `make_session(cache=other_cache, raw=True)`.
+    """
+
+    def make(**kwargs: Any) -> Session:
+        kwargs.setdefault("cache", SqliteCache("tests/testing_mock.sqlite"))
+        return Session(dummy_pubkey, dummy_privkey, **kwargs)
+
+    return make
@@ -0,0 +1,135 @@
+"""Test Crawl module.
+
+This module contains tests for traversing the graph of references.
+"""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from esak.crawl import Crawler, CrawlState, Node
+from esak.exceptions import ApiError
+from esak.server import StandInServer
+from esak.session import Session
+
+URI = "http://gateway.marvel.com/v1/public/{}"
+
+
+def _items(*paths: str) -> dict[str, Any]:
+    return {"available": len(paths), "items": [{"resourceURI": URI.format(x)} for x in paths]}
+
+
+# Every character appears in comics 1 and 2, every comic has characters 1 and 2 and creator 1,
+# and every creator made comics 2 and 99, which doesn't exist.
+RECORDS = {
+    "characters": [{"name": "Character", "comics": _items("comics/1", "comics/2")}],
+    "comics": [
+        {
+            "title": "Comic",
+            "characters": _items("characters/1", "characters/2"),
+            "creators": _items("creators/1"),
+        }
+    ],
+    "creators": [{"fullName": "Creator", "comics": _items("comics/2", "comics/99")}],
+}
+
+
+class MemoryStore:
+    """Store keeping the upserted results in a dict, failing after `limit` entities."""
+
+    def __init__(self, limit: int | None = None) -> None:
+        self.entities: dict[tuple[str, int], dict[str, Any]] = {}
+        self.limit = limit
+
+    def upsert(self, resource: str, results: list[dict[str, Any]]) -> None:
+        """Insert or replace entities."""
+        if self.limit is not None and len(self.entities) >= self.limit:
+            raise KeyboardInterrupt
+        self.entities.update(((resource, x["id"]), x) for x in results)
+
+
+@pytest.fixture
+def server() -> Iterator[StandInServer]:
+    """Stand-in serving 10 synthetic entities of each resource."""
+    with StandInServer(records=RECORDS, total=10) as server:
+        yield server
+
+
+@pytest.fixture
+def session(dummy_pubkey: str, dummy_privkey: str, server: StandInServer) -> Session:
+    """Session sending its requests to the stand-in."""
+    session = Session(dummy_pubkey, dummy_privkey)
+    session.api_url = server.api_url
+    return session
+
+
+@pytest.fixture
+def state(tmp_path: Path) -> CrawlState:
+    """Crawl state in a temporary database."""
+    return CrawlState(str(tmp_path / "crawl.db"))
+
+
+def test_crawl(session: Session, server: StandInServer, state: CrawlState) -> None:
+    """Test every reachable entity is fetched once."""
+    store = MemoryStore()
+    crawler = Crawler(session, store, state, workers=3)
+    assert crawler.crawl([("characters", 1)]) == {"characters": 2, "comics": 2, "creators": 1}
+    assert sorted(store.entities) == [
+        ("characters", 1),
+        ("characters", 2),
+        ("comics", 1),
+        ("comics", 2),
+        ("creators", 1),
+    ]
+    assert state.counts() == {"pending": 0, "fetched": 5, "missing": 1}
+    assert set(server.requests.values()) == {1}
+    assert len(server.requests) == 6
+    assert crawler.crawl([("characters", 1)]) == {}
+
+
+def test_filters(session: Session, state: CrawlState) -> None:
+    """Test references beyond the depth or to other resources are not followed."""
+    store = MemoryStore()
+    Crawler(session, store, state, max_depth=1).crawl([("characters", 1)])
+    assert sorted(store.entities) == [("characters", 1), ("comics", 1), ("comics", 2)]
+    state.clear()
+    store = MemoryStore()
+    Crawler(session, store, state, resources=["characters"]).crawl([("comics", 2)])
+    assert sorted(store.entities) == [("characters", 1), ("characters", 2), ("comics", 2)]
+    with pytest.raises(ValueError, match="Unknown resource: heroes"):
+        Crawler(session, store, state, resources=["heroes"])
+
+
+def test_resume(session: Session, server: StandInServer, state: CrawlState) -> None:
+    """Test an interrupted crawl resumes with its frontier."""
+    with pytest.raises(KeyboardInterrupt):
+        Crawler(session, MemoryStore(limit=2), state, workers=1).crawl([("characters", 1)])
+    assert state.counts() == {"pending": 3, "fetched": 2, "missing": 0}
+    assert state.pending() == [
+        Node("comics", 2, 1),
+        Node("characters", 2, 2),
+        Node("creators", 1, 2),
+    ]
+    store = MemoryStore()
+    assert Crawler(session, store, state).crawl() == {"characters": 1, "comics": 1, "creators": 1}
+    assert state.counts() == {"pending": 0, "fetched": 5, "missing": 1}
+    # Only the entity in flight when the crawl was interrupted is fetched again.
+    assert server.requests["comics/2"] == 2
+    assert sum(server.requests.values()) == 7
+
+
+def test_missing_status(
+    session: Session, state: CrawlState, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test entities are missing on a 404 status whatever its message, other errors are raised."""
+
+    def fetch_page(endpoint: list[str | int], params: dict[str, Any] | None = None) -> None:  # noqa: ARG001
+        raise ApiError("Not here", status=404 if endpoint[1] == 1 else 500)
+
+    monkeypatch.setattr(session, "fetch_page", fetch_page)
+    assert Crawler(session, MemoryStore(), state).crawl([("comics", 1)]) == {}
+    assert state.counts() == {"pending": 0, "fetched": 0, "missing": 1}
+    with pytest.raises(ApiError, match="Not here"):
+        Crawler(session, MemoryStore(), state).crawl([("comics", 2)])
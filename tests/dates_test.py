@@ -0,0 +1,76 @@
+"""Test Dates module.
+
+This module contains tests for parsing Marvel dates.
+"""
+
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from esak.schemas.dates import parse_date, parse_datetime, utc_timestamp
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2021-08-25", date(2021, 8, 25)),
+        ("2008-05-19 00:00:00", date(2008, 5, 19)),
+        ("2021-08-25T00:00:00-0400", date(2021, 8, 25)),
+        ("-0001-11-30T00:00:00-0500", None),
+        ("", None),
+        (None, None),
+        (date(2021, 8, 25), date(2021, 8, 25)),
+    ],
+)
+def test_parse_date(value: str | None, expected: date | None) -> None:
+    """Test parsing the formats Marvel uses for dates."""
+    assert parse_date(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (
+            "2018-02-21T12:37:00-0500",
+            datetime(2018, 2, 21, 12, 37, tzinfo=timezone(timedelta(hours=-5))),
+        ),
+        ("2018-02-21T12:37:00+05:30", datetime(2018, 2, 21, 7, 7, tzinfo=timezone.utc)),
+        ("2018-02-21T12:37:00Z", datetime(2018, 2, 21, 12, 37, tzinfo=timezone.utc)),
+        ("2008-05-19 10:20:30", datetime(2008, 5, 19, 10, 20, 30)),
+        (
+            "2019-01-01T00:00:00.123-0500",
+            datetime(2019, 1, 1, 0, 0, 0, 123000, tzinfo=timezone(timedelta(hours=-5))),
+        ),
+        (
+            "2019-01-01T00:00:00.1234567Z",
+            datetime(2019, 1, 1, 0, 0, 0, 123456, tzinfo=timezone.utc),
+        ),
+        ("2021-08-25T00:00", datetime(2021, 8, 25)),
+        ("-0001-11-30T00:00:00-0500", None),
+    ],
+)
+def test_parse_datetime(value: str, expected: datetime | None) -> None:
+    """Test parsing the formats Marvel uses for timestamps."""
+    assert parse_datetime(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2018-02-21T12:37:00-0500", "2018-02-21T17:37:00+00:00"),
+        ("2008-05-19 10:20:30", "2008-05-19T10:20:30+00:00"),
+        ("-0001-11-30T00:00:00-0500", None),
+        (None, None),
+    ],
+)
+def test_utc_timestamp(value: str | None, expected: str | None) -> None:
+    """Test timestamps are converted to UTC, taking those without an offset as UTC."""
+    assert utc_timestamp(value) == expected
+
+
+def test_unknown_format() -> None:
+    """Test that unknown formats are rejected."""
+    with pytest.raises(ValueError, match="Unknown"):
+        parse_date("08/25/2021")
+    with pytest.raises(ValueError, match="Unknown"):
+        parse_datetime("08/25/2021 00:00")
@@ -0,0 +1,101 @@
+"""Test Export module.
+
+This module contains tests for exporting results to NDJSON and Parquet files.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests_mock
+
+from esak.export import arrow_schema, export, export_parallel, iter_cache, iter_pages
+from esak.schemas.comic import Comic
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+@pytest.fixture(scope="module")
+def comics() -> list[dict[str, Any]]:
+    """All the comic results of the test cache."""
+    cache = SqliteCache("tests/testing_mock.sqlite")
+    return [x for page in iter_cache(cache, "comics") for x in page]
+
+
+def serve(comics: list[dict[str, Any]]) -> Any:  # noqa: ANN401
+    """Stand in for the comics list endpoint."""
+
+    def callback(request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401, ARG001
+        params = parse_qs(urlparse(request.url).query)
+        offset, limit = int(params["offset"][0]), int(params["limit"][0])
+        results = comics[offset : offset + limit]
+        return {"code": 200, "data": {"offset": offset, "total": len(comics), "results": results}}
+
+    return callback
+
+
+def test_iter_cache(comics: list[dict[str, Any]]) -> None:
+    """Test each entity is read once from the cache."""
+    ids = [x["id"] for x in comics]
+    assert len(ids) == len(set(ids))
+    assert 16926 in ids
+    pages = list(iter_cache(SqliteCache("tests/testing_mock.sqlite"), "comics", 10))
+    assert all(len(x) >= 10 for x in pages[:-1])
+
+
+def test_ndjson(comics: list[dict[str, Any]], tmp_path: Path) -> None:
+    """Test results are written as one model per line."""
+    path = tmp_path / "comics.ndjson"
+    assert export([comics[:30], comics[30:]], "comics", path) == len(comics)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(comics)
+    first = json.loads(lines[0])
+    assert first["id"] == comics[0]["id"]
+    assert set(first) == set(Comic.model_fields)
+
+
+def test_parquet(comics: list[dict[str, Any]], tmp_path: Path) -> None:
+    """Test results are written in row groups with the schema of the model."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "comics.parquet"
+    export([comics[:50], comics[50:]], "comics", path, row_group_size=40)
+    parquet = pq.ParquetFile(path)
+    assert parquet.schema_arrow == arrow_schema(Comic)
+    assert parquet.metadata.num_rows == len(comics)
+    assert parquet.metadata.num_row_groups > 1
+    row = parquet.read().slice(0, 1).to_pylist()[0]
+    assert row["id"] == comics[0]["id"]
+    assert isinstance(row["resource_uri"], str)
+
+
+def test_iter_pages(comics: list[dict[str, Any]], dummy_pubkey: str, dummy_privkey: str) -> None:
+    """Test pages are requested until the total is reached, split between shards."""
+    session = Session(dummy_pubkey, dummy_privkey)
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=serve(comics))
+        pages = list(iter_pages(session, ["comics"], page_size=25))
+        assert [len(x) for x in pages] == [25] * (len(comics) // 25) + [len(comics) % 25]
+        assert r.call_count == len(pages)
+        shard = list(iter_pages(session, ["comics"], page_size=25, shard=1, shards=2))
+        assert shard[0] == pages[1]
+        assert shard[1] == pages[3]
+
+
+def test_export_parallel(
+    comics: list[dict[str, Any]], dummy_pubkey: str, dummy_privkey: str, tmp_path: Path
+) -> None:
+    """Test each writer exports a shard of the endpoint."""
+    session = Session(dummy_pubkey, dummy_privkey)
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=serve(comics))
+        counts = export_parallel(
+            session, ["comics"], tmp_path / "comics.ndjson", page_size=20, workers=3
+        )
+    assert sorted(x.name for x in counts) == [f"comics-0000{x}.ndjson" for x in range(3)]
+    assert sum(counts.values()) == len(comics)
+    ids = [json.loads(line)["id"] for path in counts for line in path.read_text().splitlines()]
+    assert sorted(ids) == sorted(x["id"] for x in comics)
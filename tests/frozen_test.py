@@ -0,0 +1,55 @@
+"""Test Frozen module.
+
+This module contains tests for frozen models.
+"""
+
+from collections.abc import Callable
+
+import pytest
+from pydantic import ValidationError
+
+from esak.schemas.comic import Comic
+from esak.schemas.frozen import freeze
+from esak.schemas.generic import GenericItem
+from esak.session import Session
+
+
+@pytest.fixture(scope="module")
+def frozen_talker(make_session: Callable[..., Session]) -> Session:
+    """Esak api fixture returning frozen models."""
+    return make_session(frozen=True)
+
+
+def test_freeze_caches_model() -> None:
+    """Test that freezing returns the same class each time."""
+    assert freeze(Comic) is freeze(Comic)
+    assert freeze(freeze(Comic)) is freeze(Comic)
+
+
+def test_frozen_comic(frozen_talker: Session, talker: Session) -> None:
+    """Test a frozen comic matches the default model and is read-only."""
+    af15 = frozen_talker.comic(16926)
+    assert af15 == frozen_talker.comic(16926)
+    assert hash(af15) == hash(frozen_talker.comic(16926))
+    assert isinstance(af15.characters, tuple)
+    assert af15.series.id == talker.comic(16926).series.id
+    assert af15.model_dump(mode="json") == talker.comic(16926).model_dump(mode="json")
+    with pytest.raises(ValidationError):
+        af15.title = "Foo"
+    with pytest.raises(ValidationError):
+        af15.dates.foc = None
+
+
+def test_frozen_list_fields(frozen_talker: Session) -> None:
+    """Test frozen models combined with a projection."""
+    comics = frozen_talker.series_comics(24396, fields=["id", "title"])
+    assert len({*comics}) == len(comics)
+
+
+def test_frozen_skips_assignment_validators() -> None:
+    """Test the validators only needed on assignment are left out of frozen models."""
+    validators = freeze(GenericItem).__pydantic_decorators__.model_validators
+    assert "parse_id" in validators
+    assert "sync_id" not in validators
+    item = {"name": "Foo", "resourceURI": "http://gateway.marvel.com/v1/public/comics/1"}
+    assert freeze(GenericItem).model_validate(item).id == 1
@@ -0,0 +1,59 @@
+"""Test Generic module.
+
+This module contains tests for GenericItem objects.
+"""
+
+import pytest
+
+from esak.schemas.frozen import freeze
+from esak.schemas.generic import (
+    CompactCreator,
+    CompactItem,
+    CompactStory,
+    GenericCreator,
+    GenericItem,
+    GenericStory,
+)
+from esak.session import Session
+
+URI = "http://gateway.marvel.com/v1/public/characters/1009610"
+
+
+def test_id_parsed_on_validation() -> None:
+    """Test that the id is parsed from the resource uri once."""
+    item = GenericItem.model_validate({"name": "Spider-Man (Peter Parker)", "resourceURI": URI})
+    assert item.id == 1009610
+    assert item.model_dump()["id"] == 1009610
+    assert GenericItem.model_validate(item).id == 1009610
+    assert freeze(GenericItem).model_validate({"name": "Foo", "resourceURI": URI}).id == 1009610
+
+
+def test_id_follows_resource_uri() -> None:
+    """Test that the id is parsed again when the resource uri is reassigned."""
+    item = GenericItem.model_validate({"name": "Spider-Man (Peter Parker)", "resourceURI": URI})
+    item.resource_uri = "http://gateway.marvel.com/v1/public/characters/1009220"
+    assert item.id == 1009220
+    assert item.compact().id == 1009220
+
+
+def test_compact_items(talker: Session) -> None:
+    """Test converting generic items to compact items."""
+    af15 = talker.comic(16926)
+    character = af15.characters[0].compact()
+    assert isinstance(character, CompactItem)
+    assert character.id == af15.characters[0].id
+    assert character.resource_uri == str(af15.characters[0].resource_uri)
+    assert not hasattr(character, "__dict__")
+
+    assert isinstance(af15.stories[0], GenericStory)
+    story = af15.stories[0].compact()
+    assert isinstance(story, CompactStory)
+    assert story.type == "cover"
+
+    assert isinstance(af15.creators[0], GenericCreator)
+    creator = af15.creators[0].compact()
+    assert isinstance(creator, CompactCreator)
+    assert creator.role == af15.creators[0].role
+
+    with pytest.raises(AttributeError):
+        character.name = "Foo"
@@ -0,0 +1,96 @@
+"""Test Hooks module.
+
+This module contains tests for the request lifecycle hooks.
+"""
+
+from collections.abc import Callable
+
+import pytest
+import requests_mock
+
+from esak.exceptions import ApiError
+from esak.hooks import EVENTS, HookEvent, Hooks
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+@pytest.fixture
+def events() -> list[HookEvent]:
+    """List collecting the emitted events."""
+    return []
+
+
+@pytest.fixture
+def session(make_session: Callable[..., Session], events: list[HookEvent]) -> Session:
+    """Session reading the test fixtures with every event recorded."""
+    session = make_session()
+    for name in EVENTS:
+        session.hooks.register(name, events.append)
+    return session
+
+
+def test_cache_hit(session: Session, events: list[HookEvent]) -> None:
+    """Test a cached request emits its start, the cache hit and the validation."""
+    session.comic(16926)
+    assert [x.name for x in events] == ["on_request_start", "on_cache_hit", "on_validate"]
+    start, hit, validate = events
+    assert start.endpoint == hit.endpoint == "comics/16926"
+    assert hit.cache_key.endswith("/comics/16926")
+    assert hit.started == start.started
+    assert set(hit.timings) == {"cache"}
+    assert hit.count == 1
+    assert validate.endpoint == "Comic"
+    assert validate.count == 1
+    assert validate.timings["validate"] > 0
+
+
+def test_response(dummy_pubkey: str, dummy_privkey: str) -> None:
+    """Test a request to Marvel reports the timing of each phase and the response size."""
+    session = Session(dummy_pubkey, dummy_privkey, cache=SqliteCache(":memory:"))
+    responses: list[HookEvent] = []
+    session.hooks.register("on_response", responses.append)
+    with requests_mock.Mocker() as r:
+        body = '{"code": 200, "data": {"total": 2, "results": [{"id": 1}, {"id": 2}]}}'
+        r.get(URL, text=body)
+        session.fetch_page(["comics"])
+    (event,) = responses
+    assert list(event.timings) == ["cache", "auth", "network", "decode", "store"]
+    assert all(x >= 0 for x in event.timings.values())
+    assert event.status == 200
+    assert event.count == 2
+    assert event.size == len(body)
+
+
+def test_error(dummy_pubkey: str, dummy_privkey: str) -> None:
+    """Test a failed request emits the error."""
+    session = Session(dummy_pubkey, dummy_privkey)
+    errors: list[HookEvent] = []
+    session.hooks.register("on_error", errors.append)
+    with requests_mock.Mocker() as r:
+        r.get(URL, status_code=409, json={"code": 409, "status": "Limit greater than 100."})
+        with pytest.raises(ApiError):
+            session.fetch_page(["comics"])
+    (event,) = errors
+    assert event.endpoint == "comics"
+    assert isinstance(event.error, ApiError)
+    assert "network" in event.timings
+
+
+def test_unregister(session: Session, events: list[HookEvent]) -> None:
+    """Test unregistered callbacks are not called anymore."""
+    for name in EVENTS:
+        session.hooks.unregister(name, events.append)
+    assert not session.hooks
+    session.comic(16926)
+    assert events == []
+
+
+def test_unknown_event() -> None:
+    """Test registering an unknown event fails."""
+    hooks = Hooks()
+    with pytest.raises(ValueError, match="Unknown event"):
+        hooks.register("on_nothing", print)
+    with pytest.raises(ValueError, match="not registered"):
+        hooks.unregister("on_error", print)
@@ -0,0 +1,69 @@
+"""Test Identity Map module.
+
+This module contains tests for sharing model instances of the same entity.
+"""
+
+import gc
+from collections.abc import Callable
+
+import pytest
+from pydantic import ValidationError
+
+from esak.identity_map import IdentityMap
+from esak.schemas.generic import GenericItem
+from esak.session import Session
+
+
+@pytest.fixture
+def identity_talker(make_session: Callable[..., Session]) -> Session:
+    """Esak api fixture using an identity map."""
+    return make_session(identity_map=True)
+
+
+def test_same_instance(identity_talker: Session) -> None:
+    """Test the same entity returns the same instance across calls."""
+    character = identity_talker.character(1009220)
+    assert identity_talker.character(1009220) is character
+    assert identity_talker.comic(16926) is not identity_talker.comic(4216)
+
+
+def test_frozen(identity_talker: Session) -> None:
+    """Test mapped instances can't be modified, as every later call returns them."""
+    character = identity_talker.character(1009220)
+    with pytest.raises(ValidationError, match="frozen"):
+        character.name = "Changed"
+    assert identity_talker.character(1009220).name == "Captain America"
+
+
+def test_same_instance_in_lists(identity_talker: Session) -> None:
+    """Test entities are shared between single and list endpoints."""
+    comics = identity_talker.comics_list()
+    again = identity_talker.comics_list()
+    assert all(x is y for x, y in zip(comics, again, strict=True))
+    assert identity_talker.comics_list(fields=["id"])[0] is not comics[0]
+
+
+def test_weak_references(identity_talker: Session) -> None:
+    """Test instances are dropped once they are no longer used."""
+    identity_talker.identity_map.clear()
+    comic = identity_talker.comic(16926)
+    assert len(identity_talker.identity_map) == 1
+    del comic
+    gc.collect()
+    assert len(identity_talker.identity_map) == 0
+
+
+def test_modified_entity() -> None:
+    """Test a changed entity is validated again."""
+    identity_map = IdentityMap()
+    calls = []
+
+    def validate(data: dict) -> GenericItem:
+        calls.append(data)
+        return GenericItem.model_validate(data)
+
+    data = {"id": 1, "modified": "a", "name": "Foo", "resourceURI": "http://a.com/1"}
+    first = identity_map.resolve(GenericItem, data, validate)
+    assert identity_map.resolve(GenericItem, data, validate) is first
+    assert identity_map.resolve(GenericItem, {**data, "modified": "b"}, validate) is not first
+    assert len(calls) == 2
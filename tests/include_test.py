@@ -0,0 +1,76 @@
+"""Test Include module.
+
+This module contains tests for requesting related lists together with an entity.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+DELAY = 0.2
+
+
+class SlowCache(SqliteCache):
+    """Cache which takes a while to answer, as a stand in for a network round trip."""
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Retrieve data from the cache database after a delay."""
+        time.sleep(DELAY)
+        return super().get(key)
+
+
+def test_include(talker: Session) -> None:
+    """Test the related lists are attached to the entity."""
+    event = talker.event(336, include=["characters", "comics", "creators", "series", "stories"])
+    assert event.id == 336
+    characters = event.related("characters")
+    assert [x.id for x in characters] == [x.id for x in talker.event_characters(336)]
+    assert characters[0].name
+    assert event.related("stories")[0].id == talker.event_stories(336)[0].id
+    assert talker.event(336).related("characters") is None
+
+
+def test_include_unknown(talker: Session) -> None:
+    """Test an unknown related list raises an error before any request."""
+    with pytest.raises(ValueError, match="no related list"):
+        talker.comic(16926, include=["villains"])
+
+
+def test_include_concurrent(make_session: Callable[..., Session]) -> None:
+    """Test the entity and its related lists are requested concurrently."""
+    session = make_session(cache=SlowCache("tests/testing_mock.sqlite"))
+    start = time.perf_counter()
+    character = session.character(1009220, include=["comics", "events", "series", "stories"])
+    assert time.perf_counter() - start < DELAY * 3
+    assert len(character.related("comics")) > 0
+
+
+def test_include_variants(make_session: Callable[..., Session]) -> None:
+    """Test the related lists are attached to frozen models and returned in raw mode."""
+    frozen = make_session(frozen=True)
+    assert frozen.creator(11463, include=["comics"]).related("comics")
+    raw = make_session(raw=True)
+    result = raw.story(35505, include=["characters", "series"])
+    assert result["id"] == 35505
+    assert result["included"]["series"][0]["id"] == raw.story_series(35505)[0]["id"]
+
+
+def test_include_not_related(talker: Session) -> None:
+    """Test other endpoints of the session are not taken for related lists."""
+    with pytest.raises(ValueError, match="no related list 'list'"):
+        talker.series(466, include=["list"])
+
+
+def test_include_identity_map(make_session: Callable[..., Session]) -> None:
+    """Test included lists are attached to the instance shared through the identity map."""
+    session = make_session(identity_map=True)
+    shared = session.story(35505)
+    assert shared.related("characters") is None
+    story = session.story(35505, include=["characters"])
+    assert story is shared
+    assert story.related("characters")
@@ -4,9 +4,12 @@ This module contains tests for project init.
 """
 
 import contextlib
+import subprocess
+import sys
 
 import pytest
 
+import esak
 from esak import api
 from esak.exceptions import AuthenticationError
 from esak.session import Session
@@ -28,3 +31,23 @@ def test_api() -> None:
         m = api(public_key="Something", private_key="Else")
 
     assert m.__class__.__name__, Session.__name__
+
+
+def test_lazy_import() -> None:
+    """Test that importing esak does not import the session, requests or pydantic."""
+    code = (
+        "import sys, esak; "
+        "print(','.join(x for x in ('esak.session', 'requests', 'pydantic') if x in sys.modules))"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attributes() -> None:
+    """Test that Session and SqliteCache are still available from the package."""
+    assert esak.Session is Session
+    assert esak.SqliteCache.__name__ == "SqliteCache"
+    with pytest.raises(AttributeError):
+        _ = esak.Foo
@@ -0,0 +1,83 @@
+"""Test Interning module.
+
+This module contains tests for sharing values between models.
+"""
+
+import gc
+from collections.abc import Callable
+
+import pytest
+from pydantic import ValidationError
+
+from esak.schemas.comic import Comic
+from esak.schemas.frozen import freeze
+from esak.schemas.interning import InternPool, interned
+from esak.session import Session
+
+
+@pytest.fixture
+def intern_talker(make_session: Callable[..., Session]) -> Session:
+    """Esak api fixture sharing values between models."""
+    return make_session(intern=True)
+
+
+def test_interned_caches_model() -> None:
+    """Test that interning returns the same class each time."""
+    assert interned(Comic) is interned(Comic)
+    assert interned(interned(Comic)) is interned(Comic)
+
+
+def test_shared_items(intern_talker: Session) -> None:
+    """Test that identical generic items are shared between comics."""
+    first = intern_talker.comic(16926)
+    second = intern_talker.comic(16926)
+    assert first is not second
+    assert first.characters[0] is second.characters[0]
+    assert first.series is second.series
+    assert first.format is second.format
+    assert len(intern_talker.intern_pool) > 0
+
+    intern_talker.intern_pool.clear()
+    assert intern_talker.comic(16926).series is not first.series
+
+
+def test_shared_strings(intern_talker: Session) -> None:
+    """Test that repeated strings are shared between different comics."""
+    comics = intern_talker.comics_list()
+    formats = {id(x.format) for x in comics}
+    assert len(formats) == len({x.format for x in comics})
+
+
+def test_without_pool() -> None:
+    """Test that interned models validate normally without a pool."""
+    item = {"name": "Foo", "resourceURI": "http://gateway.marvel.com/v1/public/comics/1"}
+    model = interned(freeze(Comic)).model_fields["series"].annotation
+    assert model.model_validate(item) is not model.model_validate(item)
+    pool = InternPool()
+    context = {"intern_pool": pool}
+    assert model.model_validate(item, context=context) is model.model_validate(
+        item, context=context
+    )
+
+
+def test_session_frozen(intern_talker: Session) -> None:
+    """Test that interning sessions return frozen models, so shared items can't be modified."""
+    comic = intern_talker.comic(16926)
+    with pytest.raises(ValidationError, match="frozen"):
+        comic.series.name = "Changed"
+
+
+def test_pool_lifetime() -> None:
+    """Test that unused items are dropped and the shared strings are bounded."""
+    model = interned(freeze(Comic)).model_fields["series"].annotation
+    pool = InternPool(max_strings=2)
+    context = {"intern_pool": pool}
+    item = {"name": "Foo", "resourceURI": "http://gateway.marvel.com/v1/public/comics/1"}
+    series = model.model_validate(item, context=context)
+    assert len(pool) == 1
+    del series
+    gc.collect()
+    assert len(pool) == 0
+    for name in ("A", "B", "C"):
+        model.model_validate({**item, "name": name}, context=context)
+    assert len(pool.strings) == 2
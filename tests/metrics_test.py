@@ -0,0 +1,106 @@
+"""Test Metrics module.
+
+This module contains tests for the metrics of sessions and caches.
+"""
+
+import pytest
+import requests_mock
+
+from esak import session as session_module
+from esak.exceptions import ApiError
+from esak.metrics import MetricsRegistry
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+PAGE = {"code": 200, "data": {"total": 1, "results": [{"id": 1}]}}
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    """Empty metrics registry."""
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def session(dummy_pubkey: str, dummy_privkey: str, metrics: MetricsRegistry) -> Session:
+    """Session recording its metrics and those of an in-memory cache."""
+    cache = SqliteCache(":memory:", metrics=metrics)
+    return Session(dummy_pubkey, dummy_privkey, cache=cache, retries=2, metrics=metrics)
+
+
+def test_render() -> None:
+    """Test the Prometheus text exposition format."""
+    metrics = MetricsRegistry()
+    metrics.counter("hits_total", "Hits.", ("path",)).inc(2, path='a"b')
+    metrics.gauge("left", "Left.").set(1.5)
+    metrics.histogram("took_seconds", "Took.", buckets=(0.1, 1)).observe(0.5)
+    assert metrics.render() == (
+        "# HELP hits_total Hits.\n"
+        "# TYPE hits_total counter\n"
+        'hits_total{path="a\\"b"} 2\n'
+        "# HELP left Left.\n"
+        "# TYPE left gauge\n"
+        "left 1.5\n"
+        "# HELP took_seconds Took.\n"
+        "# TYPE took_seconds histogram\n"
+        'took_seconds_bucket{le="0.1"} 0\n'
+        'took_seconds_bucket{le="1"} 1\n'
+        'took_seconds_bucket{le="+Inf"} 1\n'
+        "took_seconds_sum 0.5\n"
+        "took_seconds_count 1\n"
+    )
+
+
+def test_registry_errors(metrics: MetricsRegistry) -> None:
+    """Test metrics reject wrong labels, decrements and conflicting kinds."""
+    counter = metrics.counter("hits_total", "Hits.", ("path",))
+    assert metrics.counter("hits_total", "Hits.", ("path",)) is counter
+    with pytest.raises(ValueError, match="expects the labels path"):
+        counter.inc()
+    with pytest.raises(ValueError, match="only increase"):
+        counter.inc(-1, path="a")
+    with pytest.raises(TypeError, match="already registered"):
+        metrics.gauge("hits_total", "Hits.")
+
+
+def test_session_metrics(session: Session, metrics: MetricsRegistry) -> None:
+    """Test requests, quota, cache lookups and validation are recorded."""
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}/1", json=PAGE, headers={"X-RateLimit-Remaining": "2999"})
+        session.fetch_page(["comics", 1])
+        session.fetch_page(["comics", 1])
+    session._validate(session_module.Comic, [])  # noqa: SLF001
+    snapshot = metrics.snapshot()
+    assert snapshot["esak_requests_total"] == [
+        {"labels": {"endpoint": "comics/{id}", "status": "200"}, "value": 1}
+    ]
+    assert snapshot["esak_request_duration_seconds"][0]["count"] == 1
+    assert snapshot["esak_quota_remaining"] == [{"labels": {}, "value": 2999.0}]
+    assert snapshot["esak_cache_requests_total"] == [
+        {"labels": {"tier": "sqlite", "result": "hit"}, "value": 1},
+        {"labels": {"tier": "sqlite", "result": "miss"}, "value": 1},
+    ]
+    durations = snapshot["esak_cache_duration_seconds"]
+    assert [x["labels"]["operation"] for x in durations] == ["get", "store"]
+    assert snapshot["esak_validation_duration_seconds"][0]["labels"] == {"model": "Comic"}
+
+
+def test_retries(
+    session: Session, metrics: MetricsRegistry, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test transient errors are retried and counted."""
+    monkeypatch.setattr(session_module, "RETRY_BACKOFF", 0)
+    with requests_mock.Mocker() as r:
+        r.get(URL, [{"status_code": 503, "json": {"code": 503}}, {"json": PAGE}])
+        assert session.fetch_page(["comics"])["results"] == [{"id": 1}]
+        r.get(URL, status_code=429, json={"code": 429, "status": "Quota exceeded"})
+        with pytest.raises(ApiError, match="Quota exceeded"):
+            session.fetch_page(["comics"], {"offset": 1})
+        assert r.call_count == 5
+    snapshot = metrics.snapshot()
+    assert snapshot["esak_retries_total"] == [{"labels": {"endpoint": "comics"}, "value": 3}]
+    assert snapshot["esak_requests_total"] == [
+        {"labels": {"endpoint": "comics", "status": "200"}, "value": 1},
+        {"labels": {"endpoint": "comics", "status": "429"}, "value": 1},
+    ]
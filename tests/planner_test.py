@@ -0,0 +1,87 @@
+"""Test Planner module.
+
+This module contains tests for batching multi-id filters.
+"""
+
+import re
+from collections import Counter
+from typing import Any
+
+import pytest
+import requests_mock
+
+from esak.exceptions import ApiError
+from esak.planner import Call, QueryPlanner
+from esak.schemas.comic import Comic
+from esak.server import load_fixtures
+from esak.session import Session
+
+URL = re.compile(r"http://gateway\.marvel\.com:80/v1/public/(?:characters/(\d+)/)?comics")
+# The comics of each character, 1 and 2 share comic 3.
+CATALOG = {1: [1, 2, 3], 2: [3, 4], 3: list(range(10, 260))}
+COMIC = load_fixtures("tests/testing_mock.sqlite")[1]["comics"][0]
+
+
+def _comics(request: Any, _context: Any) -> dict[str, Any]:  # noqa: ANN401
+    """Answer the comics of the characters of a request, a page at a time."""
+    if match := URL.match(request.url)[1]:
+        characters = [int(match)]
+    else:
+        characters = [int(x) for x in request.qs["characters"][0].split(",")]
+    ids = sorted({x for character in characters for x in CATALOG.get(character, ())})
+    offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+    results = [{**COMIC, "id": x} for x in ids[offset : offset + limit]]
+    data = {"offset": offset, "limit": limit, "total": len(ids), "results": results}
+    return {"code": 200, "data": data}
+
+
+@pytest.fixture
+def planner(dummy_pubkey: str, dummy_privkey: str) -> QueryPlanner:
+    """Planner of a session without cache."""
+    return QueryPlanner(Session(dummy_pubkey, dummy_privkey), max_ids=2)
+
+
+def test_plan(planner: QueryPlanner) -> None:
+    """Test ids are chunked on the list filter, a single id uses the related list."""
+    assert planner.plan("comics", "characters", [1, 2, 3, 1], {"orderBy": "title"}) == [
+        Call(("comics",), {"orderBy": "title", "characters": "1,2"}),
+        Call(("comics",), {"orderBy": "title", "characters": "3"}),
+    ]
+    assert planner.plan("comics", "characters", [1]) == [Call(("characters", 1, "comics"))]
+    # Creators can't be filtered by character and have no related list of characters.
+    with pytest.raises(ValueError, match="can't be requested"):
+        planner.plan("creators", "characters", [1, 2])
+    with pytest.raises(ValueError, match="characters, limit"):
+        planner.plan("comics", "characters", [1], {"limit": 5, "characters": "2"})
+
+
+def test_fetch(planner: QueryPlanner) -> None:
+    """Test chunks and their pages are merged without duplicates."""
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=_comics)
+        comics = planner.fetch("comics", "characters", [1, 2, 3])
+        calls = Counter((x.qs["characters"][0], int(x.qs["offset"][0])) for x in r.request_history)
+    assert calls == {("1,2", 0): 1, ("3", 0): 1, ("3", 100): 1, ("3", 200): 1}
+    assert all(isinstance(x, Comic) for x in comics)
+    assert [x.id for x in comics] == [1, 2, 3, 4, *range(10, 260)]
+
+
+def test_fetch_related(planner: QueryPlanner) -> None:
+    """Test a single id is requested through its related list."""
+    planner.session.raw = True
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=_comics)
+        comics = planner.fetch("comics", "characters", [2])
+        assert r.call_count == 1
+        assert r.last_request.path.endswith("/characters/2/comics")
+    assert [x["id"] for x in comics] == [3, 4]
+
+
+def test_validate(planner: QueryPlanner) -> None:
+    """Test results are validated through the session."""
+    comics = planner.session.validate("comics", [COMIC])
+    assert isinstance(comics[0], Comic)
+    with pytest.raises(ApiError):
+        planner.session.validate("comics", [{"id": "x"}])
+    with pytest.raises(ValueError, match="Unknown resource"):
+        planner.session.validate("villains", [])
@@ -0,0 +1,52 @@
+"""Test Projection module.
+
+This module contains tests for projected models.
+"""
+
+import pytest
+
+from esak.schemas.comic import Comic
+from esak.schemas.projection import project
+from esak.session import Session
+
+
+def test_project_caches_model() -> None:
+    """Test that the same fields return the same projected model."""
+    first = project(Comic, ["title", "id"])
+    second = project(Comic, ["id", "title", "id"])
+    assert first is second
+    assert list(first.model_fields) == ["id", "title"]
+
+
+def test_project_without_fields() -> None:
+    """Test that no fields returns the original model."""
+    assert project(Comic) is Comic
+    assert project(Comic, []) is Comic
+
+
+def test_project_unknown_field() -> None:
+    """Test that unknown fields are rejected."""
+    with pytest.raises(ValueError, match="foo"):
+        project(Comic, ["id", "foo"])
+
+
+def test_comics_list_fields(talker: Session) -> None:
+    """Test comics list endpoint with a projection."""
+    week = talker.comics_list(
+        {
+            "format": "comic",
+            "formatType": "comic",
+            "noVariants": True,
+            "dateDescriptor": "thisWeek",
+        },
+        fields=["id", "title", "issue_number", "modified", "dates"],
+    )
+    full = talker.comics_list(
+        {"format": "comic", "formatType": "comic", "noVariants": True, "dateDescriptor": "thisWeek"}
+    )
+    assert week[1].id == 115084
+    assert week[1].issue_number == full[1].issue_number
+    assert week[1].modified == full[1].modified
+    assert week[1].dates.on_sale == full[1].dates.on_sale
+    assert not hasattr(week[1], "characters")
+    assert set(week[1].model_dump()) == {"id", "title", "issue_number", "modified", "dates"}
@@ -0,0 +1,54 @@
+"""Test raw mode.
+
+This module contains tests for sessions returning unvalidated results.
+"""
+
+from collections.abc import Callable
+
+import pytest
+
+from esak.results import Results
+from esak.schemas.comic import Comic
+from esak.session import Session
+
+
+@pytest.fixture(scope="module")
+def raw_talker(make_session: Callable[..., Session]) -> Session:
+    """Esak api fixture returning raw results."""
+    return make_session(raw=True)
+
+
+def test_raw_comic(raw_talker: Session) -> None:
+    """Test comic endpoint in raw mode."""
+    af15 = raw_talker.comic(16926)
+    assert isinstance(af15, dict)
+    assert af15["title"] == "Amazing Fantasy (1962) #15"
+    assert af15["characters"]["available"] > 0
+
+
+def test_raw_comics_list(raw_talker: Session, talker: Session) -> None:
+    """Test comics list endpoint in raw mode matches model mode."""
+    raw = raw_talker.comics_list()
+    comics = talker.comics_list()
+    assert isinstance(raw, Results)
+    assert all(isinstance(x, dict) for x in raw)
+    assert raw.records(["id", "series.name"])[0]["series.name"] == comics[0].series.name
+    assert [x["id"] for x in raw] == [x.id for x in comics]
+
+
+def test_raw_fields(raw_talker: Session) -> None:
+    """Test raw mode only keeps the keys of the requested fields."""
+    raw = raw_talker.series_comics(24396, fields=["id", "page_count", "resource_uri"])
+    assert set(raw[0]) == {"id", "pageCount", "resourceURI"}
+    with pytest.raises(ValueError, match="no field"):
+        raw_talker.comics_list(fields=["bogus"])
+
+
+def test_raw_per_call(raw_talker: Session, talker: Session) -> None:
+    """Test stream and validate override the mode of the session."""
+    comics = list(raw_talker.stream(["series", 24396, "comics"], raw=False))
+    assert all(isinstance(x, Comic) for x in comics)
+    raw = list(talker.stream(["series", 24396, "comics"], fields=["title"], raw=True))
+    assert raw == [{"title": x.title} for x in comics]
+    results = [{"id": 1, "title": "Foo"}]
+    assert talker.validate("comics", results, ["title"], raw=True) == [{"title": "Foo"}]
@@ -0,0 +1,101 @@
+"""Test Replay module.
+
+This module contains tests for recording and replaying traffic.
+"""
+
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+from esak.replay import CacheSimulator, Recorder, TraceEntry, load_trace, replay, simulate
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+PAGE = {"code": 200, "data": {"total": 1, "results": [{"id": 1}]}}
+
+
+@pytest.fixture
+def trace(tmp_path: Path, dummy_pubkey: str, dummy_privkey: str) -> Path:
+    """Trace of two misses, a hit and a failed request."""
+    path = tmp_path / "trace.jsonl"
+    session = Session(dummy_pubkey, dummy_privkey, cache=SqliteCache(":memory:"))
+    with Recorder(path) as recorder, requests_mock.Mocker() as r:
+        recorder.observe(session.hooks)
+        r.get(URL, json=PAGE)
+        r.get(f"{URL}/2", status_code=404, json={"code": 404, "status": "Not found"})
+        session.fetch_page(["comics"], {"title": "Hulk", "limit": 1})
+        session.fetch_page(["comics"], {"limit": 1, "title": "Hulk"})
+        session.fetch_page(["comics"], {"offset": 1})
+        with pytest.raises(Exception, match="Not found"):
+            session.fetch_page(["comics", 2])
+    return path
+
+
+def test_record(trace: Path) -> None:
+    """Test the trace holds each request without credentials."""
+    entries = load_trace(trace)
+    assert [(x.endpoint, x.params, x.cache, x.status) for x in entries] == [
+        ("comics", "limit=1&title=Hulk", "miss", 200),
+        ("comics", "limit=1&title=Hulk", "hit", None),
+        ("comics", "offset=1", "miss", 200),
+        ("comics/2", "", "error", 404),
+    ]
+    assert all(x.latency >= 0 for x in entries)
+    assert entries == sorted(entries, key=lambda x: x.ts)
+    assert "apikey" not in trace.read_text()
+
+
+def test_simulate(trace: Path) -> None:
+    """Test simulated cache configurations."""
+    entries = load_trace(trace)
+    report = simulate(entries)
+    assert report["requests"] == 4
+    assert report["hits"] == 1
+    assert report["hit_ratio"] == 0.25
+    assert report["p50_ms"] <= report["p90_ms"] <= report["max_ms"]
+    assert simulate(entries, capacity=0)["hits"] == 0
+    assert simulate(entries, ttl=0)["hits"] == 0
+
+
+def test_simulator() -> None:
+    """Test the simulator evicts the least recently used responses and expires old ones."""
+    cache = CacheSimulator(capacity=2, ttl=10)
+    assert not cache.access("a", 0)
+    assert not cache.access("b", 1)
+    assert cache.access("a", 2)
+    assert not cache.access("c", 3)
+    assert len(cache) == 2
+    assert not cache.access("b", 4)
+    assert not cache.access("a", 12)
+    assert not cache.access("d", 13, store=False)
+    assert not cache.access("d", 14)
+
+
+def test_replay(trace: Path, dummy_pubkey: str, dummy_privkey: str) -> None:
+    """Test a trace is sent again with a session."""
+    session = Session(dummy_pubkey, dummy_privkey, cache=SqliteCache(":memory:"))
+    entries = load_trace(trace)
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=PAGE)
+        r.get(f"{URL}/2", status_code=404, json={"code": 404, "status": "Not found"})
+        report = replay(entries, session, speed=100)
+        assert r.call_count == 3
+    assert report["requests"] == 4
+    assert report["hits"] == 1
+    assert report["errors"] == 1
+    assert not session.hooks
+
+
+def test_load_trace(tmp_path: Path) -> None:
+    """Test traces are sorted by start."""
+    path = tmp_path / "trace.jsonl"
+    path.write_text(
+        '{"ts":2,"endpoint":"comics","params":"","cache":"hit","latency":0.1}\n\n'
+        '{"ts":1,"endpoint":"series","params":"","cache":"miss","latency":0.2,"status":200}\n'
+    )
+    assert load_trace(path) == [
+        TraceEntry(1, "series", "", "miss", 0.2, 200),
+        TraceEntry(2, "comics", "", "hit", 0.1),
+    ]
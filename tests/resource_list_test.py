@@ -0,0 +1,62 @@
+"""Test ResourceList module.
+
+This module contains tests for the counts of embedded lists and completing them.
+"""
+
+import json
+from collections.abc import Callable
+
+import pytest
+import requests_mock
+
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+
+URL = "http://gateway.marvel.com:80/v1/public/comics/4216/characters"
+
+
+def test_resource_list(talker: Session) -> None:
+    """Test the counts of the embedded lists are kept."""
+    cw1 = talker.comic(4216)
+    characters = cw1.resource_list("characters")
+    assert characters.available == 22
+    assert characters.returned == 20
+    assert characters.is_truncated
+    assert characters.missing == 2
+    assert (
+        str(characters.collection_uri)
+        == "http://gateway.marvel.com/v1/public/comics/4216/characters"
+    )
+    assert not cw1.resource_list("stories").is_truncated
+    assert cw1.resource_list("series") is None
+
+
+def test_resource_list_frozen(make_session: Callable[..., Session]) -> None:
+    """Test the counts are kept by frozen and projected models."""
+    session = make_session(frozen=True)
+    assert session.comic(4216).resource_list("characters").missing == 2
+    comics = session.comics_list(fields=["id"])
+    assert comics[0].resource_list("characters") is not None
+
+
+def test_complete(talker: Session) -> None:
+    """Test fetching only the missing items of a list."""
+    cw1 = talker.comic(4216)
+    characters = SqliteCache("tests/testing_mock.sqlite").get(
+        "http://gateway.marvel.com:80/v1/public/comics/67002/characters"
+    )
+    remainder = {**characters, "offset": 20, "count": 2, "results": characters["results"][:2]}
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}?limit=100&offset=20", text=json.dumps({"code": 200, "data": remainder}))
+        missing = cw1.complete("characters", Session("pub", "priv"))
+        assert r.call_count == 1
+    assert [x.id for x in missing] == [x["id"] for x in characters["results"][:2]]
+
+
+def test_complete_not_truncated(talker: Session) -> None:
+    """Test nothing is requested when the list is complete."""
+    with requests_mock.Mocker() as r:
+        assert talker.comic(4216).complete("stories", talker) == []
+        assert r.call_count == 0
+    with pytest.raises(ValueError, match="series"):
+        talker.comic(4216).complete("series", talker)
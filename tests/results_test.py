@@ -0,0 +1,109 @@
+"""Test Results module.
+
+This module contains tests for exporting results as records and columns.
+"""
+
+import array
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from esak import results as results_module
+from esak.results import Results
+from esak.session import Session
+
+FIELDS = ["id", "title", "page_count", "prices.print", "dates.on_sale", "series.id", "modified"]
+
+
+def test_list_endpoints_return_results(talker: Session) -> None:
+    """Test that list endpoints return Results."""
+    comics = talker.comics_list()
+    assert isinstance(comics, Results)
+    assert isinstance(comics, list)
+
+
+def test_records(talker: Session) -> None:
+    """Test exporting results as flat records."""
+    comics = talker.series_comics(24396)
+    records = comics.records(FIELDS)
+    assert len(records) == len(comics)
+    assert records[0]["id"] == comics[0].id
+    assert records[0]["series.id"] == 24396
+    assert records[0]["dates.on_sale"] == comics[0].dates.on_sale
+
+
+def test_default_fields(talker: Session) -> None:
+    """Test that only scalar attributes are exported by default."""
+    records = talker.comics_list().records()
+    assert "title" in records[0]
+    assert "thumbnail" in records[0]
+    assert "characters" not in records[0]
+
+
+def test_python_columns(talker: Session) -> None:
+    """Test exporting results as plain arrays."""
+    comics = talker.comics_list()
+    columns = comics.to_columns(FIELDS, backend="python")
+    assert isinstance(columns["id"], array.array)
+    assert list(columns["id"]) == [x.id for x in comics]
+    assert isinstance(columns["prices.print"], array.array)
+    assert columns["title"] == [x.title for x in comics]
+    assert columns["dates.on_sale"][0] == comics[0].dates.on_sale
+
+
+def test_numpy_columns(talker: Session) -> None:
+    """Test exporting results as NumPy arrays."""
+    np = pytest.importorskip("numpy")
+    comics = talker.comics_list()
+    columns = comics.to_columns(FIELDS, backend="numpy")
+    assert columns["page_count"].dtype == np.int64
+    assert columns["prices.print"].dtype == np.float64
+    assert columns["dates.on_sale"].dtype == np.dtype("datetime64[D]")
+    assert columns["modified"].dtype == np.dtype("datetime64[us]")
+    assert columns["page_count"].sum() == sum(x.page_count for x in comics)
+
+
+def test_arrow_columns(talker: Session) -> None:
+    """Test exporting results as PyArrow arrays."""
+    pa = pytest.importorskip("pyarrow")
+    comics = talker.comics_list()
+    columns = comics.to_columns(FIELDS, backend="arrow")
+    assert columns["id"].type == pa.int64()
+    assert columns["dates.on_sale"].type == pa.date32()
+    assert columns["title"].to_pylist() == [x.title for x in comics]
+
+
+@pytest.mark.parametrize(
+    ("installed", "expected"),
+    [({"numpy", "pyarrow"}, "numpy"), ({"pyarrow"}, "arrow"), (set(), "python")],
+)
+def test_auto_backend(monkeypatch: pytest.MonkeyPatch, installed: set[str], expected: str) -> None:
+    """Test the auto backend prefers NumPy, then PyArrow, then plain Python."""
+    chosen = []
+
+    def column(backend: str) -> Callable[[str, list[Any]], list[Any]]:
+        return lambda _, values: chosen.append(backend) or values
+
+    monkeypatch.setattr(results_module, "find_spec", lambda name: name in installed)
+    for backend in ("numpy", "arrow", "python"):
+        monkeypatch.setattr(results_module, f"_{backend}_column", column(backend))
+    Results([{"id": 1}]).to_columns()
+    assert chosen == [expected]
+
+
+def test_missing_values() -> None:
+    """Test that missing values are kept as gaps in the columns."""
+    results = Results(
+        [
+            {"id": 1, "price": Decimal("1.99"), "on_sale": date(2021, 1, 1)},
+            {"id": 2, "price": None, "on_sale": None},
+        ]
+    )
+    columns = results.to_columns(backend="python")
+    assert list(columns["id"]) == [1, 2]
+    assert columns["price"][0] == pytest.approx(1.99)
+    assert columns["price"][1] != columns["price"][1]
+    assert columns["on_sale"] == [date(2021, 1, 1), None]
@@ -0,0 +1,73 @@
+"""Test Search module.
+
+This module contains tests for looking up names locally.
+"""
+
+import pytest
+
+from esak.search import SearchIndex
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+from esak.store import EntityStore
+
+
+@pytest.fixture(scope="module")
+def index() -> SearchIndex:
+    """Search index fixture filled from the test cache."""
+    search_index = SearchIndex(":memory:")
+    search_index.import_cache(SqliteCache("tests/testing_mock.sqlite"))
+    return search_index
+
+
+@pytest.mark.parametrize(
+    "prefix", ["spi", "SPIDER", "Spider-", "Spider-Man (Peter", "spider-man (peter parker)"]
+)
+def test_starts_with(index: SearchIndex, prefix: str) -> None:
+    """Test prefixes match the start of the whole name, ignoring case."""
+    assert [x.id for x in index.starts_with("characters", prefix)] == [1009610]
+
+
+def test_starts_with_words(index: SearchIndex) -> None:
+    """Test a complete word doesn't match longer words."""
+    names = [x.name for x in index.starts_with("characters", "captain ")]
+    assert names == sorted(names)
+    assert all(x.startswith("Captain ") for x in names)
+    assert index.starts_with("characters", "spider man") == []
+    assert index.starts_with("characters", "man") == []
+    assert index.starts_with("characters", "(") == []
+
+
+def test_api_order(index: SearchIndex, talker: Session) -> None:
+    """Test results are ordered as the API orders them."""
+    series = talker.series_list({"title": "Ultimate Spider-Man"})
+    ids = {x.id for x in series}
+    local = [x.id for x in index.starts_with("series", "Ultimate Spider-Man") if x.id in ids]
+    assert local == [x.id for x in series]
+    newest = index.starts_with("series", "ultimate", {"orderBy": "-modified", "limit": 2})
+    assert newest[0].modified >= newest[1].modified
+
+
+def test_search(index: SearchIndex) -> None:
+    """Test words match anywhere in the name."""
+    assert [x.id for x in index.search("characters", "park spid")] == [1009610]
+    assert index.search("characters", "  ") == []
+    with pytest.raises(ValueError, match="Unknown resource"):
+        index.search("stories", "x")
+    with pytest.raises(ValueError, match="Unsupported parameter"):
+        index.search("characters", "x", {"comics": 1})
+
+
+def test_updates() -> None:
+    """Test the index follows updates and is filled from a store."""
+    store = EntityStore(":memory:")
+    store.import_cache(SqliteCache("tests/testing_mock.sqlite"))
+    search_index = SearchIndex(":memory:")
+    assert search_index.import_store(store) == len(search_index)
+    url = "http://gateway.marvel.com:80/v1/public/characters/1009220"
+    result = SqliteCache("tests/testing_mock.sqlite").get(url)["results"][0]
+    result = {**result, "name": "Old Name", "modified": "2030-01-01"}
+    search_index.upsert("characters", [result])
+    search_index.upsert("characters", [{**result, "name": "New Name", "modified": "2031-01-01"}])
+    assert search_index.starts_with("characters", "old") == []
+    assert search_index.search("characters", "new")
+    search_index.upsert("stories", [result])
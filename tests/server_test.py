@@ -0,0 +1,117 @@
+"""Test Server module.
+
+This module contains tests for the local stand-in for the Marvel API.
+"""
+
+from collections.abc import Iterator
+
+import pytest
+import requests
+
+from esak import session as session_module
+from esak.exceptions import ApiError
+from esak.export import iter_pages
+from esak.server import StandInServer
+from esak.session import Session
+
+FIXTURES = "tests/testing_mock.sqlite"
+
+
+@pytest.fixture
+def server() -> Iterator[StandInServer]:
+    """Stand-in serving the test fixtures, with 250 synthetic results per list."""
+    with StandInServer(FIXTURES, total=250, quota=10) as server:
+        yield server
+
+
+@pytest.fixture
+def session(dummy_pubkey: str, dummy_privkey: str, server: StandInServer) -> Session:
+    """Session sending its requests to the stand-in."""
+    session = Session(dummy_pubkey, dummy_privkey)
+    session.api_url = server.api_url
+    return session
+
+
+def test_recorded(session: Session) -> None:
+    """Test recorded responses are served."""
+    comic = session.comic(16926)
+    assert comic.title == "Amazing Fantasy (1962) #15"
+    results = session.series_list({"title": "Ultimate Spider-Man"})
+    assert len(results) > 0
+
+
+def test_synthetic(session: Session, server: StandInServer) -> None:
+    """Test unrecorded lists and entities are served with synthetic results."""
+    pages = list(iter_pages(session, ["comics"], page_size=100))
+    assert [len(x) for x in pages] == [100, 100, 50]
+    assert [x["id"] for page in pages for x in page] == list(range(1, 251))
+    assert session.comic(42).id == 42
+    assert len(session.series_characters(7)) == 20
+    assert server.requests["comics?limit=100&offset=200"] == 1
+    with pytest.raises(ApiError, match="couldn't find") as err:
+        session.comic(251)
+    assert err.value.status == 404
+
+
+def test_etag(dummy_pubkey: str, server: StandInServer) -> None:
+    """Test responses carry an etag and are not sent again when it matches."""
+    url = server.api_url.format("comics/16926")
+    response = requests.get(url, params={"apikey": dummy_pubkey}, timeout=5)
+    assert response.headers["ETag"] == f'"{response.json()["etag"]}"'
+    response = requests.get(
+        url,
+        params={"apikey": dummy_pubkey},
+        headers={"If-None-Match": response.headers["ETag"]},
+        timeout=5,
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_errors(session: Session, server: StandInServer) -> None:
+    """Test the parameters and the quota are enforced."""
+    with pytest.raises(ApiError, match="more than 100"):
+        session.comics_list({"limit": 101})
+    response = requests.get(server.api_url.format("comics"), timeout=5)
+    assert response.status_code == 409
+    assert response.json()["code"] == "MissingParameter"
+    assert response.headers["X-RateLimit-Remaining"] == "8"
+    for params in ({"limit": "abc"}, {"limit": "0"}, {"offset": "-1"}):
+        response = requests.get(
+            server.api_url.format("comics"), params={"apikey": "pub", **params}, timeout=5
+        )
+        assert response.status_code == 409
+        assert response.json()["code"] == 409
+        assert "integer" in response.json()["status"]
+    server.quota = 2
+    with pytest.raises(ApiError, match="rate limit") as err:
+        session.comics_list()
+    assert err.value.status == 429
+    assert server.quota_remaining() == 0
+
+
+def test_faults(session: Session, server: StandInServer, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test injected faults."""
+    monkeypatch.setattr(session_module, "RETRY_BACKOFF", 0)
+    session.retries = 2
+    server.inject("unavailable")
+    server.inject("error")
+    assert session.comic(16926).id == 16926
+    assert server.requests["comics/16926"] == 3
+    server.inject("disconnect")
+    session.retries = 0
+    with pytest.raises(requests.ConnectionError):
+        session.comic(16926)
+    server.inject("malformed")
+    with pytest.raises(requests.JSONDecodeError):
+        session.comic(16926)
+    with pytest.raises(ValueError, match="Unknown fault"):
+        server.inject("fire")
+
+
+def test_latency() -> None:
+    """Test latency with jitter is reproducible and stays within its bounds."""
+    with StandInServer(records={"comics": []}, latency=0.01, jitter=0.005, seed=1) as server:
+        response = requests.get(server.api_url.format("comics"), params={"apikey": "a"}, timeout=5)
+    assert response.status_code == 404
+    assert 0.005 <= response.elapsed.total_seconds() < 1
@@ -0,0 +1,108 @@
+"""Test Store module.
+
+This module contains tests for querying mirrored entities locally.
+"""
+
+from typing import Any
+
+import pytest
+
+from esak import store as store_module
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+from esak.store import EntityStore
+
+
+@pytest.fixture(scope="module")
+def store() -> EntityStore:
+    """Store fixture filled from the test cache."""
+    entity_store = EntityStore(":memory:")
+    entity_store.import_cache(SqliteCache("tests/testing_mock.sqlite"))
+    return entity_store
+
+
+def test_entity(store: EntityStore, talker: Session) -> None:
+    """Test a stored entity is the same as the one from the session."""
+    assert store.comic(16926) == talker.comic(16926)
+    assert store.series(466).title == "Ultimate Spider-Man (2000 - 2009)"
+    assert store.creator(1) is None
+
+
+def test_relations(store: EntityStore, talker: Session) -> None:
+    """Test related lists match the ones from the session."""
+    assert [x.id for x in store.series_comics(24396)] == sorted(
+        x.id for x in talker.series_comics(24396)
+    )
+    character_comics = {x.id for x in store.character_comics(1009220, {"limit": 100})}
+    assert {x.id for x in talker.character_comics(1009220)} <= character_comics
+    assert {x.id for x in talker.event_comics(336)} <= {
+        x.id for x in store.event_comics(336, {"limit": 100})
+    }
+    assert store.comic_characters(16926, {"nameStartsWith": "spider"})[0].id == 1009610
+
+
+def test_filters(store: EntityStore) -> None:
+    """Test filters, ordering and paging."""
+    spider = store.characters_list({"nameStartsWith": "Spider"})
+    assert [x.name for x in spider] == ["Spider-Man (Peter Parker)"]
+    comics = store.comics_list({"dateRange": "1962-01-01,1962-12-31"})
+    assert [x.id for x in comics] == [16926]
+    newest = store.comics_list({"orderBy": "-modified", "limit": 5})
+    assert len(newest) == 5
+    assert [x.modified for x in newest] == sorted((x.modified for x in newest), reverse=True)
+    assert store.comics_list({"orderBy": "-modified", "limit": 2, "offset": 3}) == newest[3:]
+    assert all(x.series.id == 466 for x in store.comics_list({"series": 466}))
+
+
+def test_unsupported(store: EntityStore) -> None:
+    """Test parameters the store can't answer raise an error."""
+    with pytest.raises(ValueError, match="Unsupported parameter"):
+        store.comics_list({"sharedAppearances": "1,2"})
+    with pytest.raises(ValueError, match="Unsupported orderBy"):
+        store.characters_list({"orderBy": "title"})
+
+
+def test_upsert_keeps_newest() -> None:
+    """Test an older copy of an entity doesn't replace a newer one."""
+    entity_store = EntityStore(":memory:")
+    cache = SqliteCache("tests/testing_mock.sqlite")
+    result = cache.get("http://gateway.marvel.com:80/v1/public/characters/1009220")["results"][0]
+    entity_store.upsert("characters", [result])
+    entity_store.upsert("characters", [{**result, "name": "Old", "modified": "2001-01-01"}])
+    assert entity_store.character(1009220).name == "Captain America"
+    entity_store.upsert("characters", [{**result, "name": "New", "modified": "2030-01-01"}])
+    assert entity_store.character(1009220).name == "New"
+
+
+def test_upsert_keeps_newest_links() -> None:
+    """Test an older copy of a comic doesn't replace the links of a newer one."""
+    entity_store = EntityStore(":memory:")
+    cache = SqliteCache("tests/testing_mock.sqlite")
+    result = cache.get("http://gateway.marvel.com:80/v1/public/comics/16926")["results"][0]
+    character = cache.get("http://gateway.marvel.com:80/v1/public/characters/1009220")["results"][0]
+    entity_store.upsert("characters", [{**character, "id": x} for x in (1, 2, 3)])
+
+    def copy(modified: str, *ids: int) -> dict[str, Any]:
+        items = [{"resourceURI": f"http://x/characters/{x}", "name": str(x)} for x in ids]
+        characters = {"available": len(ids), "returned": len(ids), "items": items}
+        return {**result, "modified": modified, "characters": characters}
+
+    entity_store.upsert("comics", [copy("2030-01-01", 1, 2)])
+    entity_store.upsert("comics", [copy("2001-01-01", 3)])
+    assert [x.id for x in entity_store.comic_characters(16926)] == [1, 2]
+
+
+def test_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test entities are read a batch at a time in order of id."""
+    monkeypatch.setattr(store_module, "BATCH_SIZE", 2)
+    entity_store = EntityStore(":memory:")
+    cache = SqliteCache("tests/testing_mock.sqlite")
+    character = cache.get("http://gateway.marvel.com:80/v1/public/characters/1009220")["results"][0]
+    entity_store.upsert("characters", [{**character, "id": x} for x in (3, 1, 2)])
+    assert [[x["id"] for x in batch] for batch in entity_store.batches("characters")] == [
+        [1, 2],
+        [3],
+    ]
+    assert list(entity_store.batches("comics")) == []
+    with pytest.raises(ValueError, match="Unknown resource"):
+        next(entity_store.batches("heroes"))
@@ -0,0 +1,135 @@
+"""Test Streaming module.
+
+This module contains tests for streaming results from responses.
+"""
+
+import json
+from typing import Any
+
+import pytest
+import requests_mock
+
+from esak import session as session_module, streaming
+from esak.exceptions import ApiError
+from esak.schemas import origin_model
+from esak.schemas.comic import Comic
+from esak.session import Session
+from esak.sqlite_cache import SqliteCache
+from esak.streaming import iter_results
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+@pytest.fixture(scope="module")
+def page() -> dict:
+    """Comics list page from the test cache wrapped in a response envelope."""
+    data = SqliteCache("tests/testing_mock.sqlite").get(URL)
+    return {"code": 200, "status": "Ok", "etag": "abc", "data": data}
+
+
+def chunked(body: str, size: int) -> list[bytes]:
+    """Split a body into byte chunks of `size`."""
+    raw = body.encode("utf-8")
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+@pytest.mark.parametrize("size", [7, 4096, 1 << 20])
+def test_iter_results(page: dict, size: int) -> None:
+    """Test results are the same however the body is split."""
+    meta = {}
+    body = json.dumps(page, ensure_ascii=False, indent=1)
+    results = list(iter_results(chunked(body, size), meta))
+    assert results == page["data"]["results"]
+    assert meta["etag"] == "abc"
+    assert meta["total"] == page["data"]["total"]
+
+
+def test_iter_results_empty() -> None:
+    """Test an empty results list and a number split over chunks."""
+    meta = {}
+    assert list(iter_results([b'{"code": 2', b'00, "data": {"results": []}}'], meta)) == []
+    assert meta["code"] == 200
+
+
+def test_iter_results_large(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a result spanning many chunks is not decoded again for each chunk."""
+    calls = []
+    decode = streaming._DECODER.raw_decode  # noqa: SLF001
+
+    def raw_decode(text: str, pos: int) -> tuple[Any, int]:
+        calls.append(pos)
+        return decode(text, pos)
+
+    monkeypatch.setattr(streaming._DECODER, "raw_decode", raw_decode)  # noqa: SLF001
+    result = {"id": 1, "description": "x" * 100_000}
+    body = json.dumps({"data": {"results": [result]}})
+    assert list(iter_results(chunked(body, 64))) == [result]
+    assert len(calls) < 40
+
+
+def test_iter_results_invalid() -> None:
+    """Test a truncated body is rejected."""
+    with pytest.raises(ValueError, match="JSON"):
+        list(iter_results([b'{"data": {"results": [{"id": 1}, ']))
+
+
+def test_stream(page: dict) -> None:
+    """Test streaming comics from a response."""
+    session = Session("pub", "priv", cache=SqliteCache(":memory:"))
+    with requests_mock.Mocker() as r:
+        r.get(f"{URL}?limit=20", text=json.dumps(page))
+        comics = session.stream(["comics"], {"limit": 20}, fields=["id", "title"])
+        first = next(comics)
+        assert origin_model(type(first)) is Comic
+        assert first.id == page["data"]["results"][0]["id"]
+        assert len(list(comics)) == len(page["data"]["results"]) - 1
+    assert session.cache.get(f"{URL}?limit=20") is None
+
+
+def test_stream_cached(talker: Session) -> None:
+    """Test streaming comics from the cache."""
+    assert [x.id for x in talker.stream(["series", 24396, "comics"])] == [
+        x.id for x in talker.series_comics(24396)
+    ]
+
+
+def test_stream_error() -> None:
+    """Test an error response is raised."""
+    session = Session("pub", "priv")
+    with requests_mock.Mocker() as r:
+        r.get(URL, status_code=401, text='{"code": "InvalidCredentials", "message": "Nope"}')
+        with pytest.raises(ApiError, match="Nope") as err:
+            list(session.stream(["comics"]))
+        assert err.value.status == 401
+        r.get(URL, text='{"code": 409, "status": "Limit greater than 100."}')
+        with pytest.raises(ApiError, match="Limit") as err:
+            list(session.stream(["comics"]))
+        assert err.value.status == 409
+
+
+def test_stream_non_json_error() -> None:
+    """Test an error response without a JSON body is raised as an ApiError."""
+    session = Session("pub", "priv")
+    with requests_mock.Mocker() as r:
+        r.get(URL, status_code=502, text="<html>Bad Gateway</html>")
+        with pytest.raises(ApiError, match="Unexpected status code: 502") as err:
+            list(session.stream(["comics"]))
+        assert err.value.status == 502
+
+
+def test_stream_retries_and_hooks(page: dict, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test streamed requests are retried and reported to the hooks like other requests."""
+    monkeypatch.setattr(session_module, "RETRY_BACKOFF", 0)
+    session = Session("pub", "priv", retries=1)
+    events = []
+    for name in ("on_retry", "on_response"):
+        session.hooks.register(name, events.append)
+    with requests_mock.Mocker() as r:
+        r.get(URL, [{"status_code": 503, "text": "busy"}, {"text": json.dumps(page)}])
+        comics = list(session.stream(["comics"]))
+        assert r.call_count == 2
+    assert len(comics) == len(page["data"]["results"])
+    assert [x.name for x in events] == ["on_retry", "on_response"]
+    assert events[1].count == len(comics)
+    assert events[1].status == 200
+    assert events[1].size > 0
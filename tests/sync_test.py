@@ -0,0 +1,120 @@
+"""Test Sync module.
+
+This module contains tests for mirroring the catalog incrementally.
+"""
+
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests_mock
+
+from esak.exceptions import ApiError
+from esak.session import Session
+from esak.sync import Checkpoint, Sync, SyncState
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+class MemoryStore:
+    """Store keeping the upserted results in a dict."""
+
+    def __init__(self) -> None:
+        self.entities: dict[int, dict[str, Any]] = {}
+        self.upserts = 0
+
+    def upsert(self, resource: str, results: list[dict[str, Any]]) -> None:  # noqa: ARG002
+        """Insert or replace entities."""
+        self.upserts += len(results)
+        self.entities.update((x["id"], x) for x in results)
+
+
+class Catalog:
+    """Stand in for the comics list endpoint, filtering on modifiedSince."""
+
+    def __init__(self, size: int) -> None:
+        self.comics = {x: {"id": x, "modified": _timestamp(x // 3)} for x in range(size)}
+        self.fail_at: int | None = None
+        self.calls = 0
+
+    def __call__(self, request: Any, context: Any) -> dict[str, Any]:  # noqa: ANN401, ARG002
+        """Answer a request for a page."""
+        self.calls += 1
+        if self.calls == self.fail_at:
+            return {"code": 500, "status": "Internal error"}
+        params = {k: v[0] for k, v in parse_qs(urlparse(request.url).query).items()}
+        assert params["orderBy"] == "modified"
+        since = params.get("modifiedSince", "")
+        matches = sorted(
+            (x for x in self.comics.values() if x["modified"] >= since),
+            key=lambda x: (x["modified"], x["id"]),
+        )
+        offset, limit = int(params["offset"]), int(params["limit"])
+        page = matches[offset : offset + limit]
+        return {"code": 200, "data": {"offset": offset, "total": len(matches), "results": page}}
+
+    def touch(self, *ids: int) -> None:
+        """Mark comics as modified now."""
+        for x in ids:
+            self.comics[x]["modified"] = _timestamp(1000 + x)
+
+
+def _timestamp(seconds: int) -> str:
+    return f"2020-01-01T{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}-0500"
+
+
+@pytest.fixture
+def catalog() -> Catalog:
+    """Catalog fixture."""
+    return Catalog(95)
+
+
+@pytest.fixture
+def sync(dummy_pubkey: str, dummy_privkey: str) -> Sync:
+    """Sync fixture without a cache."""
+    return Sync(Session(dummy_pubkey, dummy_privkey), MemoryStore(), SyncState(":memory:"), 10)
+
+
+def test_sync_incremental(sync: Sync, catalog: Catalog) -> None:
+    """Test only the changed entities are requested after the first sync."""
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=catalog)
+        assert sync.sync("comics") >= 95
+        assert len(sync.store.entities) == 95
+        checkpoint = sync.state.get("comics")
+        assert checkpoint == Checkpoint(_timestamp(94 // 3))
+
+        calls = catalog.calls
+        # Only the entities modified at the watermark are requested again.
+        assert sync.run(["comics"]) == {"comics": 2}
+        assert catalog.calls == calls + 1
+
+        catalog.touch(3, 50, 7)
+        sync.store.upserts = 0
+        sync.sync("comics")
+        assert sync.store.upserts == 5
+        assert sync.store.entities[50]["modified"] == _timestamp(1050)
+
+
+def test_sync_resume(sync: Sync, catalog: Catalog) -> None:
+    """Test an interrupted sync resumes from the last stored page."""
+    catalog.fail_at = 4
+    with requests_mock.Mocker() as r:
+        r.get(URL, json=catalog)
+        with pytest.raises(ApiError):
+            sync.sync("comics")
+        checkpoint = sync.state.get("comics")
+        assert checkpoint.running
+        assert len(sync.store.entities) == 30
+        upserts = sync.store.upserts
+
+        sync.sync("comics")
+        assert len(sync.store.entities) == 95
+        assert sync.store.upserts - upserts < 95
+        assert not sync.state.get("comics").running
+
+
+def test_sync_unknown(sync: Sync) -> None:
+    """Test an unknown resource raises an error."""
+    with pytest.raises(ValueError, match="Unknown resource"):
+        sync.sync("villains")
@@ -0,0 +1,112 @@
+"""Test Tracing module.
+
+This module contains tests for the tracing spans of sessions.
+"""
+
+import sys
+from collections.abc import Callable
+
+import pytest
+import requests_mock
+
+from esak import session as session_module
+from esak.exceptions import ApiError
+from esak.session import Session
+from esak.tracing import InMemoryExporter, Tracer, cache_key_hash
+
+URL = "http://gateway.marvel.com:80/v1/public/comics"
+
+
+@pytest.fixture
+def exporter() -> InMemoryExporter:
+    """Exporter collecting the finished spans."""
+    return InMemoryExporter()
+
+
+@pytest.fixture
+def session(make_session: Callable[..., Session], exporter: InMemoryExporter) -> Session:
+    """Session reading the test fixtures and recording its spans."""
+    return make_session(tracer=Tracer(exporter=exporter))
+
+
+def test_cached_call(session: Session, exporter: InMemoryExporter) -> None:
+    """Test an endpoint call opens child spans for the page, the cache and the validation."""
+    session.comic(16926)
+    spans = {x.name: x for x in exporter.get_finished_spans()}
+    assert list(spans) == ["esak.cache", "esak.fetch_page", "esak.validate", "esak.comic"]
+    root = spans["esak.comic"]
+    assert root.parent is None
+    assert spans["esak.fetch_page"].parent is root
+    assert spans["esak.validate"].parent is root
+    assert spans["esak.cache"].parent is spans["esak.fetch_page"]
+    assert spans["esak.cache"].attributes == {"esak.cache.hit": True}
+    assert spans["esak.fetch_page"].attributes == {
+        "esak.endpoint": "comics/16926",
+        "esak.cache_key_hash": cache_key_hash(f"{URL}/16926"),
+        "esak.result_count": 1,
+    }
+    assert spans["esak.validate"].attributes == {"esak.model": "Comic", "esak.result_count": 1}
+    assert all(x.end_time >= x.start_time for x in spans.values())
+
+
+def test_http_retries(
+    dummy_pubkey: str,
+    dummy_privkey: str,
+    exporter: InMemoryExporter,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the request span records the status and each retried attempt."""
+    monkeypatch.setattr(session_module, "RETRY_BACKOFF", 0)
+    session = Session(dummy_pubkey, dummy_privkey, retries=1, tracer=Tracer(exporter=exporter))
+    with requests_mock.Mocker() as r:
+        r.get(
+            URL,
+            [
+                {"status_code": 503, "json": {"code": 503}},
+                {"json": {"code": 200, "data": {"results": [{"id": 1}]}}},
+            ],
+        )
+        session.fetch_page(["comics"])
+    http, page = exporter.get_finished_spans()
+    assert http.name == "esak.http"
+    assert http.parent is page
+    assert http.attributes["http.response.status_code"] == 200
+    assert http.attributes["esak.retry.attempts"] == 1
+    assert http.events == [("retry", {"esak.retry.attempt": 1, "esak.retry.reason": "503"})]
+    assert page.attributes["http.response.status_code"] == 200
+
+
+def test_error(dummy_pubkey: str, dummy_privkey: str, exporter: InMemoryExporter) -> None:
+    """Test an error sets the status of the spans it escapes."""
+    session = Session(dummy_pubkey, dummy_privkey, tracer=Tracer(exporter=exporter))
+    with requests_mock.Mocker() as r:
+        r.get(URL, status_code=409, json={"code": 409, "status": "Limit greater than 100."})
+        with pytest.raises(ApiError):
+            session.comics_list({"limit": 101})
+    http, page, root = exporter.get_finished_spans()
+    assert http.status == "UNSET"
+    assert page.status == root.status == "ERROR"
+    assert root.events[0][1]["exception.type"] == "ApiError"
+
+
+def test_disabled(dummy_pubkey: str, dummy_privkey: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test tracing does nothing when OpenTelemetry is not installed."""
+    monkeypatch.setitem(sys.modules, "opentelemetry", None)
+    tracer = Tracer()
+    assert not tracer.enabled
+    with tracer.span("esak.test") as span:
+        span.set_attribute("key", "value")
+        assert not span.is_recording()
+    session = Session(dummy_pubkey, dummy_privkey, tracer=tracer)
+    assert session.tracer is None
+
+
+def test_stream(session: Session, exporter: InMemoryExporter) -> None:
+    """Test a stream opens a span around the whole iteration."""
+    comics = list(session.stream(["series", 24396, "comics"]))
+    spans = exporter.get_finished_spans()
+    root = spans[-1]
+    assert root.name == "esak.stream"
+    assert root.parent is None
+    assert {x.parent for x in spans[:-1]} == {root}
+    assert len([x for x in spans if x.name == "esak.validate"]) == len(comics)